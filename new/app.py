@@ -2,87 +2,59 @@
 Hlavní Streamlit aplikace pro Platónská tělesa
 Main Streamlit application for Platonic Solids tutorial
 """
+import uuid
 import streamlit as st
 import plotly.graph_objects as go
+from views.figure_cache import get_figure_cache, make_key
+from views.payload import configure_json_engine, payload_size
+from views.perf_inspector import get_recorder, render_panel, trace_counts
+from views.prefetch import get_prefetcher
+from views.step_figures import chart_config, get_step_figure
 
 # Konfigurace musí být první Streamlit příkaz
-from config.settings import PAGE_CONFIG, LAYOUT
+from config.settings import PAGE_CONFIG, LAYOUT, DISPLAY_DEFAULTS, PREFETCH
 st.set_page_config(**PAGE_CONFIG)
+configure_json_engine()
 
 # Import kroků
-from steps.step_registry import get_registry
-from steps.definitions.intro import IntroStep
-from steps.definitions.tetrahedron import (
-    TetraStep1_Cube,
-    TetraStep2_Selection,
-    TetraStep3_Complete
-)
-from steps.definitions.octahedron import (
-    OctaStep1_Axes,
-    OctaStep2_Complete
-)
-from steps.definitions.icosahedron import (
-    IcosaStep1_Rectangle,
-    IcosaStep2_ThreeRectangles,
-    IcosaStep3_Complete
-)
-from steps.definitions.dodecahedron import (
-    DodecaStep1_Cube,
-    DodecaStep2_GoldenRectangles,
-    DodecaStep3_Complete
-)
-from steps.definitions.duality_cube_octahedron import DualityCubeOctahedron
-from steps.definitions.duality_nested_octahedra import DualityNestedOctahedra
-from steps.definitions.duality_icosahedron_dodecahedron import DualityIcosahedronDodecahedron
-from steps.definitions.duality_tetrahedron_self import DualityTetrahedronSelf
-from steps.definitions.bonus import BonusStep_TriangleCenter
-from steps.definitions.bonus_why_five import BonusStep_WhyOnlyFive
-from steps.definitions.bonus_why_five_18a import BonusStep_WhyFive_18A
-from steps.definitions.bonus_why_five_18b import BonusStep_WhyFive_18B
-from steps.definitions.bonus_why_five_18c import BonusStep_WhyFive_18C
-from steps.definitions.bonus_why_five_18d import BonusStep_WhyFive_18D
+from steps.step_registry import get_registry, set_registry
+from steps import catalog
 
 
-def register_all_steps():
-    """Zaregistruje všechny kroky do registry"""
-    registry = get_registry()
-    registry.clear()  # Vyčisti registry (důležité pro reload)
-
-    # Úvod
-    registry.register(IntroStep())
+@st.cache_resource(show_spinner=False)
+def load_registry(source_fingerprint: str):
+    """
+    Sestaví registry kroků jednou na proces (sdílí ji všechny sessions)
 
-    # Čtyřstěn (Tetrahedron)
-    registry.register(TetraStep1_Cube())
-    registry.register(TetraStep2_Selection())
-    registry.register(TetraStep3_Complete())
+    Konstruktory kroků dělají skutečný výpočet geometrie (hledání
+    pětiúhelníků, duality), proto se nesmí opakovat při každém rerunu.
+    Registry drží jen metadata; instance kroku vznikne při jeho prvním
+    zobrazení a zůstane v registry pro všechny sessions. Nové sestavení
+    proběhne jen při změně zdrojáků (vývoj) - do nové registry, která
+    se do globální přepne až hotová.
 
-    # Osmistěn (Octahedron)
-    registry.register(OctaStep1_Axes())
-    registry.register(OctaStep2_Complete())
+    Args:
+        source_fingerprint: Otisk zdrojáků kroků (klíč cache)
 
-    # Dvacetistěn (Icosahedron)
-    registry.register(IcosaStep1_Rectangle())
-    registry.register(IcosaStep2_ThreeRectangles())
-    registry.register(IcosaStep3_Complete())
+    Returns:
+        Zmrazená StepRegistry
+    """
+    registry = catalog.register_all_steps()
+    registry.freeze()
+    set_registry(registry)
 
-    # Dvanáctistěn (Dodecahedron)
-    registry.register(DodecaStep1_Cube())
-    registry.register(DodecaStep2_GoldenRectangles())
-    registry.register(DodecaStep3_Complete())
+    # Figury v cache patří ke starým verzím kroků
+    get_prefetcher().clear()
+    get_figure_cache().clear()
+    return registry
 
-    # Dualita (Duality)
-    registry.register(DualityCubeOctahedron())
-    registry.register(DualityNestedOctahedra())
-    registry.register(DualityIcosahedronDodecahedron())
-    registry.register(DualityTetrahedronSelf())
 
-    # Bonus
-    registry.register(BonusStep_TriangleCenter())
-    registry.register(BonusStep_WhyOnlyFive())
-    registry.register(BonusStep_WhyFive_18A())
-    registry.register(BonusStep_WhyFive_18B())
-    registry.register(BonusStep_WhyFive_18C())
-    registry.register(BonusStep_WhyFive_18D())
+def register_all_steps():
+    """Zajistí zaregistrování všech kroků (hotový snapshot z cache)"""
+    registry = load_registry(catalog.source_fingerprint())
+    if get_registry() is not registry:
+        set_registry(registry)
+    return registry
 
 
 def initialize_session_state():
@@ -90,26 +62,29 @@ def initialize_session_state():
     if 'current_step' not in st.session_state:
         st.session_state.current_step = 0
 
-    # Nastavení pro vykreslování stěn
-    if 'show_faces' not in st.session_state:
-        st.session_state.show_faces = True
-
-    if 'face_opacity' not in st.session_state:
-        st.session_state.face_opacity = 0.5
+    # Identifikátor session pro frontu přednačítání (rušení úloh při skoku)
+    if 'session_token' not in st.session_state:
+        st.session_state.session_token = uuid.uuid4().hex
 
-    if 'face_color' not in st.session_state:
-        st.session_state.face_color = '#00CED1'  # DarkTurquoise (výrazná azurová)
+    # Nastavení pro vykreslování stěn, hran a vrcholů
+    for key, value in DISPLAY_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
 
-    # Nastavení pro hrany a vrcholy
-    if 'edge_width' not in st.session_state:
-        st.session_state.edge_width = 3
 
-    if 'vertex_size' not in st.session_state:
-        st.session_state.vertex_size = 12
+def go_to_step(step_number: int):
+    """Callback tlačítek navigace - přepne aktuální krok"""
+    st.session_state.current_step = step_number
 
 
 def render_sidebar():
-    """Vykreslí sidebar s navigací"""
+    """
+    Vykreslí sidebar s navigací
+
+    Returns:
+        Kontejner v sidebaru pro nastavení zobrazení (plní ho fragment
+        render_diagram_panel, aby změna nastavení nespouštěla celou aplikaci)
+    """
     st.sidebar.title("📐 Navigace")
     st.sidebar.markdown("---")
 
@@ -122,21 +97,41 @@ def render_sidebar():
 
         for step_num, step_name in steps:
             # Tlačítko pro každý krok
-            if st.sidebar.button(
+            st.sidebar.button(
                 f"{step_num}. {step_name}",
                 key=f"step_{step_num}",
-                width='stretch'
-            ):
-                st.session_state.current_step = step_num
+                width='stretch',
+                on_click=go_to_step,
+                args=(step_num,)
+            )
 
         st.sidebar.markdown("")  # Mezera mezi kategoriemi
 
-    # Nastavení vykreslování stěn
+    # Nastavení vykreslování stěn (widgety doplní fragment diagramu)
+    settings_box = st.sidebar.container()
+    settings_box.markdown("---")
+    settings_box.subheader("🎨 Nastavení zobrazení")
+
+    # Informace na konci sidebaru
     st.sidebar.markdown("---")
-    st.sidebar.subheader("🎨 Nastavení zobrazení")
+    st.sidebar.markdown("""
+    ### 💡 Tip:
+    Můžeš otáčet 3D diagramem myší!
 
+    ### 📚 O aplikaci:
+    Interaktivní tutoriál pro
+    konstrukci Platónských těles.
+
+    **Verze:** 2.0.0
+    """)
+
+    return settings_box
+
+
+def render_display_settings():
+    """Vykreslí ovládání stěn, hran a vrcholů (volá se uvnitř fragmentu)"""
     # Checkbox pro zobrazení stěn
-    st.session_state.show_faces = st.sidebar.checkbox(
+    st.session_state.show_faces = st.checkbox(
         "Zobrazit stěny těles",
         value=st.session_state.show_faces,
         help="Zapne/vypne vykreslování stěn 3D těles"
@@ -144,13 +139,13 @@ def render_sidebar():
 
     # Nastavení barvy a průhlednosti (pouze pokud jsou stěny zapnuté)
     if st.session_state.show_faces:
-        st.session_state.face_color = st.sidebar.color_picker(
+        st.session_state.face_color = st.color_picker(
             "Barva stěn",
             value=st.session_state.face_color,
             help="Vyber barvu pro stěny těles"
         )
 
-        st.session_state.face_opacity = st.sidebar.slider(
+        st.session_state.face_opacity = st.slider(
             "Průhlednost stěn",
             min_value=0.0,
             max_value=1.0,
@@ -160,9 +155,9 @@ def render_sidebar():
         )
 
     # Nastavení hran a vrcholů
-    st.sidebar.markdown("### ⚙️ Hrany a vrcholy")
+    st.markdown("### ⚙️ Hrany a vrcholy")
 
-    st.session_state.edge_width = st.sidebar.slider(
+    st.session_state.edge_width = st.slider(
         "Tloušťka hran",
         min_value=1,
         max_value=8,
@@ -171,7 +166,7 @@ def render_sidebar():
         help="Tloušťka čar pro hrany těles"
     )
 
-    st.session_state.vertex_size = st.sidebar.slider(
+    st.session_state.vertex_size = st.slider(
         "Velikost vrcholů",
         min_value=5,
         max_value=25,
@@ -180,19 +175,6 @@ def render_sidebar():
         help="Velikost bodů reprezentujících vrcholy"
     )
 
-    # Informace na konci sidebaru
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("""
-    ### 💡 Tip:
-    Můžeš otáčet 3D diagramem myší!
-
-    ### 📚 O aplikaci:
-    Interaktivní tutoriál pro
-    konstrukci Platónských těles.
-
-    **Verze:** 2.0.0
-    """)
-
 
 def render_step_navigation(position="top"):
     """Vykreslí navigační tlačítka mezi kroky
@@ -208,11 +190,11 @@ def render_step_navigation(position="top"):
 
     with col1:
         if current > 0:
-            if st.button("⬅️ Předchozí",
-                        key=f"prev_{position}",
-                        width='stretch'):
-                st.session_state.current_step -= 1
-                st.rerun()
+            st.button("⬅️ Předchozí",
+                      key=f"prev_{position}",
+                      width='stretch',
+                      on_click=go_to_step,
+                      args=(current - 1,))
 
     with col2:
         st.markdown(
@@ -222,32 +204,104 @@ def render_step_navigation(position="top"):
 
     with col3:
         if current < total - 1:
-            if st.button("Další ➡️",
-                        key=f"next_{position}",
-                        width='stretch'):
-                st.session_state.current_step += 1
-                st.rerun()
+            st.button("Další ➡️",
+                      key=f"next_{position}",
+                      width='stretch',
+                      on_click=go_to_step,
+                      args=(current + 1,))
 
 
 def create_plotly_figure(step):
     """
     Vytvoří interaktivní Plotly 3D figure pro daný krok
 
+    Hotové figury se drží v LRU cache sdílené všemi sessions, klíčem je
+    číslo kroku a nastavení zobrazení ze sidebaru (viz views/step_figures.py).
+
     Args:
         step: Instance kroku
 
     Returns:
-        Plotly Figure s interaktivní 3D vizualizací
+        Dict figury s kompaktními typed arrays pro st.plotly_chart
+        (sdílený z cache - neměnit)
     """
-    # Nech krok vykreslit Plotly diagram
-    fig = step.render_plotly_diagram()
-    return fig
+    return get_step_figure(step, step.get_display_settings())
 
 
-def render_main_content():
-    """Vykreslí hlavní obsah - diagram + popis"""
+@st.fragment
+def render_diagram_panel(step, settings_box, perf_box=None):
+    """
+    Fragment s diagramem a ovládáním zobrazení
+
+    Změna nastavení v sidebaru spustí znovu jen tento fragment (ovládání
+    + diagram), ne celou aplikaci.
+
+    Args:
+        step: Instance zobrazeného kroku
+        settings_box: Kontejner v sidebaru pro ovládání (z render_sidebar)
+        perf_box: Kontejner v sidebaru pro inspektor výkonu (None = vypnutý)
+    """
+    recorder = get_recorder()
+    with recorder.run('fragment diagramu'):
+        with settings_box:
+            render_display_settings()
+
+        st.markdown("### 🔷 Interaktivní 3D Diagram")
+        st.info("💡 **Tip:** Použij myš k otáčení diagramu! Scroll kolečkem přiblíží/oddálí.")
+
+        display = step.get_display_settings()
+
+        # Přechod na jiný krok - byla jeho figura přednačtená? (hit rate)
+        if st.session_state.get('shown_step') != step.metadata.number:
+            st.session_state.shown_step = step.metadata.number
+            if PREFETCH['enabled']:
+                get_prefetcher().record_visit(make_key(step.metadata.number, display))
+
+        # Vytvoř interaktivní Plotly figure
+        cached = recorder.enabled and make_key(step.metadata.number, display) in get_figure_cache()
+        with recorder.measure('render_plotly_diagram'):
+            fig = create_plotly_figure(step)
+
+        if recorder.enabled:
+            recorder.note('figure_source', 'z cache' if cached else 'sestavena')
+            recorder.note('trace_counts', trace_counts(fig))
+            with recorder.measure('serializace'):
+                recorder.note('payload_bytes', payload_size(fig))
+
+        # Configure Plotly to preserve camera view in downloads
+        config = chart_config(step.metadata.number)
+
+        # Dict bez tracu (úvod) st.plotly_chart odmítne jako prázdná data,
+        # go.Figure projde
+        if not fig['data']:
+            fig = go.Figure(fig)
+
+        # Jen sestavení protobufu na serveru - přenos a vykreslení v prohlížeči ne
+        with recorder.measure('st.plotly_chart (proto build only)'):
+            st.plotly_chart(fig, use_container_width=True, config=config)
+
+        # Sousední kroky se sestaví na pozadí, než na ně uživatel klikne
+        if PREFETCH['enabled']:
+            get_prefetcher().prefetch_neighbors(
+                st.session_state.session_token, get_registry(),
+                step.metadata.number, display, radius=PREFETCH['radius']
+            )
+
+        if perf_box is not None:
+            with perf_box:
+                render_panel(recorder)
+
+
+def render_main_content(settings_box, perf_box=None):
+    """Vykreslí hlavní obsah - diagram + popis
+
+    Args:
+        settings_box: Kontejner v sidebaru pro ovládání zobrazení
+        perf_box: Kontejner v sidebaru pro inspektor výkonu (None = vypnutý)
+    """
     registry = get_registry()
-    step = registry.get_step_by_number(st.session_state.current_step)
+    with get_recorder().measure('step lookup'):
+        step = registry.get_step_by_number(st.session_state.current_step)
 
     if step is None:
         st.error("Krok nenalezen!")
@@ -261,26 +315,7 @@ def render_main_content():
 
     # Levý sloupec - 3D diagram
     with col_diagram:
-        st.markdown("### 🔷 Interaktivní 3D Diagram")
-        st.info("💡 **Tip:** Použij myš k otáčení diagramu! Scroll kolečkem přiblíží/oddálí.")
-
-        # Vytvoř interaktivní Plotly figure
-        fig = create_plotly_figure(step)
-
-        # Configure Plotly to preserve camera view in downloads
-        config = {
-            'displayModeBar': True,
-            'displaylogo': False,
-            'toImageButtonOptions': {
-                'format': 'png',
-                'filename': f'platonic_solid_step_{st.session_state.current_step}',
-                'height': 800,
-                'width': 800,
-                'scale': 2
-            }
-        }
-
-        st.plotly_chart(fig, use_container_width=True, config=config)
+        render_diagram_panel(step, settings_box, perf_box)
 
     # Pravý sloupec - popis
     with col_description:
@@ -288,30 +323,51 @@ def render_main_content():
         st.markdown(step.get_description())
 
 
-def main():
-    """Hlavní funkce aplikace"""
-    # Inicializace
-    register_all_steps()
-    initialize_session_state()
+@st.fragment
+def render_step_view(settings_box, perf_box=None):
+    """
+    Fragment s navigací a obsahem kroku
+
+    Tlačítka Předchozí/Další spustí znovu jen tento fragment - seznam
+    kroků v sidebaru se nepřestavuje.
 
-    # Vykreslení UI
-    render_sidebar()
+    Args:
+        settings_box: Kontejner v sidebaru pro ovládání zobrazení
+        perf_box: Kontejner v sidebaru pro inspektor výkonu (None = vypnutý)
+    """
+    with get_recorder().run('fragment kroku'):
+        # Navigační tlačítka nahoře
+        render_step_navigation(position="top")
 
-    # Hlavní nadpis
-    st.title("📐 Platónská tělesa - Interaktivní tutoriál")
-    st.markdown("---")
+        st.markdown("---")
 
-    # Navigační tlačítka nahoře
-    render_step_navigation(position="top")
+        # Hlavní obsah
+        render_main_content(settings_box, perf_box)
 
-    st.markdown("---")
+        # Navigační tlačítka dole (pro pohodlí)
+        st.markdown("---")
+        render_step_navigation(position="bottom")
 
-    # Hlavní obsah
-    render_main_content()
 
-    # Navigační tlačítka dole (pro pohodlí)
-    st.markdown("---")
-    render_step_navigation(position="bottom")
+def main():
+    """Hlavní funkce aplikace"""
+    # Inicializace
+    recorder = get_recorder()
+    with recorder.run('celá aplikace'):
+        with recorder.measure('registry'):
+            register_all_steps()
+        initialize_session_state()
+
+        # Vykreslení UI
+        settings_box = render_sidebar()
+        perf_box = st.sidebar.container() if recorder.enabled else None
+
+        # Hlavní nadpis
+        st.title("📐 Platónská tělesa - Interaktivní tutoriál")
+        st.markdown("---")
+
+        # Navigace + diagram + popis (fragmenty - viz render_step_view)
+        render_step_view(settings_box, perf_box)
 
 
 if __name__ == "__main__":
@@ -32,6 +32,73 @@ PLOT_3D = {
     'azimuth': 45,
 }
 
+# Plotly 3D scene settings (základní layout pro PlotlyRenderer3D)
+PLOTLY_SCENE = {
+    'gridcolor': 'lightgray',
+    'backgroundcolor': 'white',
+    'aspectmode': 'cube',
+    'camera_eye': (1.5, 1.5, 1.5),
+    'margin': (0, 0, 30, 0),  # left, right, top, bottom
+    'height': 600,
+}
+
+# Backend pro stavbu Plotly figur:
+#   'fast'   - FastFigure z obyčejných dict (bez validace, rychlejší)
+#   'figure' - validovaný plotly go.Figure
+PLOTLY_BACKEND = 'fast'
+
+# Serializace figur posílaných do prohlížeče
+PLOTLY_PAYLOAD = {
+    'typed_arrays': True,   # Numerická pole jako base64 (float32 / int16)
+    'json_engine': 'auto',  # 'auto' (orjson, pokud je nainstalovaný), 'orjson', 'json'
+}
+
+# Výchozí nastavení zobrazení ze sidebaru (st.session_state)
+DISPLAY_DEFAULTS = {
+    'show_faces': True,
+    'face_opacity': 0.5,
+    'face_color': '#00CED1',  # DarkTurquoise (výrazná azurová)
+    'edge_width': 3,
+    'vertex_size': 12,
+}
+
+# Cache hotových figur (sdílená všemi sessions v procesu)
+FIGURE_CACHE = {
+    'maxsize': 128,  # 22 kroků × několik kombinací nastavení
+}
+
+# Přednačítání sousedních kroků (N±radius) do cache figur na pozadí
+PREFETCH = {
+    'enabled': True,
+    'workers': 2,       # Vlákna sdílená všemi sessions
+    'max_pending': 8,   # Omezená fronta - další požadavky se zahodí
+    'radius': 1,        # Kolik kroků dopředu/dozadu
+}
+
+# Inspektor výkonu v sidebaru (vypnutý, dokud ho nezapne proměnná
+# prostředí nebo parametr v URL, např. ?perf=1)
+PERF_INSPECTOR = {
+    'env_var': 'PLATONIC_PERF',
+    'query_param': 'perf',
+}
+
+# Předrenderované figury (python prerender_figures.py)
+# Artefakty leží v <dir>/v<APP_INFO['version']>/, app je použije jen
+# při výchozím nastavení zobrazení (DISPLAY_DEFAULTS)
+PRERENDERED = {
+    'enabled': True,
+    'dir': 'prerendered',  # Relativně ke složce new/
+    'format': 2,           # Zvýšit při změně formátu artefaktů (2 = trace s meta vazbami)
+    # Kód, ze kterého figury vznikají - jeho obsah je součástí otisku artefaktů
+    'sources': ('steps', 'models', 'views/scene.py', 'views/plotly_renderer.py',
+                'views/fast_figure.py', 'views/payload.py', 'views/restyle.py'),
+}
+
+# Statický export celého tutoriálu (python export_static.py)
+STATIC_EXPORT = {
+    'dir': 'static_site',  # Relativně ke složce new/
+}
+
 # Visual styles
 COLORS = {
     'selected_point': 'red',
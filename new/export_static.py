@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Statický export celého tutoriálu pro prohlížení bez Pythonu.
+Fully client-side static export of the whole tutorial.
+
+Pro každý krok vykreslí figuru s výchozím nastavením zobrazení a převede
+popis z Markdownu na HTML. Výsledná složka (viz views/static_site.py)
+se nahraje na libovolný statický server - každé kliknutí pak obslouží
+prohlížeč sám (plotly.js jednou, data figur líně po krocích).
+
+Spuštění / Usage:
+    cd new/
+    python export_static.py
+    python export_static.py --outdir /tmp/static_site
+    python -m http.server -d static_site    # náhled
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+
+from config.settings import DISPLAY_DEFAULTS
+
+# Kroky importují streamlit -> mock s výchozím nastavením (před importem kroků)
+from utils.headless import install_streamlit_mock
+install_streamlit_mock(dict(DISPLAY_DEFAULTS, current_step=0))
+
+from steps.catalog import register_all_steps
+from steps.step_registry import StepRegistry
+from views.payload import to_json
+from views.static_site import site_dir, write_site
+
+
+def export_steps(registry: StepRegistry):
+    """Vykreslí kroky pro export (generátor trojic metadata, popis, JSON figury)"""
+    for step in registry.get_all_steps():
+        start = time.perf_counter()
+        fig_json = to_json(step.render_plotly_diagram())
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  Krok {step.metadata.number:>2}: {len(fig_json):>9,} B  "
+              f"{elapsed:6.1f} ms  {step.metadata.short_name}")
+        yield step.metadata, step.get_description(), fig_json
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export the whole tutorial as a static client-side website.'
+    )
+    parser.add_argument('--outdir', type=str, default=None,
+                        help='Output folder (default: STATIC_EXPORT["dir"] in config/settings.py)')
+    args = parser.parse_args()
+
+    outdir = site_dir(Path(args.outdir) if args.outdir else None)
+    print(f"🌐 Statický export -> {outdir}")
+
+    registry = register_all_steps(StepRegistry())
+    summary = write_site(export_steps(registry), registry.get_sidebar_menu(), outdir)
+
+    print(f"✓ {len(summary['figures'])} kroků, {summary['bytes']:,} B celkem "
+          f"(plotly.js: {summary['plotly_js']})")
+    print(f"  Otevři {outdir / 'index.html'}")
+
+
+if __name__ == '__main__':
+    main()
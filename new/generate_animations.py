@@ -23,15 +23,29 @@ Spuštění / Usage:
     python generate_animations.py --steps 1-5            # kroky 1-5 / steps 1-5
     python generate_animations.py --steps 1,3,5          # kroky 1,3,5 / steps 1,3,5
     python generate_animations.py --steps 1-3,7,10-12    # kombinace / combination
+    python generate_animations.py --jobs 4               # 4 procesy / 4 worker processes
+    python generate_animations.py --jobs 4 --schedule steps   # celé kroky / whole steps
+    python generate_animations.py --force                # i nezměněné kroky / rebuild all
+    python generate_animations.py --palette sampled      # společná paleta / shared palette
+
+    Nezměněné kroky se přeskakují (hash figury a parametrů v _manifest.json).
+    Unchanged steps are skipped (figure + parameter hash in _manifest.json).
 """
 
 import sys
 import os
 import math
 import io
+import json
+import hashlib
 import argparse
+import pickle
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from itertools import count, repeat
 from pathlib import Path
-from unittest.mock import MagicMock
 
 try:
     from tqdm import tqdm
@@ -40,40 +54,23 @@ except ImportError:
     HAS_TQDM = False
     tqdm = None
 
-# ── 1. Mock streamlit BEFORE any step imports ─────────────────────────────────
+# ── 1. Set up Python path so step modules resolve correctly ───────────────────
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+
+# ── 2. Mock streamlit BEFORE any step imports ─────────────────────────────────
 # Step modules call st.session_state inside render_plotly_diagram(), so we
 # substitute a plain dict-like object that satisfies all .get() and attribute
 # accesses without starting a real Streamlit server.
+from utils.headless import install_streamlit_mock
 
-class _MockSessionState(dict):
-    """Minimal stand-in for st.session_state."""
-
-    def get(self, key, default=None):
-        return super().get(key, default)
-
-    def __getattr__(self, key):
-        return self.get(key)
-
-    def __setattr__(self, key, value):
-        self[key] = value
-
-    def __contains__(self, key):
-        return dict.__contains__(self, key)
-
-
-_mock_st = MagicMock()
-_mock_st.session_state = _MockSessionState({
+_mock_st = install_streamlit_mock({
     'show_faces':    True,
     'face_opacity':  0.3,
     'face_color':    '#00CED1',
     'edge_width':    3,
     'vertex_size':   12,
 })
-sys.modules['streamlit'] = _mock_st
-
-# ── 2. Set up Python path so step modules resolve correctly ───────────────────
-_HERE = Path(__file__).resolve().parent
-sys.path.insert(0, str(_HERE))
 
 # ── 3. Import all step classes ────────────────────────────────────────────────
 from steps.definitions.tetrahedron import (
@@ -97,6 +94,13 @@ from steps.definitions.bonus_why_five import BonusStep_WhyOnlyFive
 from steps.definitions.bonus_why_five_18a import BonusStep_WhyFive_18A
 from steps.definitions.bonus_why_five_18b import BonusStep_WhyFive_18B
 from steps.definitions.bonus_why_five_18c import BonusStep_WhyFive_18C
+from views.fast_figure import as_figure
+from utils.gif_writer import StreamingGifWriter
+from utils.gif_palette import (
+    PALETTE_MODES, known_palette, palette_bytes, quantize_frame, sample_indices,
+    sampled_palette,
+)
+from plotly.utils import PlotlyJSONEncoder
 
 # ── 4. Helpers ────────────────────────────────────────────────────────────────
 
@@ -141,14 +145,200 @@ def _ascii_filename(text: str) -> str:
     return ''.join(replacements.get(c, c) for c in text)
 
 
+def _render_png(fig, frame: int, n_frames: int, size: int, elevation: float) -> bytes:
+    """
+    Render one rotation frame to PNG bytes via Kaleido.
+
+    Args:
+        fig:       Plotly Figure with a 3D scene (its camera is changed).
+        frame:     Frame index (0 → n_frames - 1).
+        n_frames:  Number of rotation frames.
+        size:      Pixel width and height of the frame.
+        elevation: Camera elevation angle in degrees.
+    """
+    azimuth = frame * 360.0 / n_frames
+    fig.update_layout(
+        scene_camera=dict(
+            eye=_camera_eye(azimuth, elevation),
+            up=dict(x=0, y=0, z=1),
+        )
+    )
+    return fig.to_image(format='png', width=size, height=size, scale=1)
+
+
+def _decode_png(png_bytes: bytes):
+    """PNG bytes → RGBA PIL image."""
+    from PIL import Image
+    return Image.open(io.BytesIO(png_bytes)).convert('RGBA')
+
+
+def _render_rgba(fig, frame: int, n_frames: int, size: int, elevation: float):
+    """Render one rotation frame to an RGBA PIL image (see _render_png)."""
+    return _decode_png(_render_png(fig, frame, n_frames, size, elevation))
+
+
+def _render_frame(fig, frame: int, n_frames: int, size: int, elevation: float,
+                  palette=None):
+    """
+    Render one rotation frame to a palette-mode PIL image.
+
+    Without a shared palette every frame gets its own adaptive palette
+    (see utils.gif_palette.quantize_frame).
+    """
+    # Convert to palette mode for compact GIF
+    return quantize_frame(_render_rgba(fig, frame, n_frames, size, elevation), palette)
+
+
+# ── Worker processes (--jobs N) ───────────────────────────────────────────────
+# The figure and render parameters of a step are written once to a temp
+# file (FramePool.shared); tasks carry only that file's key and the frame
+# index, and each worker loads the job once per step.
+#
+# Workers return the PNG bytes, decoding and quantization happen in the
+# parent exactly as in the sequential path. A palette-mode image does not
+# survive pickling unchanged (its RGBA palette comes back as RGB, which
+# GifImagePlugin encodes differently), and PNG is also far smaller to send
+# than a decoded frame.
+
+_worker_job = {'key': None, 'job': None}
+
+
+def _load_job(key: str) -> dict:
+    """Job of the current step in this worker (key = path of the pickled job)."""
+    if key != _worker_job['key']:
+        with open(key, 'rb') as f:
+            _worker_job['job'] = pickle.load(f)
+        _worker_job['key'] = key
+    return _worker_job['job']
+
+
+def _render_png_task(key: str, frame: int) -> bytes:
+    """Render one frame to PNG bytes in a worker process."""
+    job = _load_job(key)
+    return _render_png(job['fig'], frame, job['n_frames'], job['size'], job['elevation'])
+
+
+class FramePool(ProcessPoolExecutor):
+    """Process pool for frame rendering, with per-step jobs shared via temp files."""
+
+    def __init__(self, jobs: int):
+        super().__init__(max_workers=jobs)
+        self.jobs = jobs
+        self._job_dir = tempfile.TemporaryDirectory(prefix='frame_jobs_')
+        self._job_ids = count()
+
+    @contextmanager
+    def shared(self, job: dict):
+        """
+        Write a step's job (figure + render parameters) once for all workers.
+
+        Yields:
+            Key to pass to the tasks instead of the figure. Keys are never
+            reused within the pool, so workers cannot mistake a new job for
+            the one they have cached.
+        """
+        key = os.path.join(self._job_dir.name, f"{next(self._job_ids)}.pickle")
+        with open(key, 'wb') as f:
+            pickle.dump(job, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            yield key
+        finally:
+            os.unlink(key)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+        self._job_dir.cleanup()
+
+    def imap(self, fn, *iterables):
+        """
+        Like map(), but with at most 2 × jobs tasks in flight.
+
+        Results are yielded in submission order. Unlike map(), finished
+        results never pile up beyond the window, so memory does not grow
+        with the number of tasks.
+        """
+        window = deque()
+        for args in zip(*iterables):
+            if len(window) >= 2 * self.jobs:
+                yield window.popleft().result()
+            window.append(self.submit(fn, *args))
+        while window:
+            yield window.popleft().result()
+
+
+def frame_pool(jobs: int):
+    """
+    Create the worker pool for frame rendering.
+
+    Args:
+        jobs: Number of worker processes; 1 = render sequentially.
+
+    Returns:
+        Context manager yielding a FramePool, or None for jobs <= 1.
+    """
+    if jobs <= 1:
+        return nullcontext()
+    return FramePool(jobs)
+
+
+def _render_job(fig, n_frames: int, size: int, elevation: float) -> dict:
+    """Everything a worker needs to render frames of one step (see FramePool.shared)."""
+    return {'fig': fig, 'n_frames': n_frames, 'size': size, 'elevation': elevation}
+
+
+def _build_palette(fig, mode: str, n_frames: int, size: int, elevation: float,
+                   pool=None, key: str = None):
+    """
+    Build the shared palette of a rotating GIF (see utils.gif_palette).
+
+    Returns:
+        (palette image or None for 'adaptive', {frame index: RGBA frame}
+        of the sample frames rendered for the palette - reused later)
+    """
+    if mode == 'known':
+        return known_palette(fig, [_mock_st.session_state['face_color']]), {}
+    if mode != 'sampled':
+        return None, {}
+
+    indices = sample_indices(n_frames)
+    if pool is None:
+        samples = [_render_rgba(fig, i, n_frames, size, elevation) for i in indices]
+    else:
+        samples = [_decode_png(png) for png in pool.imap(_render_png_task, repeat(key), indices)]
+    return sampled_palette(samples), dict(zip(indices, samples))
+
+
+def _rendered_frames(fig, n_frames: int, size: int, elevation: float, palette,
+                     cached: dict, pool=None, key: str = None):
+    """Yield the palette-mode frames in order, reusing the cached sample frames."""
+    todo = [i for i in range(n_frames) if i not in cached]
+    if pool is None:
+        rest = (_render_frame(fig, i, n_frames, size, elevation, palette) for i in todo)
+    else:
+        # imap() yields results in submission order → frames stay in order
+        rest = (quantize_frame(_decode_png(png), palette)
+                for png in pool.imap(_render_png_task, repeat(key), todo))
+    for i in range(n_frames):
+        yield quantize_frame(cached.pop(i), palette) if i in cached else next(rest)
+
+
 def save_rotating_gif(fig, output_path: Path, n_frames: int, fps: int,
-                      size: int, elevation: float) -> None:
+                      size: int, elevation: float, pool=None,
+                      progress: bool = True, palette_mode: str = 'adaptive') -> None:
     """
     Rotate Plotly 3D figure 360° around the vertical axis and save as GIF.
 
-    Each frame is rendered to PNG via Kaleido, then all frames are stitched
-    into an animated GIF using Pillow (smaller, more compatible than imageio
-    for palette-based animation).
+    Each frame is rendered to PNG via Kaleido and appended to the animated
+    GIF as soon as it is quantized (StreamingGifWriter, same bytes as
+    Pillow's save_all), so memory does not grow with the frame count.
+
+    With a pool (see frame_pool) the workers only export PNGs; frames are
+    decoded and quantized here in frame order, so the GIF is byte-identical
+    to the sequential one (test_frame_pool.py).
+
+    palette_mode 'sampled' / 'known' quantizes all frames to one shared
+    palette (written once as the global color table) instead of a
+    median-cut palette per frame - see utils.gif_palette.
 
     Args:
         fig:         Plotly Figure with a 3D scene.
@@ -157,52 +347,42 @@ def save_rotating_gif(fig, output_path: Path, n_frames: int, fps: int,
         fps:         Frames per second in the output GIF.
         size:        Pixel width and height of each frame.
         elevation:   Camera elevation angle in degrees.
+        pool:        Optional FramePool from frame_pool().
+        progress:    Show the progress bar / frame counter.
+        palette_mode: 'adaptive' (palette per frame), 'sampled' or 'known'.
     """
-    from PIL import Image
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    frames = []
-
-    # Progress bar setup
-    if HAS_TQDM:
-        iterator = tqdm(range(n_frames), desc="  Rendering", unit="frame", ncols=70)
-    else:
-        iterator = range(n_frames)
-        print(f"  Rendering {n_frames} frames...")
-
-    for i in iterator:
-        azimuth = i * 360.0 / n_frames
-        fig.update_layout(
-            scene_camera=dict(
-                eye=_camera_eye(azimuth, elevation),
-                up=dict(x=0, y=0, z=1),
-            )
-        )
-        png_bytes = fig.to_image(format='png', width=size, height=size, scale=1)
-        img = Image.open(io.BytesIO(png_bytes)).convert('RGBA')
-
-        # Convert to palette mode for compact GIF
-        img_p = img.convert('P', palette=Image.ADAPTIVE, colors=128)
-        frames.append(img_p)
+    # The step's figure goes to the workers once, not with every frame task
+    job_file = (pool.shared(_render_job(fig, n_frames, size, elevation))
+                if pool is not None else nullcontext())
+    with job_file as key:
+        palette, cached = _build_palette(fig, palette_mode, n_frames, size, elevation, pool, key)
+        rendered = _rendered_frames(fig, n_frames, size, elevation, palette, cached, pool, key)
+
+        # Progress bar setup
+        show_counter = progress and not HAS_TQDM
+        if progress and HAS_TQDM:
+            iterator = tqdm(rendered, total=n_frames, desc="  Rendering", unit="frame", ncols=70)
+        else:
+            iterator = rendered
+            if show_counter:
+                print(f"  Rendering {n_frames} frames...")
 
-        if not HAS_TQDM:
-            print(f"    frame {i + 1:>3}/{n_frames}", end='\r', flush=True)
+        duration_ms = max(1, round(1000 / fps))
+        shared = palette_bytes(palette) if palette is not None else None
+        with StreamingGifWriter(output_path, duration=duration_ms, loop=0,  # loop forever
+                                palette=shared) as gif:
+            for i, img_p in enumerate(iterator):
+                gif.add(img_p)
 
-    if not HAS_TQDM:
-        print()  # newline
+                if show_counter:
+                    print(f"    frame {i + 1:>3}/{n_frames}", end='\r', flush=True)
 
-    duration_ms = max(1, round(1000 / fps))
-    frames[0].save(
-        str(output_path),
-        save_all=True,
-        append_images=frames[1:],
-        optimize=True,
-        duration=duration_ms,
-        loop=0,          # loop forever
-    )
+        if show_counter:
+            print()  # newline
 
 
-def save_static_gif(fig, output_path: Path, size_w: int, size_h: int) -> None:
+def save_static_gif(fig, output_path: Path, size_w: int, size_h: int,
+                    progress: bool = True) -> None:
     """
     Export a 2D Plotly figure as a two-frame GIF (static, always compatible).
 
@@ -211,11 +391,13 @@ def save_static_gif(fig, output_path: Path, size_w: int, size_h: int) -> None:
         output_path: Destination .gif file.
         size_w:     Width in pixels.
         size_h:     Height in pixels.
+        progress:   Print the rendering message.
     """
     from PIL import Image
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    print(f"  Rendering static image ({size_w}x{size_h}px)...")
+    if progress:
+        print(f"  Rendering static image ({size_w}x{size_h}px)...")
 
     png_bytes = fig.to_image(format='png', width=size_w, height=size_h, scale=1)
     img = Image.open(io.BytesIO(png_bytes)).convert('RGBA').convert('P', palette=Image.ADAPTIVE, colors=128)
@@ -230,6 +412,240 @@ def save_static_gif(fig, output_path: Path, size_w: int, size_h: int) -> None:
     )
 
 
+def render_step(fig, out: Path, args, pool=None, progress: bool = True) -> int:
+    """
+    Render one step's figure to its GIF (rotating for 3D, static for 2D).
+
+    Args:
+        fig:      Plotly Figure of the step.
+        out:      Destination .gif file.
+        args:     Parsed command line (frames, fps, size, elevation, palette).
+        pool:     Optional frame pool (see frame_pool).
+        progress: Show progress output.
+
+    Returns:
+        Size of the written GIF in KB.
+    """
+    if _is_3d_figure(fig):
+        save_rotating_gif(
+            fig, out,
+            n_frames=args.frames,
+            fps=args.fps,
+            size=args.size,
+            elevation=args.elevation,
+            pool=pool,
+            progress=progress,
+            palette_mode=args.palette,
+        )
+    else:
+        save_static_gif(fig, out, size_w=1000, size_h=700, progress=progress)
+    return out.stat().st_size // 1024
+
+
+def estimate_cost(fig, n_frames: int) -> int:
+    """
+    Estimated render cost of a step: trace count × rendered frames.
+
+    3D steps render n_frames frames, 2D steps a single static image.
+    """
+    frames = n_frames if _is_3d_figure(fig) else 1
+    return len(fig.data) * frames
+
+
+# Bump when the GIF encoding changes, so existing outputs get rebuilt
+# (2: --jobs frames were pickled palette images and differed from the
+# sequential output)
+GIF_FORMAT_VERSION = 2
+
+
+class BuildManifest:
+    """
+    Build manifest of the generated GIFs (<outdir>/_manifest.json).
+
+    For every step it stores a hash of the serialized figure together with
+    the render parameters. A step whose hash matches and whose GIF still
+    exists is skipped; --force rebuilds everything.
+    """
+
+    FILENAME = '_manifest.json'
+
+    def __init__(self, output_dir: Path, args):
+        self.path = output_dir / self.FILENAME
+        self.force = args.force
+        self.params = {
+            'frames': args.frames,
+            'fps': args.fps,
+            'size': args.size,
+            'elevation': args.elevation,
+            'format': GIF_FORMAT_VERSION,
+        }
+        if args.palette != 'adaptive':
+            # Only non-default modes, so existing manifests stay valid
+            self.params['palette'] = args.palette
+        self.entries = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except ValueError:
+                pass    # corrupted manifest → rebuild everything
+        self.skipped, self.rebuilt = [], []
+
+    def figure_hash(self, fig) -> str:
+        """Hash of the serialized figure plus the render parameters."""
+        payload = json.dumps({'figure': fig.to_plotly_json(), 'params': self.params},
+                             sort_keys=True, cls=PlotlyJSONEncoder)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_current(self, number: int, digest: str, out: Path) -> bool:
+        """True if the step's GIF exists and was built from the same hash."""
+        entry = self.entries.get(str(number))
+        current = (not self.force and out.exists() and entry is not None
+                   and entry['hash'] == digest and entry['file'] == out.name)
+        if current:
+            self.skipped.append(number)
+        return current
+
+    def record(self, number: int, digest: str, out: Path) -> None:
+        """Store the hash of a freshly built GIF."""
+        self.entries[str(number)] = {'hash': digest, 'file': out.name}
+        self.rebuilt.append(number)
+
+    def forget(self, number: int) -> None:
+        """Drop a failed step (its GIF may be missing or partial)."""
+        self.entries.pop(str(number), None)
+
+    def save(self) -> None:
+        ordered = dict(sorted(self.entries.items(), key=lambda item: int(item[0])))
+        self.path.write_text(json.dumps(ordered, indent=2), encoding='utf-8')
+
+
+def _report_skipped(out: Path) -> None:
+    print(f"  = unchanged, skipped ({out.stat().st_size // 1024} KB)\n")
+
+
+def _render_step_task(fig, out: Path, args) -> int:
+    """Render a whole step in a worker process (--schedule steps)."""
+    return render_step(fig, out, args, progress=False)
+
+
+def _step_output(step, output_dir: Path):
+    """Return (metadata, console label, output path) of a step."""
+    meta  = step.get_metadata()
+    label = f"[{meta.number:>2}] {meta.title}"
+    safe  = f"step_{meta.number:02d}_{_ascii_filename(meta.category)}"
+    return meta, label, output_dir / f"{safe}.gif"
+
+
+def _report_failure(exc: Exception) -> None:
+    import traceback
+    print(f"  ✗ ERROR: {exc}")
+    traceback.print_exception(type(exc), exc, exc.__traceback__)
+    print()
+
+
+def render_steps_sequential(steps, output_dir: Path, args, manifest: BuildManifest,
+                            pool=None):
+    """
+    Render steps one after another (frames optionally on a frame pool).
+
+    Returns:
+        (succeeded, failed) lists in step order.
+    """
+    succeeded, failed = [], []
+
+    for step in steps:
+        meta, label, out = _step_output(step, output_dir)
+
+        print(f"{label}")
+        print(f"  → {out.name}")
+
+        try:
+            fig = as_figure(step.render_plotly_diagram())
+            digest = manifest.figure_hash(fig)
+            if manifest.is_current(meta.number, digest, out):
+                _report_skipped(out)
+            else:
+                size_kb = render_step(fig, out, args, pool=pool)
+                manifest.record(meta.number, digest, out)
+                print(f"  ✓ saved ({size_kb} KB)\n")
+            succeeded.append((meta.number, meta.title, str(out.relative_to(_HERE))))
+
+        except Exception as exc:
+            _report_failure(exc)
+            manifest.forget(meta.number)
+            failed.append((meta.number, meta.title, str(exc)))
+
+    return succeeded, failed
+
+
+def render_steps_parallel(steps, output_dir: Path, args, manifest: BuildManifest):
+    """
+    Render whole steps on a pool of worker processes.
+
+    Steps are submitted most expensive first (estimate_cost), so the heavy
+    ones do not end up last on a single worker. Idle workers take the next
+    step from the pool's shared queue. Steps are reported as they finish;
+    the returned lists are in step order, same as render_steps_sequential.
+
+    Returns:
+        (succeeded, failed) lists in step order.
+    """
+    results = {}    # step number → (succeeded entry | None, failed entry | None)
+    jobs = []       # (cost, step order, step, fig, out)
+    digests = {}    # step number → figure hash (see BuildManifest)
+
+    for order, step in enumerate(steps):
+        meta, label, out = _step_output(step, output_dir)
+        try:
+            fig = as_figure(step.render_plotly_diagram())
+            digests[meta.number] = manifest.figure_hash(fig)
+        except Exception as exc:
+            print(f"{label}")
+            _report_failure(exc)
+            manifest.forget(meta.number)
+            results[meta.number] = (None, (meta.number, meta.title, str(exc)))
+            continue
+        if manifest.is_current(meta.number, digests[meta.number], out):
+            print(f"{label}")
+            print(f"  → {out.name}")
+            _report_skipped(out)
+            results[meta.number] = ((meta.number, meta.title, str(out.relative_to(_HERE))), None)
+            continue
+        jobs.append((estimate_cost(fig, args.frames), order, step, fig, out))
+
+    jobs.sort(key=lambda job: (-job[0], job[1]))
+    print("  schedule: " + ', '.join(
+        f"{step.get_metadata().number} ({cost})" for cost, _, step, _, _ in jobs) + "\n")
+
+    with FramePool(args.jobs) as pool:
+        futures = {pool.submit(_render_step_task, fig, out, args): (step, out)
+                   for _, _, step, fig, out in jobs}
+
+        for future in as_completed(futures):
+            step, out = futures[future]
+            meta, label, _ = _step_output(step, output_dir)
+            print(f"{label}")
+            print(f"  → {out.name}")
+            try:
+                size_kb = future.result()
+                manifest.record(meta.number, digests[meta.number], out)
+                print(f"  ✓ saved ({size_kb} KB)\n")
+                results[meta.number] = ((meta.number, meta.title, str(out.relative_to(_HERE))), None)
+            except Exception as exc:
+                _report_failure(exc)
+                manifest.forget(meta.number)
+                results[meta.number] = (None, (meta.number, meta.title, str(exc)))
+
+    succeeded, failed = [], []
+    for step in steps:
+        ok, error = results[step.get_metadata().number]
+        if ok:
+            succeeded.append(ok)
+        else:
+            failed.append(error)
+    return succeeded, failed
+
+
 # ── 5. Main ───────────────────────────────────────────────────────────────────
 
 ALL_STEPS = [
@@ -302,6 +718,17 @@ def main():
                         help='Output folder (default: animations/)')
     parser.add_argument('--steps',     type=str,   default=None,
                         help='Specific step(s) to generate (e.g., "5", "1-5", "1,3,5", "1-3,7-9")')
+    parser.add_argument('--jobs',      type=int,   default=1,
+                        help='Worker processes rendering frames, each with its own Kaleido (default: 1)')
+    parser.add_argument('--schedule',  choices=('frames', 'steps'), default='frames',
+                        help='What --jobs parallelizes: frames of one step at a time, or whole steps '
+                             'ordered by estimated cost (default: frames)')
+    parser.add_argument('--palette',   choices=PALETTE_MODES, default='adaptive',
+                        help='GIF palette: adaptive = own palette per frame, sampled = one palette '
+                             'from sample frames, known = one palette from the figure colors '
+                             '(default: adaptive)')
+    parser.add_argument('--force',     action='store_true',
+                        help='Rebuild every step, even if its figure and parameters did not change')
     args = parser.parse_args()
 
     output_dir = _HERE / args.outdir
@@ -331,57 +758,34 @@ def main():
 
     print(f"\n{'='*60}")
     print(f"  Platonic Solids – GIF Animation Generator")
-    print(f"  frames={args.frames}  fps={args.fps}  size={args.size}px")
+    print(f"  frames={args.frames}  fps={args.fps}  size={args.size}px  jobs={args.jobs}"
+          + (f"  schedule={args.schedule}" if args.jobs > 1 else "")
+          + (f"  palette={args.palette}" if args.palette != 'adaptive' else ""))
     print(filter_info)
     print(f"  output → {output_dir}")
     print(f"{'='*60}\n")
 
-    succeeded, failed = [], []
-
-    for step in steps_to_generate:
-        meta  = step.get_metadata()
-        label = f"[{meta.number:>2}] {meta.title}"
-        safe  = f"step_{meta.number:02d}_{_ascii_filename(meta.category)}"
-        out   = output_dir / f"{safe}.gif"
-
-        print(f"{label}")
-        print(f"  → {out.name}")
-
-        try:
-            fig = step.render_plotly_diagram()
-
-            if _is_3d_figure(fig):
-                save_rotating_gif(
-                    fig, out,
-                    n_frames=args.frames,
-                    fps=args.fps,
-                    size=args.size,
-                    elevation=args.elevation,
-                )
-            else:
-                save_static_gif(fig, out, size_w=1000, size_h=700)
-
-            size_kb = out.stat().st_size // 1024
-            print(f"  ✓ saved ({size_kb} KB)\n")
-            succeeded.append((meta.number, meta.title, str(out.relative_to(_HERE))))
-
-        except Exception as exc:
-            import traceback
-            print(f"  ✗ ERROR: {exc}")
-            traceback.print_exc()
-            failed.append((meta.number, meta.title, str(exc)))
-            print()
+    manifest = BuildManifest(output_dir, args)
+    if args.jobs > 1 and args.schedule == 'steps':
+        succeeded, failed = render_steps_parallel(steps_to_generate, output_dir, args, manifest)
+    else:
+        with frame_pool(args.jobs) as pool:
+            succeeded, failed = render_steps_sequential(steps_to_generate, output_dir, args,
+                                                        manifest, pool)
+    manifest.save()
 
     # ── Summary ───────────────────────────────────────────────────────────────
     print(f"{'='*60}")
     print(f"  Done: {len(succeeded)} OK  |  {len(failed)} failed")
+    print(f"  Rebuilt: {len(manifest.rebuilt)}  |  skipped (unchanged): {len(manifest.skipped)}")
+    if manifest.skipped:
+        print(f"  skipped steps: {', '.join(str(n) for n in sorted(manifest.skipped))}")
     if failed:
         print("\nFailed steps:")
         for num, title, err in failed:
             print(f"  [{num}] {title}: {err}")
 
     # Write metadata JSON for create_google_slides.py
-    import json
     meta_path = output_dir / '_metadata.json'
     with open(meta_path, 'w', encoding='utf-8') as f:
         json.dump(succeeded, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Zátěžový test aplikace se souběžnými sessions (bez prohlížeče).
+Headless concurrent-session load test for the Streamlit app.
+
+Pro každý počet sessions se spustí skutečný server (streamlit run app.py)
+v novém procesu a simulovaní uživatelé se k němu připojí přes websocket
+stejným protokolem jako prohlížeč (BackMsg/ForwardMsg). Prochází kroky
+(Další/Předchozí, skok ze sidebaru), přepínají "Zobrazit stěny"
+a posouvají slidery; widgety uvnitř fragmentu spouští jen fragment,
+stejně jako v prohlížeči. Všechny sessions sdílí jeden serverový proces
+(st.cache_resource, cache figur, prefetch), každá úroveň má svůj.
+
+Chyby = výjimky skriptu (element st.exception), chyba kompilace, tracebacky
+v logu serveru (vlákna mimo skript) a selhání klienta (timeout, odpojení).
+Výstup: p50/p95/p99 doby rerunu, propustnost, CPU a RSS serveru (celkem
+a na session; CPU a RSS z /proc - Linux).
+
+Potřebuje Streamlit >= 1.59 (requirements.txt - protokol BackMsg/ForwardMsg
+s fragmenty) a websockets >= 12 (requirements_dev.txt - websockets.sync).
+
+Spuštění / Usage:
+    cd new/
+    pip install -r requirements_dev.txt
+    python load_test.py
+    python load_test.py --sessions 1,8,32 --actions 40
+    python load_test.py --json load_test.json    # pro porovnání v CI
+"""
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+_HERE = Path(__file__).resolve().parent
+
+APP_PATH = str(_HERE / 'app.py')
+
+# Váhy akcí simulovaného uživatele
+ACTIONS = {
+    'next_prev': 45,
+    'jump': 10,
+    'toggle_faces': 15,
+    'slider': 30,
+}
+
+# Slidery v sidebaru: popisek -> (min, max, krok)
+SLIDERS = {
+    'Průhlednost stěn': (0.0, 1.0, 0.05),
+    'Tloušťka hran': (1, 8, 1),
+    'Velikost vrcholů': (5, 25, 1),
+}
+
+STARTUP_TIMEOUT = 60.0      # s, na odpověď /_stcore/health
+
+_FINISHED = {
+    ForwardMsg.FINISHED_SUCCESSFULLY,
+    ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+    ForwardMsg.FINISHED_WITH_COMPILE_ERROR,
+}
+
+
+def percentile(values: List[float], pct: int) -> float:
+    """Percentil (lineární interpolace, jako statistics.quantiles)"""
+    if not values:
+        return math.nan
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[pct - 1]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _process_usage(pid: int) -> Tuple[float, float]:
+    """
+    RSS (bajty) a spotřebovaný CPU čas (s) procesu z /proc
+
+    Returns:
+        (rss, cpu); mimo Linux (nan, nan)
+    """
+    try:
+        with open(f'/proc/{pid}/statm') as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        with open(f'/proc/{pid}/stat') as stat:
+            # Pole za jménem procesu (jméno může obsahovat mezery)
+            fields = stat.read().rsplit(')', 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+        return float(rss), cpu
+    except (OSError, ValueError, IndexError):
+        return math.nan, math.nan
+
+
+class AppServer:
+    """
+    Skutečný Streamlit server s app.py v samostatném procesu
+
+    Použití:
+        with AppServer() as server:
+            session = SimulatedSession(server.stream_url, ...)
+    """
+
+    def __init__(self):
+        self.port = _free_port()
+        self.stream_url = f'ws://127.0.0.1:{self.port}/_stcore/stream'
+        self._log = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> 'AppServer':
+        env = dict(os.environ, STREAMLIT_LOGGER_LEVEL='error')
+        self._process = subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', APP_PATH,
+             '--server.headless', 'true',
+             '--server.address', '127.0.0.1',
+             '--server.port', str(self.port),
+             '--server.fileWatcherType', 'none',
+             '--browser.gatherUsageStats', 'false'],
+            cwd=_HERE, env=env, stdout=subprocess.DEVNULL, stderr=self._log
+        )
+        self._wait_ready()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._log.close()
+
+    def _wait_ready(self) -> None:
+        health = f'http://127.0.0.1:{self.port}/_stcore/health'
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Server skončil při startu:\n{self.log()}")
+            try:
+                with urllib.request.urlopen(health, timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError(f"Server nenaběhl do {STARTUP_TIMEOUT:.0f} s")
+
+    def usage(self) -> Tuple[float, float]:
+        """RSS a CPU čas serveru (viz _process_usage)"""
+        return _process_usage(self._process.pid)
+
+    def log(self) -> str:
+        """Dosavadní stderr serveru"""
+        self._log.flush()
+        self._log.seek(0)
+        return self._log.read()
+
+    def traceback_count(self) -> int:
+        """
+        Počet tracebacků v logu mimo běh skriptu (vlákna aplikace, server)
+
+        Výjimky skriptu server loguje jako "Uncaught app execution" - ty
+        už klient započítal z elementu st.exception.
+        """
+        log = self.log()
+        return (log.count('Traceback (most recent call last)')
+                - log.count('Uncaught app execution'))
+
+
+class SimulatedSession:
+    """Jeden uživatel: websocket klient serveru řízený náhodnými akcemi"""
+
+    def __init__(self, url: str, seed: int, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        self.random = random.Random(seed)
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.failure: Optional[str] = None
+        self._ws = None
+        self._page_hash = ''
+        # id widgetu -> (typ, proto, fragment_id)
+        self._widgets: Dict[str, Tuple[str, Any, str]] = {}
+        self._values: Dict[str, Any] = {}
+
+    # --- protokol ---
+
+    def _widget_states(self, trigger: Optional[str]) -> List[WidgetState]:
+        """Stav všech widgetů jako ho posílá prohlížeč (tlačítko jen při kliku)"""
+        states = []
+        for widget_id, (kind, _, _) in self._widgets.items():
+            if kind == 'button':
+                if widget_id == trigger:
+                    states.append(WidgetState(id=widget_id, trigger_value=True))
+            elif kind == 'checkbox':
+                states.append(WidgetState(id=widget_id, bool_value=self._values[widget_id]))
+            elif kind == 'slider':
+                state = WidgetState(id=widget_id)
+                state.double_array_value.data[:] = self._values[widget_id]
+                states.append(state)
+        return states
+
+    def _rerun(self, trigger: Optional[str] = None, fragment_id: str = '') -> None:
+        """Pošle rerun (celé aplikace nebo fragmentu) a počká na jeho dokončení"""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        msg.rerun_script.page_script_hash = self._page_hash
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self._widget_states(trigger))
+        if not fragment_id:
+            self._widgets.clear()
+        self._ws.send(msg.SerializeToString())
+
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(self._ws.recv(timeout=self.timeout))
+            kind = fwd.WhichOneof('type')
+            if kind == 'new_session':
+                self._page_hash = fwd.new_session.main_script_hash
+            elif kind == 'delta' and fwd.delta.WhichOneof('type') == 'new_element':
+                self._track(fwd.delta.new_element, fwd.delta.fragment_id)
+            elif kind == 'script_finished' and fwd.script_finished in _FINISHED:
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    self.errors += 1
+                return
+
+    def _track(self, element, fragment_id: str) -> None:
+        """Zapamatuje si widget z elementu (a započítá výjimku skriptu)"""
+        kind = element.WhichOneof('type')
+        if kind == 'exception':
+            if not element.exception.is_warning:
+                self.errors += 1
+                self.failure = self.failure or element.exception.message
+            return
+        if kind not in ('button', 'checkbox', 'slider'):
+            return
+        proto = getattr(element, kind)
+        self._widgets[proto.id] = (kind, proto, fragment_id)
+        if kind == 'checkbox' and proto.id not in self._values:
+            self._values[proto.id] = proto.value if proto.set_value else proto.default
+        elif kind == 'slider' and proto.id not in self._values:
+            self._values[proto.id] = list(proto.value if proto.set_value else proto.default)
+
+    def _timed(self, action) -> None:
+        """Provede akci (rerun skriptu) a změří ji"""
+        start = time.perf_counter()
+        action()
+        self.latencies.append((time.perf_counter() - start) * 1000)
+
+    def _find(self, kind: str) -> List[Tuple[str, Any, str]]:
+        return [(widget_id, proto, fragment_id)
+                for widget_id, (k, proto, fragment_id) in self._widgets.items() if k == kind]
+
+    def _click(self, key: str) -> None:
+        for widget_id, _, fragment_id in self._find('button'):
+            if widget_id.endswith(f'-{key}'):
+                self._rerun(trigger=widget_id, fragment_id=fragment_id)
+                return
+        raise LookupError(f"Tlačítko '{key}' nenalezeno")
+
+    # --- akce uživatele ---
+
+    def _next_prev(self) -> None:
+        keys = {widget_id.rsplit('-', 1)[-1] for widget_id, _, _ in self._find('button')}
+        forward = 'next_top' in keys and ('prev_top' not in keys or self.random.random() < 0.75)
+        self._click('next_top' if forward else 'prev_top')
+
+    def _jump(self) -> None:
+        steps = [widget_id.rsplit('-', 1)[-1] for widget_id, _, _ in self._find('button')
+                 if widget_id.rsplit('-', 1)[-1].startswith('step_')]
+        self._click(self.random.choice(steps))
+
+    def _toggle_faces(self) -> None:
+        widget_id, _, fragment_id = self._find('checkbox')[0]
+        self._values[widget_id] = not self._values[widget_id]
+        self._rerun(fragment_id=fragment_id)
+
+    def _slider(self) -> None:
+        sliders = [s for s in self._find('slider') if s[1].label in SLIDERS]
+        widget_id, proto, fragment_id = self.random.choice(sliders)
+        low, high, step = SLIDERS[proto.label]
+        count = int(round((high - low) / step))
+        value = low + step * self.random.randint(0, count)
+        if isinstance(step, float):
+            value = round(value, 2)
+        self._values[widget_id] = [float(value)]
+        self._rerun(fragment_id=fragment_id)
+
+    def run(self, actions: int, barrier: threading.Barrier) -> None:
+        """
+        Načte stránku a provede zadaný počet akcí
+
+        Selhání klienta (timeout, odpojení, chybějící widget) se započítá
+        jako chyba a session skončí - vlákno nikdy nespadne potichu.
+        """
+        handlers = {
+            'next_prev': self._next_prev,
+            'jump': self._jump,
+            'toggle_faces': self._toggle_faces,
+            'slider': self._slider,
+        }
+        names = list(ACTIONS)
+        weights = [ACTIONS[name] for name in names]
+        try:
+            with connect(self.url, subprotocols=['streamlit'], max_size=None,
+                         open_timeout=self.timeout) as self._ws:
+                barrier.wait()
+                self._timed(self._rerun)
+                for _ in range(actions):
+                    name = self.random.choices(names, weights)[0]
+                    self._timed(handlers[name])
+        except threading.BrokenBarrierError:
+            pass    # jiná session se nepřipojila (její chyba už je započtená)
+        except Exception as exc:
+            self.errors += 1
+            self.failure = self.failure or repr(exc)
+            barrier.abort()
+
+
+def measure(sessions: int, actions: int, seed: int, timeout: float) -> Dict[str, Any]:
+    """
+    Spustí jednu úroveň zátěže proti novému serveru
+
+    Args:
+        sessions: Počet souběžných sessions
+        actions: Počet akcí na session (bez prvního načtení)
+        seed: Seed náhodných akcí
+        timeout: Timeout jednoho rerunu v sekundách
+
+    Returns:
+        Výsledky úrovně (latence, chyby, CPU a RSS serveru)
+    """
+    with AppServer() as server:
+        rss_base, cpu_start = server.usage()
+        users = [SimulatedSession(server.stream_url, seed * 1000 + i, timeout)
+                 for i in range(sessions)]
+        barrier = threading.Barrier(sessions)
+        threads = [threading.Thread(target=user.run, args=(actions, barrier))
+                   for user in users]
+
+        wall_start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - wall_start
+        rss, cpu_end = server.usage()
+        server_errors = server.traceback_count()
+
+    for user in users:
+        if user.failure:
+            print(f"⚠️  {user.failure}", file=sys.stderr)
+            break
+
+    latencies = sorted(ms for user in users for ms in user.latencies)
+    cpu = cpu_end - cpu_start
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': sum(user.errors for user in users) + server_errors,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'throughput_rps': len(latencies) / wall,
+        'wall_s': wall,
+        'cpu_s': cpu,
+        'cpu_pct': 100 * cpu / wall,
+        'rss_mb': rss / 2**20,
+        'rss_per_session_mb': (rss - rss_base) / 2**20 / sessions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Drive a real `streamlit run app.py` server with N concurrent '
+                    'websocket sessions and report rerun latency, errors, CPU and RSS.'
+    )
+    parser.add_argument('--sessions', type=str, default='1,4,16',
+                        help='Comma-separated session counts (default: 1,4,16)')
+    parser.add_argument('--actions', type=int, default=25,
+                        help='Actions per session after the first page load (default: 25)')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Random seed of the simulated users (default: 1)')
+    parser.add_argument('--timeout', type=float, default=120.0,
+                        help='Timeout of a single rerun in seconds (default: 120)')
+    parser.add_argument('--json', type=str, default=None,
+                        help='Also write the results to this JSON file')
+    args = parser.parse_args()
+
+    levels = [int(n) for n in args.sessions.split(',') if n.strip()]
+    print(f"{'sessions':>8}  {'reruns':>6}  {'chyby':>5}  {'p50 ms':>7}  {'p95 ms':>7}  "
+          f"{'p99 ms':>7}  {'rerun/s':>7}  {'CPU %':>6}  {'RSS MB':>7}  {'MB/session':>10}")
+    results = []
+    for sessions in levels:
+        r = measure(sessions, args.actions, args.seed, args.timeout)
+        results.append(r)
+        print(f"{r['sessions']:>8}  {r['reruns']:>6}  {r['errors']:>5}  {r['p50_ms']:>7.1f}  "
+              f"{r['p95_ms']:>7.1f}  {r['p99_ms']:>7.1f}  {r['throughput_rps']:>7.1f}  "
+              f"{r['cpu_pct']:>6.0f}  {r['rss_mb']:>7.1f}  {r['rss_per_session_mb']:>10.2f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"✓ Výsledky uloženy do {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Přehled paměti geometrie kroků a RSS podle počtu sessions.
+Memory report: shared step geometry and RSS per session count.
+
+1. Projde instance všech kroků a pro každé numpy pole / seznam indexů
+   ukáže, zda je sdílené (models/solids.py), kolik kroků ho používá
+   a zda je jen pro čtení.
+2. Spustí zátěžový test (load_test.py - skutečný streamlit server,
+   sessions jako websocket klienti) pro několik počtů sessions a vypíše
+   RSS serveru - s geometrií sdílenou v procesu má RSS na session
+   zůstat plochá.
+
+Spuštění / Usage:
+    cd new/
+    python memory_report.py
+    python memory_report.py --sessions 1,8,32 --actions 5
+    python memory_report.py --skip-sessions
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+
+from config.settings import DISPLAY_DEFAULTS
+
+# Kroky importují streamlit -> mock s výchozím nastavením (před importem kroků)
+from utils.headless import install_streamlit_mock
+install_streamlit_mock(dict(DISPLAY_DEFAULTS, current_step=0))
+
+from models.solids import shared_items
+from steps.catalog import register_all_steps
+from steps.step_registry import StepRegistry
+
+
+def _nbytes(value) -> int:
+    """Velikost dat pole nebo n-tice indexů (bez režie objektů)"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sum(len(item) for item in value) * 8
+
+
+def geometry_report() -> None:
+    """Vypíše sdílenou a soukromou geometrii všech kroků"""
+    registry = register_all_steps(StepRegistry())
+    # Sdílené objekty vznikají líně - až s instancemi kroků
+    steps = registry.get_all_steps()
+    names = {id(value): name for name, value in shared_items().items()}
+
+    users = defaultdict(list)       # id objektu -> kroky, které ho používají
+    objects = {}
+    private_bytes = 0
+    writeable = []
+    for step in steps:
+        for attr, value in vars(step).items():
+            if isinstance(value, np.ndarray):
+                if value.flags.writeable:
+                    writeable.append(f"{step.metadata.number}:{attr}")
+            elif not (isinstance(value, (list, tuple)) and value
+                      and isinstance(value[0], (list, tuple))):
+                continue
+            if id(value) in names:
+                users[id(value)].append(step.metadata.number)
+                objects[id(value)] = value
+            else:
+                private_bytes += _nbytes(value)
+
+    print(f"{'sdílený objekt':<28}  {'tvar':>8}  {'B':>5}  {'kroky':<24}")
+    shared_bytes = 0
+    duplicate_bytes = 0
+    for key, numbers in sorted(users.items(), key=lambda item: names[item[0]]):
+        value = objects[key]
+        shape = 'x'.join(map(str, np.shape(value))) if isinstance(value, np.ndarray) else len(value)
+        size = _nbytes(value)
+        shared_bytes += size
+        duplicate_bytes += size * (len(numbers) - 1)
+        numbers = ', '.join(str(n) for n in sorted(set(numbers)))
+        print(f"{names[key]:<28}  {shape:>8}  {size:>5}  {numbers:<24}")
+
+    print(f"\nSdílená geometrie: {shared_bytes:,} B "
+          f"(bez sdílení by bylo navíc {duplicate_bytes:,} B kopií)")
+    print(f"Soukromá geometrie kroků: {private_bytes:,} B")
+    if writeable:
+        print(f"⚠️  Zapisovatelná pole: {', '.join(writeable)}")
+    else:
+        print("✓ Všechna pole geometrie jsou jen pro čtení")
+
+
+def session_report(levels, actions: int) -> None:
+    """
+    Vypíše RSS serveru pro jednotlivé počty sessions (viz load_test.py)
+
+    Každá úroveň běží proti novému serverovému procesu. Sloupec
+    "přírůstek" je RSS navíc na každou další session oproti předchozí
+    úrovni - bez jednorázové režie (import, cache figur).
+
+    load_test.py běží jako samostatný proces - tento proces má místo
+    streamlitu mock (viz výše), zátěžový test potřebuje skutečný.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        results_path = Path(tmp) / 'load_test.json'
+        subprocess.run(
+            [sys.executable, str(_HERE / 'load_test.py'),
+             '--sessions', ','.join(str(n) for n in levels),
+             '--actions', str(actions), '--json', str(results_path)],
+            cwd=_HERE, stdout=subprocess.DEVNULL, check=True
+        )
+        results = json.loads(results_path.read_text(encoding='utf-8'))
+
+    print(f"\n{'sessions':>8}  {'RSS MB':>7}  {'přírůstek MB/session':>20}  {'p95 ms':>7}  {'chyby':>5}")
+    previous = None
+    for r in results:
+        if previous is None:
+            increment = '-'
+        else:
+            added = (r['rss_mb'] - previous['rss_mb']) / (r['sessions'] - previous['sessions'])
+            increment = f"{added:.2f}"
+        print(f"{r['sessions']:>8}  {r['rss_mb']:>7.1f}  {increment:>20}  {r['p95_ms']:>7.1f}  "
+              f"{r['errors']:>5}")
+        previous = r
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Report shared step geometry and RSS growth with the session count.'
+    )
+    parser.add_argument('--sessions', type=str, default='1,8,32',
+                        help='Comma-separated session counts (default: 1,8,32)')
+    parser.add_argument('--actions', type=int, default=5,
+                        help='Actions per simulated session (default: 5)')
+    parser.add_argument('--skip-sessions', action='store_true',
+                        help='Only print the geometry report')
+    args = parser.parse_args()
+
+    geometry_report()
+    if not args.skip_sessions:
+        session_report([int(n) for n in args.sessions.split(',') if n.strip()],
+                       args.actions)
+
+
+if __name__ == '__main__':
+    main()
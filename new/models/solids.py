@@ -0,0 +1,193 @@
+"""
+Sdílená geometrie Platónských těles (jedna kopie na proces)
+Shared read-only geometry of the Platonic solids
+
+Kroky berou vrcholy, hrany a stěny odsud místo vlastních kopií v __init__.
+Pole vrcholů jsou jen pro čtení (writeable = False), hrany a stěny jsou
+n-tice - všechny kroky i sessions sdílí tytéž objekty a žádný krok je
+nemůže ostatním omylem změnit. Přehled sdílené paměti: memory_report.py.
+"""
+import threading
+from typing import Any, Callable, Dict, Iterable, Tuple
+import numpy as np
+from config.settings import PHI
+
+_lock = threading.Lock()
+_shared: Dict[str, Any] = {}
+
+
+def freeze_array(values: Any, dtype=None) -> np.ndarray:
+    """
+    Vytvoří numpy pole jen pro čtení (vlastní kopie dat)
+
+    Args:
+        values: Data pole (seznam, numpy pole, ...)
+        dtype: Volitelný datový typ (výchozí = odvodí numpy)
+
+    Returns:
+        Pole s flags.writeable = False
+    """
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+def freeze_indices(items: Iterable[Iterable[int]]) -> Tuple[Tuple[int, ...], ...]:
+    """Převede seznam hran / stěn na neměnné n-tice"""
+    return tuple(tuple(item) for item in items)
+
+
+def edges_from_faces(faces: Iterable[Iterable[int]]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Hrany tělesa z jeho stěn (každá hrana jednou, jako seřazená dvojice)
+
+    Args:
+        faces: Stěny jako seznamy indexů vrcholů v kruhovém pořadí
+
+    Returns:
+        N-tice hran (i, j), i < j
+    """
+    edges = set()
+    for face in faces:
+        for i in range(len(face)):
+            edges.add(tuple(sorted([face[i], face[(i + 1) % len(face)]])))
+    return tuple(edges)
+
+
+def shared(name: str, build: Callable[[], Any]) -> Any:
+    """
+    Vrátí sdílenou hodnotu - při prvním volání ji sestaví (thread-safe)
+
+    Args:
+        name: Jméno v úložišti (např. 'cube.vertices')
+        build: Funkce bez argumentů vracející zmrazenou hodnotu
+
+    Returns:
+        Stejný objekt pro všechna volání v procesu
+    """
+    value = _shared.get(name)
+    if value is None:
+        with _lock:
+            value = _shared.get(name)
+            if value is None:
+                value = build()
+                _shared[name] = value
+    return value
+
+
+def shared_items() -> Dict[str, Any]:
+    """Vrátí kopii úložiště sdílené geometrie {jméno: objekt} (pro přehled paměti)"""
+    with _lock:
+        return dict(_shared)
+
+
+# ── Krychle (±1, ±1, ±1) ─────────────────────────────────────────────────────
+
+def cube_vertices() -> np.ndarray:
+    """8 vrcholů krychle (±1, ±1, ±1), index = binární zápis znamének x, y, z"""
+    return shared('cube.vertices', lambda: freeze_array([
+        [-1, -1, -1], [-1, -1,  1], [-1,  1, -1], [-1,  1,  1],
+        [ 1, -1, -1], [ 1, -1,  1], [ 1,  1, -1], [ 1,  1,  1]
+    ]))
+
+
+def cube_edges() -> Tuple[Tuple[int, int], ...]:
+    """12 hran krychle (indexy do cube_vertices)"""
+    return shared('cube.edges', lambda: freeze_indices([
+        (0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3),
+        (2, 6), (3, 7), (4, 5), (4, 6), (5, 7), (6, 7)
+    ]))
+
+
+# ── Čtyřstěn (4 vrcholy krychle) ─────────────────────────────────────────────
+
+def tetrahedron_vertices() -> np.ndarray:
+    """Vrcholy čtyřstěnu = vrcholy krychle 7, 4, 2, 1"""
+    return shared('tetrahedron.vertices', lambda: freeze_array([
+        [ 1,  1,  1], [ 1, -1, -1], [-1,  1, -1], [-1, -1,  1]
+    ]))
+
+
+def tetrahedron_faces() -> Tuple[Tuple[int, ...], ...]:
+    """4 trojúhelníkové stěny čtyřstěnu"""
+    return shared('tetrahedron.faces', lambda: freeze_indices([
+        [0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]
+    ]))
+
+
+def tetrahedron_edges() -> Tuple[Tuple[int, int], ...]:
+    """6 hran čtyřstěnu (všechny dvojice vrcholů)"""
+    return shared('tetrahedron.edges', lambda: freeze_indices([
+        (0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)
+    ]))
+
+
+# ── Osmistěn (vrcholy na osách) ──────────────────────────────────────────────
+
+def octahedron_vertices(scale: int = 1) -> np.ndarray:
+    """
+    6 vrcholů osmistěnu na osách: +X, -X, +Y, -Y, +Z, -Z
+
+    Args:
+        scale: Vzdálenost vrcholů od středu
+    """
+    return shared(f'octahedron.vertices.{scale}', lambda: freeze_array(
+        [[ scale, 0, 0], [-scale, 0, 0], [0,  scale, 0],
+         [0, -scale, 0], [0, 0,  scale], [0, 0, -scale]]
+    ))
+
+
+def octahedron_faces() -> Tuple[Tuple[int, ...], ...]:
+    """8 trojúhelníkových stěn osmistěnu"""
+    return shared('octahedron.faces', lambda: freeze_indices([
+        [0, 2, 4], [0, 4, 3], [0, 3, 5], [0, 5, 2],
+        [1, 4, 2], [1, 3, 4], [1, 5, 3], [1, 2, 5]
+    ]))
+
+
+def octahedron_edges() -> Tuple[Tuple[int, int], ...]:
+    """12 hran osmistěnu (ze stěn)"""
+    return shared('octahedron.edges', lambda: edges_from_faces(octahedron_faces()))
+
+
+# ── Dvacetistěn (tři zlaté obdélníky) ────────────────────────────────────────
+
+def icosahedron_vertices() -> np.ndarray:
+    """12 vrcholů dvacetistěnu - po čtyřech v rovinách YZ, XZ a XY"""
+    return shared('icosahedron.vertices', lambda: freeze_array([
+        [ 0,  1,  PHI], [ 0,  1, -PHI], [ 0, -1,  PHI], [ 0, -1, -PHI],
+        [ 1,  PHI,  0], [ 1, -PHI,  0], [-1,  PHI,  0], [-1, -PHI,  0],
+        [ PHI,  0,  1], [ PHI,  0, -1], [-PHI,  0,  1], [-PHI,  0, -1]
+    ]))
+
+
+def icosahedron_faces() -> Tuple[Tuple[int, ...], ...]:
+    """20 trojúhelníkových stěn dvacetistěnu"""
+    return shared('icosahedron.faces', lambda: freeze_indices([
+        [0, 8, 4], [0, 4, 6], [0, 6, 10], [0, 10, 2], [0, 2, 8],
+        [8, 2, 5], [2, 10, 7], [10, 6, 11], [6, 4, 1], [4, 8, 9],
+        [5, 2, 7], [7, 10, 11], [11, 6, 1], [1, 4, 9], [9, 8, 5],
+        [3, 5, 7], [3, 7, 11], [3, 11, 1], [3, 1, 9], [3, 9, 5]
+    ]))
+
+
+def icosahedron_edges() -> Tuple[Tuple[int, int], ...]:
+    """30 hran dvacetistěnu (ze stěn)"""
+    return shared('icosahedron.edges', lambda: edges_from_faces(icosahedron_faces()))
+
+
+# ── Dvanáctistěn (krychle + tři zlaté obdélníky) ─────────────────────────────
+
+def _dodecahedron_vertices() -> np.ndarray:
+    vertices = [[i, j, k] for i in (-1, 1) for j in (-1, 1) for k in (-1, 1)]
+    vertices += [
+        [0, 1/PHI, PHI], [0, 1/PHI, -PHI], [0, -1/PHI, PHI], [0, -1/PHI, -PHI],
+        [1/PHI, PHI, 0], [1/PHI, -PHI, 0], [-1/PHI, PHI, 0], [-1/PHI, -PHI, 0],
+        [PHI, 0, 1/PHI], [PHI, 0, -1/PHI], [-PHI, 0, 1/PHI], [-PHI, 0, -1/PHI]
+    ]
+    return freeze_array(vertices)
+
+
+def dodecahedron_vertices() -> np.ndarray:
+    """20 vrcholů dvanáctistěnu: 0-7 krychle, 8-19 zlaté obdélníky (YZ, XY, ZX)"""
+    return shared('dodecahedron.vertices', _dodecahedron_vertices)
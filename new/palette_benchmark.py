@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Porovnání režimů palety rotačních GIFů (čas kódování, velikost, chyba barev).
+Benchmark of the GIF palette modes: encode time, file size and color error.
+
+Snímky každého kroku se vykreslí přes Kaleido jen jednou, pak se pro
+každý režim (utils/gif_palette.py) změří sestavení palety, kvantizace
+a zápis GIFu (StreamingGifWriter) - stejně jako v generate_animations.py.
+Chyba = průměrný rozdíl RGB kanálu proti nekvantizovanému snímku (0-255).
+
+Spuštění / Usage:
+    cd new/
+    python palette_benchmark.py
+    python palette_benchmark.py --steps 13,15 --frames 36 --size 500
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import ImageChops, ImageStat
+
+# Import nastaví mock streamlitu a načte kroky
+import generate_animations as gen
+from utils.gif_palette import (
+    PALETTE_MODES, known_palette, palette_bytes, quantize_frame, sample_indices,
+    sampled_palette,
+)
+from utils.gif_writer import StreamingGifWriter
+
+
+def _palette(mode: str, fig, frames):
+    if mode == 'sampled':
+        return sampled_palette([frames[i] for i in sample_indices(len(frames))])
+    if mode == 'known':
+        return known_palette(fig, [gen._mock_st.session_state['face_color']])
+    return None
+
+
+def encode(mode: str, fig, frames, path: Path, fps: int) -> float:
+    """
+    Zakóduje snímky jedním režimem palety
+
+    Returns:
+        Doba sestavení palety, kvantizace a zápisu v ms
+    """
+    start = time.perf_counter()
+    palette = _palette(mode, fig, frames)
+    shared = palette_bytes(palette) if palette is not None else None
+    with StreamingGifWriter(path, duration=max(1, round(1000 / fps)), palette=shared) as gif:
+        for frame in frames:
+            gif.add(quantize_frame(frame, palette))
+    return (time.perf_counter() - start) * 1000
+
+
+def color_error(mode: str, fig, frames) -> float:
+    """Průměrná odchylka RGB kanálu kvantizovaných snímků od originálu"""
+    palette = _palette(mode, fig, frames)
+    total = 0.0
+    for frame in frames:
+        rgb = frame.convert('RGB')
+        diff = ImageChops.difference(rgb, quantize_frame(frame, palette).convert('RGB'))
+        total += sum(ImageStat.Stat(diff).mean) / 3
+    return total / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare encode time, file size and color error of the GIF palette modes.'
+    )
+    parser.add_argument('--steps', type=str, default='13,15',
+                        help='Steps to benchmark, same syntax as generate_animations.py (default: 13,15)')
+    parser.add_argument('--frames', type=int, default=60,
+                        help='Number of rotation frames (default: 60)')
+    parser.add_argument('--fps', type=int, default=15,
+                        help='Frames per second (default: 15)')
+    parser.add_argument('--size', type=int, default=700,
+                        help='Pixel size of the frames (default: 700)')
+    parser.add_argument('--elevation', type=float, default=25.0,
+                        help='Camera elevation angle in degrees (default: 25)')
+    args = parser.parse_args()
+
+    numbers = gen.parse_steps_arg(args.steps)
+    steps = [s for s in gen.ALL_STEPS if s.get_metadata().number in numbers]
+
+    print(f"{'krok':>4}  {'režim':<9}  {'kódování ms':>11}  {'GIF KB':>7}  {'chyba':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for step in steps:
+            number = step.get_metadata().number
+            fig = gen.as_figure(step.render_plotly_diagram())
+            if not gen._is_3d_figure(fig):
+                print(f"{number:>4}  (2D - statický GIF, přeskočeno)")
+                continue
+
+            print(f"      vykresluji {args.frames} snímků kroku {number}...", flush=True)
+            frames = [gen._render_rgba(fig, i, args.frames, args.size, args.elevation)
+                      for i in range(args.frames)]
+
+            baseline = None
+            for mode in PALETTE_MODES:
+                path = Path(tmp) / f"step_{number:02d}_{mode}.gif"
+                elapsed = encode(mode, fig, frames, path, args.fps)
+                size_kb = path.stat().st_size / 1024
+                if baseline is None:
+                    baseline = (elapsed, size_kb)
+                    relative = ''
+                else:
+                    relative = (f"  ({elapsed / baseline[0]:.0%} času, "
+                                f"{size_kb / baseline[1]:.0%} velikosti)")
+                error = color_error(mode, fig, frames)
+                print(f"{number:>4}  {mode:<9}  {elapsed:>11.0f}  {size_kb:>7.0f}  {error:>6.2f}{relative}")
+
+
+if __name__ == '__main__':
+    main()
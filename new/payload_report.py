@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Přehled velikosti dat figur posílaných do prohlížeče pro každý krok.
+Per-step report of the Plotly figure payload size sent to the browser.
+
+Porovná výchozí serializaci plotly 6 (engine 'json') s kompaktní (typed arrays
+float32/int16 + engine z PLOTLY_PAYLOAD v config/settings.py). Plotly 6 už
+numpy pole sám kóduje jako typed arrays (float64 / int64), takže úspora
+(kolem 6 %) pochází jen z užších dtype - ne z přechodu ze seznamů čísel
+na binární data.
+
+Spuštění / Usage:
+    cd new/
+    python payload_report.py
+"""
+import time
+
+# generate_animations nahradí streamlit mockem se session_state (před importem kroků)
+from generate_animations import ALL_STEPS
+import plotly.io as pio
+from views.fast_figure import as_figure
+from views.payload import figure_dict, json_engine, to_json
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'krok':>4}  {'traces':>6}  {'výchozí':>9}  {'kompaktní':>9}  {'úspora':>6}  "
+          f"{'ms json':>7}  {'ms ' + json_engine():>7}")
+    total_plain = total_compact = 0
+
+    for step in ALL_STEPS:
+        fig = step.render_plotly_diagram()
+        plain, plain_ms = _timed(
+            lambda: pio.to_json(figure_dict(fig), validate=False, engine='json'))
+        compact, compact_ms = _timed(lambda: to_json(fig))
+
+        plain_size = len(plain.encode('utf-8'))
+        compact_size = len(compact.encode('utf-8'))
+        total_plain += plain_size
+        total_compact += compact_size
+
+        n_traces = len(as_figure(fig).data)
+        saving = 100 * (1 - compact_size / plain_size)
+        print(f"{step.metadata.number:>4}  {n_traces:>6}  {plain_size:>9,}  {compact_size:>9,}  "
+              f"{saving:>5.1f}%  {plain_ms:>7.1f}  {compact_ms:>7.1f}")
+
+    saving = 100 * (1 - total_compact / total_plain)
+    print(f"{'Σ':>4}  {'':>6}  {total_plain:>9,}  {total_compact:>9,}  {saving:>5.1f}%")
+
+
+if __name__ == '__main__':
+    main()
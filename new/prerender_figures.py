@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Předrenderování Plotly figur všech kroků při buildu.
+Build-time prerendering of every step's Plotly figure.
+
+Pro každý zaregistrovaný krok vykreslí figuru s výchozím nastavením
+zobrazení (DISPLAY_DEFAULTS) a uloží ji jako gzip JSON s hashem obsahu
+v názvu do verzované složky (viz views/prerendered.py). app.py pak při
+výchozím nastavení servíruje tyto soubory a živě vykresluje jen při
+změně nastavení v sidebaru.
+
+Spuštění / Usage:
+    cd new/
+    python prerender_figures.py
+    python prerender_figures.py --outdir /tmp/prerendered
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+
+from config.settings import DISPLAY_DEFAULTS
+
+# Kroky čtou st.session_state -> mock s výchozím nastavením (před importem kroků)
+from utils.headless import install_streamlit_mock
+install_streamlit_mock(dict(DISPLAY_DEFAULTS, current_step=0))
+
+from steps.catalog import register_all_steps
+from steps.step_registry import StepRegistry
+from views.payload import to_json
+from views.prerendered import artifact_dir, write_artifacts
+
+
+def render_all(registry: StepRegistry):
+    """Vykreslí a serializuje figury všech kroků (generátor dvojic číslo, JSON)"""
+    for step in registry.get_all_steps():
+        start = time.perf_counter()
+        fig_json = to_json(step.render_plotly_diagram())
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  Krok {step.metadata.number:>2}: {len(fig_json):>9,} B  "
+              f"{elapsed:6.1f} ms  {step.metadata.short_name}")
+        yield step.metadata.number, fig_json
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Prerender default-settings Plotly figures for all tutorial steps.'
+    )
+    parser.add_argument('--outdir', type=str, default=None,
+                        help='Artifact root folder (default: PRERENDERED["dir"] in config/settings.py)')
+    args = parser.parse_args()
+
+    outdir = artifact_dir(Path(args.outdir) if args.outdir else None)
+    print(f"📦 Předrenderování figur -> {outdir}")
+
+    registry = register_all_steps(StepRegistry())
+    manifest = write_artifacts(render_all(registry), outdir)
+
+    size = sum((outdir / name).stat().st_size for name in manifest['files'].values())
+    print(f"✓ {len(manifest['files'])} figur, {size:,} B gzip "
+          f"(otisk {manifest['fingerprint']})")
+
+
+if __name__ == '__main__':
+    main()
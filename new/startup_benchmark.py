@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Měření doby startu (importu) aplikace a CLI nástrojů.
+Startup (import) time benchmark for the app and the CLI tools.
+
+Každý cíl se importuje v novém procesu (studený interpret, žádná sdílená
+cache modulů). Sloupec "eager mpl" simuluje dřívější stav, kdy kroky
+načítaly matplotlib (legacy backend) hned při importu - rozdíl je úspora
+z líného načítání.
+
+Spuštění / Usage:
+    cd new/
+    python startup_benchmark.py
+    python startup_benchmark.py --runs 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+
+# Cíl -> modul, jehož import se měří (main() se u CLI nástrojů nespouští)
+TARGETS = {
+    'app.py': 'app',
+    'generate_animations.py': 'generate_animations',
+    'prerender_figures.py': 'prerender_figures',
+    'payload_report.py': 'payload_report',
+}
+
+_EAGER_MATPLOTLIB = 'import matplotlib.pyplot, matplotlib.figure\n'
+
+_PROBE = '''
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{preload}import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, 'matplotlib' in sys.modules)
+'''
+
+
+def measure(module: str, eager_matplotlib: bool = False) -> tuple:
+    """
+    Změří import modulu v novém procesu
+
+    Args:
+        module: Jméno modulu (např. 'app')
+        eager_matplotlib: Načíst před modulem i matplotlib (dřívější stav)
+
+    Returns:
+        (doba importu v ms, zda je matplotlib načtený)
+    """
+    code = _PROBE.format(
+        root=str(_HERE), module=module,
+        preload=_EAGER_MATPLOTLIB if eager_matplotlib else ''
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=_HERE,
+        capture_output=True, text=True, check=True
+    )
+    elapsed, loaded = result.stdout.split()[-2:]
+    return float(elapsed) * 1000, loaded == 'True'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure cold import time of the app and CLI tools.'
+    )
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Fresh processes per target (default: 5, median is reported)')
+    args = parser.parse_args()
+
+    print(f"{'cíl':<24}  {'ms':>7}  {'eager mpl':>9}  {'úspora':>7}  matplotlib")
+    for name, module in TARGETS.items():
+        lazy = [measure(module) for _ in range(args.runs)]
+        eager = [measure(module, eager_matplotlib=True)[0] for _ in range(args.runs)]
+        lazy_ms = statistics.median(ms for ms, _ in lazy)
+        eager_ms = statistics.median(eager)
+        loaded = 'ano' if lazy[0][1] else 'ne'
+        print(f"{name:<24}  {lazy_ms:>7.0f}  {eager_ms:>9.0f}  "
+              f"{eager_ms - lazy_ms:>7.0f}  {loaded}")
+
+
+if __name__ == '__main__':
+    main()
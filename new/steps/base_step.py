@@ -2,12 +2,39 @@
 Základní třída pro kroky prezentace
 Base class for presentation steps using Template Method pattern
 """
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional
 import plotly.graph_objects as go
+from views.scene import Scene, compile_matplotlib, compile_plotly
+
+if TYPE_CHECKING:
+    # Jen pro typové anotace - matplotlib (legacy backend) se načítá až při použití
+    from matplotlib.figure import Figure
+
+# Nastavení zobrazení vnucené pro aktuální vlákno (viz display_settings)
+_display_override = threading.local()
+
+
+@contextmanager
+def display_settings(display: Dict[str, Any]) -> Iterator[None]:
+    """
+    Vykreslování v tomto vlákně použije zadané nastavení místo st.session_state
+
+    Pro vykreslení mimo skript Streamlitu (vlákna prefetche), kde
+    st.session_state není k dispozici.
+
+    Args:
+        display: Nastavení zobrazení s klíči z DISPLAY_DEFAULTS
+    """
+    previous = getattr(_display_override, 'value', None)
+    _display_override.value = display
+    try:
+        yield
+    finally:
+        _display_override.value = previous
 
 
 @dataclass
@@ -26,12 +53,16 @@ class Step(ABC):
     Každý krok musí implementovat:
     - get_metadata(): metadata o kroku
     - get_description(): popisný text v češtině
+
+    a buď build_scene() (popis scény, ze kterého se vykreslí oba backendy),
+    nebo přímo:
     - render_diagram(): vykreslení matplotlib diagramu (legacy)
     - render_plotly_diagram(): vykreslení interaktivního Plotly diagramu
     """
 
     def __init__(self):
         self._metadata: Optional[StepMetadata] = None
+        self._scene: Optional[Scene] = None
 
     @property
     def metadata(self) -> StepMetadata:
@@ -45,11 +76,24 @@ class Step(ABC):
         """
         Vrátí metadata o kroku
 
+        Nesmí záviset na stavu z __init__ - registry je čte i bez
+        vytvoření instance (viz class_metadata).
+
         Returns:
             StepMetadata s informacemi o kroku
         """
         pass
 
+    @classmethod
+    def class_metadata(cls) -> StepMetadata:
+        """
+        Vrátí metadata kroku bez spuštění __init__ (bez předvýpočtu geometrie)
+
+        Returns:
+            StepMetadata s informacemi o kroku
+        """
+        return cls.__new__(cls).get_metadata()
+
     @abstractmethod
     def get_description(self) -> str:
         """
@@ -60,8 +104,69 @@ class Step(ABC):
         """
         pass
 
-    @abstractmethod
-    def render_diagram(self, fig: Figure, ax) -> None:
+    def build_scene(self) -> Optional[Scene]:
+        """
+        Sestaví popis scény nezávislý na backendu (volitelné přepsání)
+
+        Volá se jen jednou, výsledek se cachuje v self.scene. Kroky
+        s vlastním render_diagram() a render_plotly_diagram() ji
+        nepřepisují a scénu nemají.
+
+        Returns:
+            Scene se skupinami bodů, hran a stěn, nebo None (krok bez scény)
+        """
+        return None
+
+    @property
+    def scene(self) -> Optional[Scene]:
+        """Vrátí popis scény (lazy loading), None u kroků bez scény"""
+        if self._scene is None:
+            self._scene = self.build_scene()
+        return self._scene
+
+    def _require_scene(self) -> Scene:
+        """Scéna pro výchozí vykreslení - krok bez scény musí vykreslovat sám"""
+        scene = self.scene
+        if scene is None:
+            raise TypeError(
+                f"{self.__class__.__name__} nemá scénu: přepiš build_scene() "
+                f"nebo render_diagram() a render_plotly_diagram()"
+            )
+        return scene
+
+    @property
+    def restylable(self) -> bool:
+        """
+        Dá se změna stylu ze sidebaru provést jen přepsáním vlastností traců?
+
+        Platí pro kroky se scénou (build_scene) - jejich trace nesou vazby
+        na nastavení (viz views/restyle.py). Kroky s vlastním
+        render_plotly_diagram se po změně nastavení vykreslí znovu.
+        """
+        return type(self).render_plotly_diagram is Step.render_plotly_diagram
+
+    def get_display_settings(self) -> Dict[str, Any]:
+        """
+        Vrátí nastavení zobrazení ze sidebaru (st.session_state)
+
+        Kroky čtou nastavení jen přes tuto metodu, aby šly vykreslit
+        i mimo skript (viz display_settings).
+
+        Returns:
+            Dictionary s klíči z DISPLAY_DEFAULTS
+        """
+        override = getattr(_display_override, 'value', None)
+        if override is not None:
+            return dict(override)
+
+        import streamlit as st
+        from config.settings import DISPLAY_DEFAULTS
+        return {
+            key: st.session_state.get(key, default)
+            for key, default in DISPLAY_DEFAULTS.items()
+        }
+
+    def render_diagram(self, fig: 'Figure', ax) -> None:
         """
         Vykreslí 3D diagram pro tento krok (matplotlib - legacy)
 
@@ -69,17 +174,19 @@ class Step(ABC):
             fig: Matplotlib Figure instance
             ax: Matplotlib 3D Axes instance
         """
-        pass
+        self.setup_axes(ax)
+        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
+        compile_matplotlib(self._require_scene(), ax, self.get_display_settings())
 
-    @abstractmethod
     def render_plotly_diagram(self) -> go.Figure:
         """
         Vykreslí interaktivní 3D diagram pomocí Plotly
 
         Returns:
             Plotly Figure instance s interaktivním 3D diagramem
+            (kroky používající PlotlyRenderer3D mohou vrátit FastFigure)
         """
-        pass
+        return compile_plotly(self._require_scene(), self.get_display_settings())
 
     def get_render_config(self) -> Dict[str, Any]:
         """
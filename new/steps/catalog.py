@@ -0,0 +1,114 @@
+"""
+Seznam všech kroků tutoriálu v pořadí prezentace
+Catalog of all tutorial steps in presentation order
+
+Sdílí ho Streamlit aplikace i build nástroje (prerender_figures.py),
+takže "zaregistrované kroky" jsou všude stejné.
+"""
+from steps.step_registry import StepRegistry
+from utils.source_hash import source_digest
+from steps.definitions.intro import IntroStep
+from steps.definitions.tetrahedron import (
+    TetraStep1_Cube,
+    TetraStep2_Selection,
+    TetraStep3_Complete
+)
+from steps.definitions.octahedron import (
+    OctaStep1_Axes,
+    OctaStep2_Complete
+)
+from steps.definitions.icosahedron import (
+    IcosaStep1_Rectangle,
+    IcosaStep2_ThreeRectangles,
+    IcosaStep3_Complete
+)
+from steps.definitions.dodecahedron import (
+    DodecaStep1_Cube,
+    DodecaStep2_GoldenRectangles,
+    DodecaStep3_Complete
+)
+from steps.definitions.duality_cube_octahedron import DualityCubeOctahedron
+from steps.definitions.duality_nested_octahedra import DualityNestedOctahedra
+from steps.definitions.duality_icosahedron_dodecahedron import DualityIcosahedronDodecahedron
+from steps.definitions.duality_tetrahedron_self import DualityTetrahedronSelf
+from steps.definitions.bonus import BonusStep_TriangleCenter
+from steps.definitions.bonus_why_five import BonusStep_WhyOnlyFive
+from steps.definitions.bonus_why_five_18a import BonusStep_WhyFive_18A
+from steps.definitions.bonus_why_five_18b import BonusStep_WhyFive_18B
+from steps.definitions.bonus_why_five_18c import BonusStep_WhyFive_18C
+from steps.definitions.bonus_why_five_18d import BonusStep_WhyFive_18D
+
+# Kód, na kterém závisí kroky a jejich figury (pro source_fingerprint)
+_SOURCE_DIRS = ('steps', 'models', 'views')
+
+STEP_CLASSES = [
+    # Úvod
+    IntroStep,
+
+    # Čtyřstěn (Tetrahedron)
+    TetraStep1_Cube,
+    TetraStep2_Selection,
+    TetraStep3_Complete,
+
+    # Osmistěn (Octahedron)
+    OctaStep1_Axes,
+    OctaStep2_Complete,
+
+    # Dvacetistěn (Icosahedron)
+    IcosaStep1_Rectangle,
+    IcosaStep2_ThreeRectangles,
+    IcosaStep3_Complete,
+
+    # Dvanáctistěn (Dodecahedron)
+    DodecaStep1_Cube,
+    DodecaStep2_GoldenRectangles,
+    DodecaStep3_Complete,
+
+    # Dualita (Duality)
+    DualityCubeOctahedron,
+    DualityNestedOctahedra,
+    DualityIcosahedronDodecahedron,
+    DualityTetrahedronSelf,
+
+    # Bonus
+    BonusStep_TriangleCenter,
+    BonusStep_WhyOnlyFive,
+    BonusStep_WhyFive_18A,
+    BonusStep_WhyFive_18B,
+    BonusStep_WhyFive_18C,
+    BonusStep_WhyFive_18D,
+]
+
+
+def register_all_steps(registry: StepRegistry = None) -> StepRegistry:
+    """
+    Zaregistruje všechny kroky do registry (lazy, viz StepRegistry.register_class)
+
+    Args:
+        registry: Cílová prázdná registry (výchozí = nová, StepRegistry.fresh)
+
+    Returns:
+        Naplněná registry
+    """
+    if registry is None:
+        registry = StepRegistry.fresh()
+
+    # Jen metadata + třída - instance (a výpočet geometrie) až při zobrazení
+    for step_class in STEP_CLASSES:
+        registry.register_class(step_class)
+
+    return registry
+
+
+def source_fingerprint() -> str:
+    """
+    Otisk obsahu zdrojáků kroků, modelů a views
+
+    Slouží jako klíč cache registry - při vývoji se po úpravě kroku,
+    geometrie nebo rendereru registry sestaví znovu, jinak se použije
+    hotový snapshot. Počítá se z obsahu souborů, ne z časů změn.
+
+    Returns:
+        Hex otisk (utils/source_hash.py)
+    """
+    return source_digest(_SOURCE_DIRS)
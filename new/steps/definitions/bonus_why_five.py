@@ -2,14 +2,17 @@
 Bonusový krok - proč existuje pouze 5 Platónských těles
 Bonus step - proof of why only 5 Platonic solids exist
 """
+from typing import TYPE_CHECKING
 import numpy as np
-from matplotlib.figure import Figure
 import plotly.graph_objects as go
 import streamlit as st
 from steps.base_step import Step, StepMetadata
 from views.renderer import Renderer3D
 from views.plotly_renderer import PlotlyRenderer3D
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 class BonusStep_WhyOnlyFive(Step):
     """Bonus: Proč existuje pouze 5 Platónských těles?"""
@@ -117,7 +120,7 @@ Toto je **úplný důkaz**! Nemusíme zkoušet všechny možnosti -
 Proto staří Řekové považovali těchto 5 těles za **dokonalá** a **posvátná**!
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
+    def render_diagram(self, fig: 'Figure', ax) -> None:
         """Vykreslení vizualizace úhlů (matplotlib - legacy)"""
         self.setup_axes(ax)
         ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
@@ -2,13 +2,15 @@
 Step 21 (18d): Důkaz pomocí úhlů - 3D vizualizace vrcholu
 Bonus step showing 3D visualization of faces meeting at a vertex
 """
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 import numpy as np
 import plotly.graph_objects as go
-from matplotlib.figure import Figure
 
 from steps.base_step import Step, StepMetadata
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 class BonusStep_WhyFive_18D(Step):
     """Step 21 (18d): 3D vizualizace - Jak se stýkají stěny ve vrcholu"""
@@ -37,7 +39,7 @@ Tato 3D vizualizace ukazuje:
 - **Červená:** Nemožná konfigurace (>360°) → stěny se překrývají!
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
+    def render_diagram(self, fig: 'Figure', ax) -> None:
         """Vykreslení (matplotlib - legacy, pouze placeholder)"""
         self.setup_axes(ax)
         ax.set_title(self.get_metadata().title, fontsize=14, fontweight='bold')
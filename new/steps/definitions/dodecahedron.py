@@ -3,13 +3,10 @@ Kroky pro konstrukci dvanáctistěnu
 Dodecahedron construction steps
 """
 import numpy as np
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
-import streamlit as st
 from steps.base_step import Step, StepMetadata
-from views.renderer import Renderer3D
-from views.plotly_renderer import PlotlyRenderer3D
+from views.scene import Scene, PointGroup, EdgeGroup, FaceGroup
 from config.settings import PHI
+from models.solids import cube_edges, cube_vertices, dodecahedron_vertices, freeze_indices
 
 
 class DodecaStep1_Cube(Step):
@@ -18,14 +15,8 @@ class DodecaStep1_Cube(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy krychle
-        self.cube_vertices = np.array([
-            [-1, -1, -1], [-1, -1,  1], [-1,  1, -1], [-1,  1,  1],
-            [ 1, -1, -1], [ 1, -1,  1], [ 1,  1, -1], [ 1,  1,  1]
-        ])
-        self.cube_edges = [
-            (0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3),
-            (2, 6), (3, 7), (4, 5), (4, 6), (5, 7), (6, 7)
-        ]
+        self.cube_vertices = cube_vertices()
+        self.cube_edges = cube_edges()
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -64,27 +55,15 @@ To znamená, že potřebujeme přidat **ještě 12 vrcholů** k těmto 8.
 ➡️ **Další krok ukáže, jak získat dalších 12 vrcholů!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení krychle (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        Renderer3D.draw_edges(ax, self.cube_vertices, self.cube_edges,
-                             color='orange', width=2)
-        labels = [str(i+1) for i in range(8)]
-        Renderer3D.draw_points(ax, self.cube_vertices, colors='orange',
-                              sizes=120, labels=labels)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení krychle (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-        fig = PlotlyRenderer3D.add_edges(fig, self.cube_vertices, self.cube_edges,
-                                         color='orange', width=3)
+    def build_scene(self) -> Scene:
+        """Krychle - hrany a očíslované vrcholy"""
         labels = [str(i+1) for i in range(8)]
-        fig = PlotlyRenderer3D.add_points(fig, self.cube_vertices, colors='orange',
-                                          sizes=12, labels=labels)
-        return fig
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            edges=[EdgeGroup(self.cube_vertices, self.cube_edges, color='orange', width=3)],
+            points=[PointGroup(self.cube_vertices, colors='orange', sizes=12, labels=labels)]
+        )
 
 
 class DodecaStep2_GoldenRectangles(Step):
@@ -92,27 +71,12 @@ class DodecaStep2_GoldenRectangles(Step):
 
     def __init__(self):
         super().__init__()
-        # Vytvoř všech 20 vrcholů dvanáctistěnu
-        dodeca_vertices = []
-        # 8 vrcholů krychle (indices 0-7)
-        for i in [-1, 1]:
-            for j in [-1, 1]:
-                for k in [-1, 1]:
-                    dodeca_vertices.append([i, j, k])
-        # 12 vrcholů ze zlatých obdélníků
-        for coords in [
-            [0, 1/PHI, PHI], [0, 1/PHI, -PHI], [0, -1/PHI, PHI], [0, -1/PHI, -PHI],  # 8-11: YZ (red)
-            [1/PHI, PHI, 0], [1/PHI, -PHI, 0], [-1/PHI, PHI, 0], [-1/PHI, -PHI, 0],  # 12-15: XY (green)
-            [PHI, 0, 1/PHI], [PHI, 0, -1/PHI], [-PHI, 0, 1/PHI], [-PHI, 0, -1/PHI]  # 16-19: ZX (blue)
-        ]:
-            dodeca_vertices.append(coords)
-        self.dodeca_vertices = np.array(dodeca_vertices)
+        # Všech 20 vrcholů dvanáctistěnu: 0-7 krychle, 8-11 YZ (red),
+        # 12-15 XY (green), 16-19 ZX (blue) - sdílené, jen pro čtení
+        self.dodeca_vertices = dodecahedron_vertices()
 
         # Hrany krychle (indices 0-7)
-        self.cube_edges = [
-            (0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3),
-            (2, 6), (3, 7), (4, 5), (4, 6), (5, 7), (6, 7)
-        ]
+        self.cube_edges = cube_edges()
 
         # Tři zlaté obdélníky
         self.rectangles = [
@@ -168,85 +132,35 @@ Podobně jako u dvacetistěnu, použijeme **zlatý řez φ = {PHI:.3f}**
 ➡️ **Další krok spojí body do hotového dvanáctistěnu!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení všech vrcholů (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany krychle (oranžová)
-        Renderer3D.draw_edges(
-            ax, self.dodeca_vertices, self.cube_edges,
-            color='orange', width=2
-        )
-
-        # Nakresli obdélníky
+    def build_scene(self) -> Scene:
+        """Krychle a tři zlaté obdélníky"""
         rect_colors = ['red', 'green', 'blue']
-        for rect_idx, color in zip(self.rectangles, rect_colors):
-            edges = [
-                (rect_idx[0], rect_idx[1]),
-                (rect_idx[1], rect_idx[2]),
-                (rect_idx[2], rect_idx[3]),
-                (rect_idx[3], rect_idx[0])
-            ]
-            for edge in edges:
-                Renderer3D.draw_edge(
-                    ax,
-                    self.dodeca_vertices[edge[0]],
-                    self.dodeca_vertices[edge[1]],
-                    color=color, width=2
-                )
-
-        # Nakresli vrcholy
-        colors_vertices = ['orange']*8 + ['red']*4 + ['green']*4 + ['blue']*4
-        for v, color in zip(self.dodeca_vertices, colors_vertices):
-            Renderer3D.draw_point(ax, v, color=color, size=100)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení všech vrcholů (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěny obdélníků, pokud je to zapnuté
-        if st.session_state.get('show_faces', False):
-            opacity = st.session_state.get('face_opacity', 0.5)
-            rect_colors = ['red', 'green', 'blue']
-
-            for rect_idx, color in zip(self.rectangles, rect_colors):
-                # Čtyřúhelník - použij indexy přímo
-                face = [rect_idx[0], rect_idx[1], rect_idx[2], rect_idx[3]]
-                fig = PlotlyRenderer3D.add_face(
-                    fig, self.dodeca_vertices, face,
-                    color=color, opacity=opacity
-                )
-
-        # Nakresli hrany krychle (oranžová)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.dodeca_vertices, self.cube_edges,
-            color='orange', width=3
-        )
 
-        # Nakresli hrany obdélníků
-        rect_colors = ['red', 'green', 'blue']
+        # Hrany obdélníků (jeden trace na barvu)
+        rect_edges, rect_edge_colors = [], []
         for rect_idx, color in zip(self.rectangles, rect_colors):
-            edges = [
+            rect_edges += [
                 (rect_idx[0], rect_idx[1]),
                 (rect_idx[1], rect_idx[2]),
                 (rect_idx[2], rect_idx[3]),
                 (rect_idx[3], rect_idx[0])
             ]
-            for edge in edges:
-                fig = PlotlyRenderer3D.add_edge(
-                    fig,
-                    self.dodeca_vertices[edge[0]],
-                    self.dodeca_vertices[edge[1]],
-                    color=color, width=3
-                )
-
-        # Nakresli vrcholy
+            rect_edge_colors += [color] * 4
+
         colors_vertices = ['orange']*8 + ['red']*4 + ['green']*4 + ['blue']*4
-        for v, color in zip(self.dodeca_vertices, colors_vertices):
-            fig = PlotlyRenderer3D.add_point(fig, v, color=color, size=10, show_label=False)
-        return fig
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěny obdélníků - barva na stěnu, průhlednost ze sidebaru
+            faces=[FaceGroup(self.dodeca_vertices, [list(r) for r in self.rectangles],
+                             color=rect_colors)],
+            edges=[
+                EdgeGroup(self.dodeca_vertices, self.cube_edges, color='orange', width=3),
+                EdgeGroup(self.dodeca_vertices, rect_edges, color=rect_edge_colors, width=3),
+            ],
+            points=[PointGroup(self.dodeca_vertices, colors=colors_vertices, sizes=10,
+                               show_labels=False)]
+        )
 
 
 class DodecaStep3_Complete(Step):
@@ -254,19 +168,8 @@ class DodecaStep3_Complete(Step):
 
     def __init__(self):
         super().__init__()
-        # Všech 20 vrcholů
-        dodeca_vertices = []
-        for i in [-1, 1]:
-            for j in [-1, 1]:
-                for k in [-1, 1]:
-                    dodeca_vertices.append([i, j, k])
-        for coords in [
-            [0, 1/PHI, PHI], [0, 1/PHI, -PHI], [0, -1/PHI, PHI], [0, -1/PHI, -PHI],
-            [1/PHI, PHI, 0], [1/PHI, -PHI, 0], [-1/PHI, PHI, 0], [-1/PHI, -PHI, 0],
-            [PHI, 0, 1/PHI], [PHI, 0, -1/PHI], [-PHI, 0, 1/PHI], [-PHI, 0, -1/PHI]
-        ]:
-            dodeca_vertices.append(coords)
-        self.dodeca_vertices = np.array(dodeca_vertices)
+        # Všech 20 vrcholů (sdílené, jen pro čtení)
+        self.dodeca_vertices = dodecahedron_vertices()
 
         # Najdi hrany (body ve vzdálenosti 2/φ)
         sample_edges = []
@@ -275,11 +178,11 @@ class DodecaStep3_Complete(Step):
                 dist = np.linalg.norm(self.dodeca_vertices[i] - self.dodeca_vertices[j])
                 if 1.1 < dist < 1.3:
                     sample_edges.append((i, j))
-        self.sample_edges = sample_edges[:30]
+        self.sample_edges = freeze_indices(sample_edges[:30])
 
         # 12 pětiúhelníkových stěn dvanáctistěnu
         # Najdeme je dynamicky na základě grafu hran
-        self.dodeca_faces = self._find_pentagonal_faces()
+        self.dodeca_faces = freeze_indices(self._find_pentagonal_faces())
 
     def _sort_pentagon_vertices(self, pentagon_indices):
         """Seřadí vrcholy pětiúhelníku do správného kruhového pořadí"""
@@ -424,39 +327,17 @@ d = 2/φ ≈ {2/PHI:.3f}
 ✨ **Gratuluji! Zkonstruoval jsi všechna 5 Platónských těles!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení hotového dvanáctistěnu (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        Renderer3D.draw_edges(ax, self.dodeca_vertices, self.sample_edges,
-                             color='green', width=2)
-
+    def build_scene(self) -> Scene:
+        """Hotový dvanáctistěn - stěny, hrany a vrcholy"""
         # Vertex colors matching Step 2: orange cube + red/green/blue rectangles
         colors_vertices = ['orange']*8 + ['red']*4 + ['green']*4 + ['blue']*4
-        for v, color in zip(self.dodeca_vertices, colors_vertices):
-            Renderer3D.draw_point(ax, v, color=color, size=100)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení hotového dvanáctistěnu (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěny, pokud je to zapnuté - fixed blue color at 0.3 opacity
-        if st.session_state.get('show_faces', False):
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.dodeca_vertices, self.dodeca_faces,
-                color='blue', opacity=0.3
-            )
-
-        # Nakresli hrany
-        edge_width = st.session_state.get('edge_width', 2)
-        fig = PlotlyRenderer3D.add_edges(fig, self.dodeca_vertices, self.sample_edges,
-                                         color='green', width=edge_width)
-
-        # Nakresli vrcholy - colors matching Step 2: orange cube + red/green/blue rectangles
-        vertex_size = st.session_state.get('vertex_size', 10)
-        colors_vertices = ['orange']*8 + ['red']*4 + ['green']*4 + ['blue']*4
-        for v, color in zip(self.dodeca_vertices, colors_vertices):
-            fig = PlotlyRenderer3D.add_point(fig, v, color=color, size=vertex_size, show_label=False)
-        return fig
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěny - fixed blue color at 0.3 opacity
+            faces=[FaceGroup(self.dodeca_vertices, self.dodeca_faces,
+                             color='blue', opacity=0.3)],
+            edges=[EdgeGroup(self.dodeca_vertices, self.sample_edges, color='green')],
+            points=[PointGroup(self.dodeca_vertices, colors=colors_vertices,
+                               show_labels=False)]
+        )
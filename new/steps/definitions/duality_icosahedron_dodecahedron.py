@@ -3,13 +3,12 @@ Dualita: Dvacetistěn a Dvanáctistěn
 Duality: Icosahedron and Dodecahedron
 """
 import numpy as np
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
-import streamlit as st
 from steps.base_step import Step, StepMetadata
-from views.renderer import Renderer3D
-from views.plotly_renderer import PlotlyRenderer3D
-from config.settings import PHI
+from views.scene import Scene, PointGroup, EdgeGroup, FaceGroup
+from models.solids import (
+    freeze_array, freeze_indices, icosahedron_edges, icosahedron_faces,
+    icosahedron_vertices
+)
 
 
 class DualityIcosahedronDodecahedron(Step):
@@ -19,50 +18,15 @@ class DualityIcosahedronDodecahedron(Step):
         super().__init__()
 
         # VNĚJŠÍ DVACETISTĚN (vrcholy A-L)
-        self.icosa_vertices = np.array([
-            # Obdélník v rovině YZ
-            [ 0,  1,  PHI],  # 0 = A
-            [ 0,  1, -PHI],  # 1 = B
-            [ 0, -1,  PHI],  # 2 = C
-            [ 0, -1, -PHI],  # 3 = D
-
-            # Obdélník v rovině XZ
-            [ 1,  PHI,  0],  # 4 = E
-            [ 1, -PHI,  0],  # 5 = F
-            [-1,  PHI,  0],  # 6 = G
-            [-1, -PHI,  0],  # 7 = H
-
-            # Obdélník v rovině XY
-            [ PHI,  0,  1],  # 8 = I
-            [ PHI,  0, -1],  # 9 = J
-            [-PHI,  0,  1],  # 10 = K
-            [-PHI,  0, -1]   # 11 = L
-        ])
+        # Obdélníky v rovinách YZ (A-D), XZ (E-H) a XY (I-L)
+        self.icosa_vertices = icosahedron_vertices()
 
         self.icosa_labels = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L']
 
-        # Stěny dvacetistěnu (20 trojúhelníků)
-        self.icosa_faces = [
-            # Horní čepice
-            [0, 8, 4], [0, 4, 6], [0, 6, 10], [0, 10, 2], [0, 2, 8],
-
-            # Horní pás
-            [8, 2, 5], [2, 10, 7], [10, 6, 11], [6, 4, 1], [4, 8, 9],
-
-            # Spodní pás
-            [5, 2, 7], [7, 10, 11], [11, 6, 1], [1, 4, 9], [9, 8, 5],
-
-            # Spodní čepice
-            [3, 5, 7], [3, 7, 11], [3, 11, 1], [3, 1, 9], [3, 9, 5]
-        ]
-
-        # Hrany dvacetistěnu
-        edges_set = set()
-        for face in self.icosa_faces:
-            for i in range(3):
-                edge = tuple(sorted([face[i], face[(i+1)%3]]))
-                edges_set.add(edge)
-        self.icosa_edges = list(edges_set)
+        # Stěny dvacetistěnu (20 trojúhelníků: horní čepice, horní pás,
+        # spodní pás, spodní čepice) a hrany ze stěn
+        self.icosa_faces = icosahedron_faces()
+        self.icosa_edges = icosahedron_edges()
 
         # VEPSANÝ DVANÁCTISTĚN (vrcholy 0-19)
         # Vrcholy dvanáctistěnu jsou ve středech stěn dvacetistěnu
@@ -78,7 +42,7 @@ class DualityIcosahedronDodecahedron(Step):
             center = triangle_center(v1, v2, v3)
             self.dodeca_vertices.append(center)
 
-        self.dodeca_vertices = np.array(self.dodeca_vertices)
+        self.dodeca_vertices = freeze_array(self.dodeca_vertices)
 
         # Najdi stěny dvanáctistěnu (12 pětiúhelníků)
         def find_dodecahedron_faces(icosa_faces, icosa_vertices_count):
@@ -132,7 +96,8 @@ class DualityIcosahedronDodecahedron(Step):
             for i in range(len(face)):
                 edge = tuple(sorted([face[i], face[(i+1) % len(face)]]))
                 edges_dodeca_set.add(edge)
-        self.dodeca_edges = list(edges_dodeca_set)
+        self.dodeca_faces = freeze_indices(self.dodeca_faces)
+        self.dodeca_edges = tuple(edges_dodeca_set)
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -199,76 +164,26 @@ Dvacetistěn a dvanáctistěn tvoří **duální pár** - nejvíce komplexní ze
 ✨ **Gratuluji! Prozkoumal jsi všechny duality Platónských těles!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení dvacetistěnu a dvanáctistěnu (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany dvacetistěnu (oranžová)
-        Renderer3D.draw_edges(
-            ax, self.icosa_vertices, self.icosa_edges,
-            color='orange', width=2
-        )
-
-        # Nakresli hrany dvanáctistěnu (červená)
-        Renderer3D.draw_edges(
-            ax, self.dodeca_vertices, self.dodeca_edges,
-            color='red', width=2.5
+    def build_scene(self) -> Scene:
+        """Dvacetistěn a dvanáctistěn - stěny, hrany a vrcholy obou těles"""
+        dodeca_labels = [str(i) for i in range(len(self.dodeca_vertices))]
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            faces=[
+                # Dvacetistěn - oranžová velmi průhledná
+                FaceGroup(self.icosa_vertices, self.icosa_faces,
+                          color='orange', opacity_scale=0.3),
+                # Dvanáctistěn - červená
+                FaceGroup(self.dodeca_vertices, self.dodeca_faces, color='red'),
+            ],
+            edges=[
+                EdgeGroup(self.icosa_vertices, self.icosa_edges, color='orange'),
+                EdgeGroup(self.dodeca_vertices, self.dodeca_edges, color='red'),
+            ],
+            points=[
+                PointGroup(self.icosa_vertices, colors='orange', labels=self.icosa_labels),
+                PointGroup(self.dodeca_vertices, colors='red', size_scale=0.8,
+                           labels=dodeca_labels),
+            ]
         )
-
-        # Nakresli vrcholy dvacetistěnu (oranžová)
-        for v, label in zip(self.icosa_vertices, self.icosa_labels):
-            Renderer3D.draw_point(ax, v, color='orange', size=150, label=label)
-
-        # Nakresli vrcholy dvanáctistěnu (červená)
-        for i, v in enumerate(self.dodeca_vertices):
-            Renderer3D.draw_point(ax, v, color='red', size=120, label=str(i))
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení dvacetistěnu a dvanáctistěnu (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěny, pokud je to zapnuté
-        if st.session_state.get('show_faces', False):
-            opacity = st.session_state.get('face_opacity', 0.5)
-
-            # Dvacetistěn - oranžová velmi průhledná
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.icosa_vertices, self.icosa_faces,
-                color='orange', opacity=opacity * 0.3
-            )
-
-            # Dvanáctistěn - červená
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.dodeca_vertices, self.dodeca_faces,
-                color='red', opacity=opacity
-            )
-
-        # Nakresli hrany dvacetistěnu (oranžová)
-        edge_width = st.session_state.get('edge_width', 3)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.icosa_vertices, self.icosa_edges,
-            color='orange', width=edge_width
-        )
-
-        # Nakresli hrany dvanáctistěnu (červená)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.dodeca_vertices, self.dodeca_edges,
-            color='red', width=edge_width
-        )
-
-        # Nakresli vrcholy dvacetistěnu (oranžová)
-        vertex_size = st.session_state.get('vertex_size', 12)
-        for v, label in zip(self.icosa_vertices, self.icosa_labels):
-            fig = PlotlyRenderer3D.add_point(
-                fig, v, color='orange', size=vertex_size, label=label
-            )
-
-        # Nakresli vrcholy dvanáctistěnu (červená)
-        for i, v in enumerate(self.dodeca_vertices):
-            fig = PlotlyRenderer3D.add_point(
-                fig, v, color='red', size=vertex_size * 0.8, label=str(i)
-            )
-
-        return fig
@@ -3,12 +3,9 @@ Vnořené osmistěny a krychle
 Nested Octahedra and Cube
 """
 import numpy as np
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
-import streamlit as st
 from steps.base_step import Step, StepMetadata
-from views.renderer import Renderer3D
-from views.plotly_renderer import PlotlyRenderer3D
+from views.scene import Scene, PointGroup, EdgeGroup, FaceGroup
+from models.solids import freeze_array, freeze_indices, octahedron_faces, octahedron_vertices
 
 
 class DualityNestedOctahedra(Step):
@@ -18,23 +15,13 @@ class DualityNestedOctahedra(Step):
         super().__init__()
 
         # VNĚJŠÍ OSMISTĚN (vrcholy 1-6, největší)
-        scale = 2
-        self.outer_octa_vertices = np.array([
-            [ scale,  0,  0],  # 1: +X
-            [-scale,  0,  0],  # 2: -X
-            [ 0,  scale,  0],  # 3: +Y
-            [ 0, -scale,  0],  # 4: -Y
-            [ 0,  0,  scale],  # 5: +Z
-            [ 0,  0, -scale]   # 6: -Z
-        ])
+        # 1: +X, 2: -X, 3: +Y, 4: -Y, 5: +Z, 6: -Z
+        self.outer_octa_vertices = octahedron_vertices(scale=2)
 
         self.outer_octa_labels = ['1', '2', '3', '4', '5', '6']
 
         # Stěny vnějšího osmistěnu (8 trojúhelníků)
-        self.outer_octa_faces = [
-            [0, 2, 4], [0, 4, 3], [0, 3, 5], [0, 5, 2],
-            [1, 4, 2], [1, 3, 4], [1, 5, 3], [1, 2, 5]
-        ]
+        self.outer_octa_faces = octahedron_faces()
 
         # VEPSANÁ KRYCHLE (vrcholy K-R)
         # Vrcholy krychle jsou ve středech stěn vnějšího osmistěnu
@@ -52,7 +39,7 @@ class DualityNestedOctahedra(Step):
             )
             self.cube_vertices.append(center)
 
-        self.cube_vertices = np.array(self.cube_vertices)
+        self.cube_vertices = freeze_array(self.cube_vertices)
         self.cube_labels = ['K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R']
 
         # Hrany krychle - najdeme na základě sousedních stěn osmistěnu
@@ -66,7 +53,7 @@ class DualityNestedOctahedra(Step):
                         edges.append((i, j))
             return edges
 
-        self.cube_edges = find_cube_edges(self.outer_octa_faces)
+        self.cube_edges = freeze_indices(find_cube_edges(self.outer_octa_faces))
 
         # VNITŘNÍ OSMISTĚN (vrcholy 7-12)
         # Vrcholy vnitřního osmistěnu jsou ve středech stěn krychle
@@ -99,7 +86,7 @@ class DualityNestedOctahedra(Step):
             center = quad_center(centers[0], centers[1], centers[2], centers[3])
             self.inner_octa_vertices.append(center)
 
-        self.inner_octa_vertices = np.array(self.inner_octa_vertices)
+        self.inner_octa_vertices = freeze_array(self.inner_octa_vertices)
         self.inner_octa_labels = ['7', '8', '9', '10', '11', '12']
 
         # Hrany vnitřního osmistěnu
@@ -111,7 +98,7 @@ class DualityNestedOctahedra(Step):
                     self.inner_octa_edges.append((i, j))
 
         # Stěny vnitřního osmistěnu - najdeme je dynamicky
-        self.inner_octa_faces = self._find_octahedron_faces()
+        self.inner_octa_faces = freeze_indices(self._find_octahedron_faces())
 
     def _find_octahedron_faces(self):
         """Najde 8 trojúhelníkových stěn vnitřního osmistěnu na základě hran"""
@@ -220,107 +207,36 @@ Tento diagram ukazuje **trojitou dualitu** - tři tělesa vnořená do sebe:
 ✨ **Tohle je krásný příklad matematické symetrie!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení vnořených osmistěnů (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany vnějšího osmistěnu (oranžová)
+    def build_scene(self) -> Scene:
+        """Vnořené osmistěny a krychle mezi nimi"""
+        # Hrany vnějšího osmistěnu ze stěn
         edges_set = set()
         for face in self.outer_octa_faces:
             for i in range(3):
                 edge = tuple(sorted([face[i], face[(i+1)%3]]))
                 edges_set.add(edge)
         outer_edges = list(edges_set)
-        Renderer3D.draw_edges(
-            ax, self.outer_octa_vertices, outer_edges,
-            color='orange', width=2
-        )
 
-        # Nakresli hrany krychle (zelená)
-        Renderer3D.draw_edges(
-            ax, self.cube_vertices, self.cube_edges,
-            color='green', width=2.5
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2.5, 2.5),
+            faces=[
+                # Vnější osmistěn - oranžová, velmi průhledná
+                FaceGroup(self.outer_octa_vertices, self.outer_octa_faces,
+                          color='orange', opacity_scale=0.4),
+                # Vnitřní osmistěn - modrá
+                FaceGroup(self.inner_octa_vertices, self.inner_octa_faces, color='blue'),
+            ],
+            edges=[
+                EdgeGroup(self.outer_octa_vertices, outer_edges, color='orange'),
+                EdgeGroup(self.cube_vertices, self.cube_edges, color='green'),
+                EdgeGroup(self.inner_octa_vertices, self.inner_octa_edges, color='blue'),
+            ],
+            points=[
+                PointGroup(self.outer_octa_vertices, colors='orange',
+                           labels=self.outer_octa_labels),
+                PointGroup(self.cube_vertices, colors='lime', labels=self.cube_labels),
+                PointGroup(self.inner_octa_vertices, colors='blue',
+                           labels=self.inner_octa_labels),
+            ]
         )
-
-        # Nakresli hrany vnitřního osmistěnu (modrá)
-        Renderer3D.draw_edges(
-            ax, self.inner_octa_vertices, self.inner_octa_edges,
-            color='blue', width=2
-        )
-
-        # Nakresli vrcholy
-        for v, label in zip(self.outer_octa_vertices, self.outer_octa_labels):
-            Renderer3D.draw_point(ax, v, color='orange', size=150, label=label)
-
-        for v, label in zip(self.cube_vertices, self.cube_labels):
-            Renderer3D.draw_point(ax, v, color='lime', size=150, label=label)
-
-        for v, label in zip(self.inner_octa_vertices, self.inner_octa_labels):
-            Renderer3D.draw_point(ax, v, color='blue', size=150, label=label)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení vnořených osmistěnů (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2.5, 2.5))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěny, pokud je to zapnuté
-        if st.session_state.get('show_faces', False):
-            opacity = st.session_state.get('face_opacity', 0.5)
-
-            # Vnější osmistěn - oranžová průhledná
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.outer_octa_vertices, self.outer_octa_faces,
-                color='orange', opacity=opacity * 0.4  # Velmi průhledná
-            )
-
-            # Vnitřní osmistěn - modrá
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.inner_octa_vertices, self.inner_octa_faces,
-                color='blue', opacity=opacity
-            )
-
-        # Nakresli hrany vnějšího osmistěnu (oranžová)
-        edge_width = st.session_state.get('edge_width', 3)
-        edges_set = set()
-        for face in self.outer_octa_faces:
-            for i in range(3):
-                edge = tuple(sorted([face[i], face[(i+1)%3]]))
-                edges_set.add(edge)
-        outer_edges = list(edges_set)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.outer_octa_vertices, outer_edges,
-            color='orange', width=edge_width
-        )
-
-        # Nakresli hrany krychle (zelená)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.cube_vertices, self.cube_edges,
-            color='green', width=edge_width
-        )
-
-        # Nakresli hrany vnitřního osmistěnu (modrá)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.inner_octa_vertices, self.inner_octa_edges,
-            color='blue', width=edge_width
-        )
-
-        # Nakresli vrcholy
-        vertex_size = st.session_state.get('vertex_size', 12)
-
-        for v, label in zip(self.outer_octa_vertices, self.outer_octa_labels):
-            fig = PlotlyRenderer3D.add_point(
-                fig, v, color='orange', size=vertex_size, label=label
-            )
-
-        for v, label in zip(self.cube_vertices, self.cube_labels):
-            fig = PlotlyRenderer3D.add_point(
-                fig, v, color='lime', size=vertex_size, label=label
-            )
-
-        for v, label in zip(self.inner_octa_vertices, self.inner_octa_labels):
-            fig = PlotlyRenderer3D.add_point(
-                fig, v, color='blue', size=vertex_size, label=label
-            )
-
-        return fig
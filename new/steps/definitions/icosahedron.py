@@ -2,14 +2,14 @@
 Kroky pro konstrukci dvacetistěnu
 Icosahedron construction steps
 """
-import numpy as np
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
-import streamlit as st
+from typing import TYPE_CHECKING
 from steps.base_step import Step, StepMetadata
-from views.renderer import Renderer3D
-from views.plotly_renderer import PlotlyRenderer3D
+from views.scene import Scene, PointGroup, EdgeGroup, FaceGroup
 from config.settings import PHI
+from models.solids import icosahedron_edges, icosahedron_faces, icosahedron_vertices
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class IcosaStep1_Rectangle(Step):
@@ -18,11 +18,7 @@ class IcosaStep1_Rectangle(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy dvacetistěnu
-        self.icosa_vertices = np.array([
-            [ 0,  1,  PHI], [ 0,  1, -PHI], [ 0, -1,  PHI], [ 0, -1, -PHI],
-            [ 1,  PHI,  0], [ 1, -PHI,  0], [-1,  PHI,  0], [-1, -PHI,  0],
-            [ PHI,  0,  1], [ PHI,  0, -1], [-PHI,  0,  1], [-PHI,  0, -1]
-        ])
+        self.icosa_vertices = icosahedron_vertices()
         # První obdélník (v rovině YZ)
         self.rect1 = self.icosa_vertices[:4]
         self.rect_edges = [(0,1), (1,3), (3,2), (2,0)]
@@ -83,10 +79,9 @@ Díky těmto vlastnostem můžeme zkonstruovat dokonale pravidelný dvacetistěn
 ➡️ **Další krok ukáže dva další obdélníky!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení prvního obdélníku (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
+    def render_diagram(self, fig: 'Figure', ax) -> None:
+        """Scéna + rovina YZ jako vodítko (matplotlib - legacy)"""
+        super().render_diagram(fig, ax)
 
         # Nakresli rovinu YZ
         y_plane = [-2, 2, 2, -2, -2]
@@ -94,52 +89,18 @@ Díky těmto vlastnostem můžeme zkonstruovat dokonale pravidelný dvacetistěn
         x_plane = [0, 0, 0, 0, 0]
         ax.plot(x_plane, y_plane, z_plane, 'r--', alpha=0.2, linewidth=1)
 
-        # Nakresli hrany obdélníku
-        Renderer3D.draw_edges(
-            ax, self.rect1, self.rect_edges,
-            color='red', width=3
-        )
-
-        # Nakresli vrcholy
+    def build_scene(self) -> Scene:
+        """První obdélník se zlatým řezem"""
         labels = [str(i+1) for i in range(4)]
-        Renderer3D.draw_points(
-            ax, self.rect1,
-            colors='red',
-            sizes=150,
-            labels=labels
-        )
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení prvního obdélníku (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěnu obdélníku, pokud je to zapnuté
-        if st.session_state.get('show_faces', False):
-            # Obdélník: vrcholy 0, 1, 3, 2
-            face = [0, 1, 3, 2]
-            fig = PlotlyRenderer3D.add_face(
-                fig, self.rect1, face,
-                color='red', opacity=0.3
-            )
-
-        # Nakresli hrany obdélníku
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.rect1, self.rect_edges,
-            color='red', width=4
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěna obdélníku: vrcholy 0, 1, 3, 2
+            faces=[FaceGroup(self.rect1, [[0, 1, 3, 2]], color='red', opacity=0.3)],
+            edges=[EdgeGroup(self.rect1, self.rect_edges, color='red', width=4)],
+            points=[PointGroup(self.rect1, colors='red', sizes=15, labels=labels)]
         )
 
-        # Nakresli vrcholy
-        labels = [str(i+1) for i in range(4)]
-        fig = PlotlyRenderer3D.add_points(
-            fig, self.rect1,
-            colors='red',
-            sizes=15,
-            labels=labels
-        )
-
-        return fig
-
 
 class IcosaStep2_ThreeRectangles(Step):
     """Dvacetistěn - Krok 2: Tři kolmé obdélníky"""
@@ -147,11 +108,7 @@ class IcosaStep2_ThreeRectangles(Step):
     def __init__(self):
         super().__init__()
         # Všechny vrcholy dvacetistěnu
-        self.icosa_vertices = np.array([
-            [ 0,  1,  PHI], [ 0,  1, -PHI], [ 0, -1,  PHI], [ 0, -1, -PHI],
-            [ 1,  PHI,  0], [ 1, -PHI,  0], [-1,  PHI,  0], [-1, -PHI,  0],
-            [ PHI,  0,  1], [ PHI,  0, -1], [-PHI,  0,  1], [-PHI,  0, -1]
-        ])
+        self.icosa_vertices = icosahedron_vertices()
 
         # Tři obdélníky
         self.rectangles = [
@@ -212,75 +169,32 @@ Vytvoříme **3 obdélníky** se zlatým řezem, **kolmé na sebe**:
 ➡️ **Další krok spojí tyto vrcholy do hotového dvacetistěnu!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení tří obdélníků (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        colors_rect = ['red']*4 + ['green']*4 + ['blue']*4
-        rect_colors = ['red', 'green', 'blue']
-
-        # Nakresli obdélníky
-        for rect_idx, color in zip(self.rectangles, rect_colors):
-            edges = [
-                (rect_idx[0], rect_idx[1]),
-                (rect_idx[1], rect_idx[2]),
-                (rect_idx[2], rect_idx[3]),
-                (rect_idx[3], rect_idx[0])
-            ]
-            for edge in edges:
-                Renderer3D.draw_edge(
-                    ax,
-                    self.icosa_vertices[edge[0]],
-                    self.icosa_vertices[edge[1]],
-                    color=color, width=2
-                )
-
-        # Nakresli vrcholy
-        for v, color in zip(self.icosa_vertices, colors_rect):
-            Renderer3D.draw_point(ax, v, color=color, size=100)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení tří obdélníků (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
+    def build_scene(self) -> Scene:
+        """Tři navzájem kolmé zlaté obdélníky"""
         colors_rect = ['red']*4 + ['green']*4 + ['blue']*4
         rect_colors = ['red', 'green', 'blue']
 
-        # Nakresli stěny obdélníků, pokud je to zapnuté
-        if st.session_state.get('show_faces', False):
-            opacity = st.session_state.get('face_opacity', 0.5)
-
-            for rect_idx, color in zip(self.rectangles, rect_colors):
-                # Čtyřúhelník - použij indexy přímo
-                face = [rect_idx[0], rect_idx[1], rect_idx[2], rect_idx[3]]
-                fig = PlotlyRenderer3D.add_face(
-                    fig, self.icosa_vertices, face,
-                    color=color, opacity=opacity
-                )
-
-        # Nakresli hrany obdélníků
+        # Hrany obdélníků (jeden trace na barvu)
+        rect_edges, rect_edge_colors = [], []
         for rect_idx, color in zip(self.rectangles, rect_colors):
-            edges = [
+            rect_edges += [
                 (rect_idx[0], rect_idx[1]),
                 (rect_idx[1], rect_idx[2]),
                 (rect_idx[2], rect_idx[3]),
                 (rect_idx[3], rect_idx[0])
             ]
-            for edge in edges:
-                fig = PlotlyRenderer3D.add_edge(
-                    fig,
-                    self.icosa_vertices[edge[0]],
-                    self.icosa_vertices[edge[1]],
-                    color=color, width=3
-                )
-
-        # Nakresli vrcholy
-        for v, color in zip(self.icosa_vertices, colors_rect):
-            fig = PlotlyRenderer3D.add_point(fig, v, color=color, size=10, show_label=False)
-
-        return fig
+            rect_edge_colors += [color] * 4
+
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěny obdélníků - barva na stěnu, průhlednost ze sidebaru
+            faces=[FaceGroup(self.icosa_vertices, [list(r) for r in self.rectangles],
+                             color=rect_colors)],
+            edges=[EdgeGroup(self.icosa_vertices, rect_edges, color=rect_edge_colors, width=3)],
+            points=[PointGroup(self.icosa_vertices, colors=colors_rect, sizes=10,
+                               show_labels=False)]
+        )
 
 
 class IcosaStep3_Complete(Step):
@@ -289,27 +203,13 @@ class IcosaStep3_Complete(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy dvacetistěnu
-        self.icosa_vertices = np.array([
-            [ 0,  1,  PHI], [ 0,  1, -PHI], [ 0, -1,  PHI], [ 0, -1, -PHI],
-            [ 1,  PHI,  0], [ 1, -PHI,  0], [-1,  PHI,  0], [-1, -PHI,  0],
-            [ PHI,  0,  1], [ PHI,  0, -1], [-PHI,  0,  1], [-PHI,  0, -1]
-        ])
+        self.icosa_vertices = icosahedron_vertices()
 
         # Stěny dvacetistěnu (20 trojúhelníků)
-        self.icosa_faces = [
-            [0, 8, 4], [0, 4, 6], [0, 6, 10], [0, 10, 2], [0, 2, 8],
-            [8, 2, 5], [2, 10, 7], [10, 6, 11], [6, 4, 1], [4, 8, 9],
-            [5, 2, 7], [7, 10, 11], [11, 6, 1], [1, 4, 9], [9, 8, 5],
-            [3, 5, 7], [3, 7, 11], [3, 11, 1], [3, 1, 9], [3, 9, 5]
-        ]
+        self.icosa_faces = icosahedron_faces()
 
-        # Hrany (vypočítáme ze stěn)
-        edges_set = set()
-        for face in self.icosa_faces:
-            for i in range(3):
-                edge = tuple(sorted([face[i], face[(i+1)%3]]))
-                edges_set.add(edge)
-        self.icosa_edges = list(edges_set)
+        # Hrany (vypočítané ze stěn)
+        self.icosa_edges = icosahedron_edges()
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -356,47 +256,18 @@ Toto není náhoda - je to důsledek speciálních vlastností zlatého řezu:
 ➡️ Pokračuj posledním Platónským tělesem - Dvanáctistěnem!
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení hotového dvacetistěnu (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany - orange color
-        Renderer3D.draw_edges(
-            ax, self.icosa_vertices, self.icosa_edges,
-            color='orange', width=2
-        )
-
-        # Nakresli vrcholy - colors from Step 2: red/green/blue rectangles
-        colors_vertices = ['red']*4 + ['green']*4 + ['blue']*4
-        labels = [chr(65+i) for i in range(12)]  # A-L
-        for v, color, label in zip(self.icosa_vertices, colors_vertices, labels):
-            Renderer3D.draw_point(ax, v, color=color, size=120, label=label)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení hotového dvacetistěnu (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěny, pokud je to zapnuté - fixed orange color at 0.3 opacity
-        if st.session_state.get('show_faces', False):
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.icosa_vertices, self.icosa_faces,
-                color='orange', opacity=0.3
-            )
-
-        # Nakresli hrany - orange color
-        edge_width = st.session_state.get('edge_width', 3)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.icosa_vertices, self.icosa_edges,
-            color='orange', width=edge_width
-        )
-
-        # Nakresli vrcholy - colors from Step 2: red/green/blue rectangles
-        vertex_size = st.session_state.get('vertex_size', 12)
+    def build_scene(self) -> Scene:
+        """Hotový dvacetistěn - stěny, hrany a vrcholy"""
+        # Colors from Step 2: red/green/blue rectangles
         colors_vertices = ['red']*4 + ['green']*4 + ['blue']*4
         labels = [chr(65+i) for i in range(12)]  # A-L
-        for v, color, label in zip(self.icosa_vertices, colors_vertices, labels):
-            fig = PlotlyRenderer3D.add_point(fig, v, color=color, size=vertex_size, label=label)
 
-        return fig
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěny - fixed orange color at 0.3 opacity
+            faces=[FaceGroup(self.icosa_vertices, self.icosa_faces,
+                             color='orange', opacity=0.3)],
+            edges=[EdgeGroup(self.icosa_vertices, self.icosa_edges, color='orange')],
+            points=[PointGroup(self.icosa_vertices, colors=colors_vertices, labels=labels)]
+        )
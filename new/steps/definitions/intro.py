@@ -3,11 +3,9 @@
 Introduction steps
 """
 import numpy as np
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
 from steps.base_step import Step, StepMetadata
 from config.settings import APP_INFO
-from views.plotly_renderer import PlotlyRenderer3D
+from views.scene import Scene
 
 
 class IntroStep(Step):
@@ -57,18 +55,6 @@ Existuje pouze **5 pravidelných mnohostěnů**! Toto tvrzení dokázali už sta
 👈 **Začni výběrem kroku v postranním panelu!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Úvodní diagram - prázdné 3D osy (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=16, fontweight='bold', pad=20)
-
-        # Zobraz jen osy bez dat
-        ax.grid(True, alpha=0.3)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Úvodní diagram - prázdné 3D osy (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Prázdný diagram - zobrazí jen osy
-        return fig
+    def build_scene(self) -> Scene:
+        """Úvodní diagram - prázdné 3D osy"""
+        return Scene(title=self.metadata.title, axis_limits=(-2, 2))
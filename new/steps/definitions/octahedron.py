@@ -2,13 +2,17 @@
 Kroky pro konstrukci osmistěnu
 Octahedron construction steps
 """
+from typing import TYPE_CHECKING
 import numpy as np
-from matplotlib.figure import Figure
 import plotly.graph_objects as go
-import streamlit as st
 from steps.base_step import Step, StepMetadata
 from views.renderer import Renderer3D
 from views.plotly_renderer import PlotlyRenderer3D
+from views.scene import Scene, PointGroup, EdgeGroup, FaceGroup
+from models.solids import octahedron_edges, octahedron_faces, octahedron_vertices
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class OctaStep1_Axes(Step):
@@ -16,15 +20,8 @@ class OctaStep1_Axes(Step):
 
     def __init__(self):
         super().__init__()
-        # Vrcholy osmistěnu na osách
-        self.octa_vertices = np.array([
-            [ 1,  0,  0],  # +X
-            [-1,  0,  0],  # -X
-            [ 0,  1,  0],  # +Y
-            [ 0, -1,  0],  # -Y
-            [ 0,  0,  1],  # +Z
-            [ 0,  0, -1]   # -Z
-        ])
+        # Vrcholy osmistěnu na osách: +X, -X, +Y, -Y, +Z, -Z (sdílené)
+        self.octa_vertices = octahedron_vertices()
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -71,7 +68,7 @@ Osmistěn má **dokonalou symetrii**:
 ➡️ **Další krok ukáže, jak tyto body spojit do osmistěnu!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
+    def render_diagram(self, fig: 'Figure', ax) -> None:
         """Vykreslení vrcholů na osách (matplotlib - legacy)"""
         self.setup_axes(ax)
         ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
@@ -100,8 +97,8 @@ Osmistěn má **dokonalou symetrii**:
         labels = ['+X', '-X', '+Y', '-Y', '+Z', '-Z']
         colors = ['red', 'red', 'green', 'green', 'blue', 'blue']
 
-        for v, label, color in zip(self.octa_vertices, labels, colors):
-            fig = PlotlyRenderer3D.add_point(fig, v, color=color, size=15, label=label)
+        fig = PlotlyRenderer3D.add_points(fig, self.octa_vertices, colors=colors,
+                                          sizes=15, labels=labels)
 
         return fig
 
@@ -112,24 +109,13 @@ class OctaStep2_Complete(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy osmistěnu
-        self.octa_vertices = np.array([
-            [ 1,  0,  0], [-1,  0,  0], [ 0,  1,  0],
-            [ 0, -1,  0], [ 0,  0,  1], [ 0,  0, -1]
-        ])
+        self.octa_vertices = octahedron_vertices()
 
         # Stěny osmistěnu (8 trojúhelníků)
-        self.octa_faces = [
-            [0, 2, 4], [0, 4, 3], [0, 3, 5], [0, 5, 2],
-            [1, 4, 2], [1, 3, 4], [1, 5, 3], [1, 2, 5]
-        ]
-
-        # Hrany (vypočítáme ze stěn)
-        self.octa_edges = set()
-        for face in self.octa_faces:
-            for i in range(3):
-                edge = tuple(sorted([face[i], face[(i+1)%3]]))
-                self.octa_edges.add(edge)
-        self.octa_edges = list(self.octa_edges)
+        self.octa_faces = octahedron_faces()
+
+        # Hrany (vypočítané ze stěn)
+        self.octa_edges = octahedron_edges()
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -190,47 +176,17 @@ Osmistěn je **duální** k hranu! To znamená:
 ➡️ Pokračuj dalším tělesem - Dvacetistěnem!
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení hotového osmistěnu (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany
-        Renderer3D.draw_edges(
-            ax, self.octa_vertices, self.octa_edges,
-            color='blue', width=2
-        )
-
-        # Nakresli vrcholy - colors from Step 1
+    def build_scene(self) -> Scene:
+        """Hotový osmistěn - stěny, hrany a vrcholy"""
+        # Barvy vrcholů z kroku 1
         colors = ['red', 'red', 'green', 'green', 'blue', 'blue']
         labels = [str(i+1) for i in range(6)]
-        for v, color, label in zip(self.octa_vertices, colors, labels):
-            Renderer3D.draw_point(ax, v, color=color, size=150, label=label)
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení hotového osmistěnu (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli stěny, pokud je to zapnuté - fixed blue color at 0.3 opacity
-        if st.session_state.get('show_faces', False):
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.octa_vertices, self.octa_faces,
-                color='blue', opacity=0.3
-            )
-
-        # Nakresli hrany
-        edge_width = st.session_state.get('edge_width', 4)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.octa_vertices, self.octa_edges,
-            color='blue', width=edge_width
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěny - fixed blue color at 0.3 opacity
+            faces=[FaceGroup(self.octa_vertices, self.octa_faces,
+                             color='blue', opacity=0.3)],
+            edges=[EdgeGroup(self.octa_vertices, self.octa_edges, color='blue')],
+            points=[PointGroup(self.octa_vertices, colors=colors, labels=labels)]
         )
-
-        # Nakresli vrcholy - colors from Step 1
-        vertex_size = st.session_state.get('vertex_size', 15)
-        colors = ['red', 'red', 'green', 'green', 'blue', 'blue']
-        labels = [str(i+1) for i in range(6)]
-        for v, color, label in zip(self.octa_vertices, colors, labels):
-            fig = PlotlyRenderer3D.add_point(fig, v, color=color, size=vertex_size, label=label)
-
-        return fig
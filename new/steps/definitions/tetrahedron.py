@@ -3,12 +3,12 @@ Kroky pro konstrukci čtyřstěnu
 Tetrahedron construction steps
 """
 import numpy as np
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
-import streamlit as st
 from steps.base_step import Step, StepMetadata
-from views.renderer import Renderer3D
-from views.plotly_renderer import PlotlyRenderer3D
+from views.scene import Scene, PointGroup, EdgeGroup, FaceGroup
+from models.solids import (
+    cube_edges, cube_vertices, tetrahedron_edges, tetrahedron_faces,
+    tetrahedron_vertices
+)
 from config.settings import PHI
 
 
@@ -18,26 +18,10 @@ class TetraStep1_Cube(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy krychle
-        self.cube_vertices = np.array([
-            [-1, -1, -1],  # 0
-            [-1, -1,  1],  # 1
-            [-1,  1, -1],  # 2
-            [-1,  1,  1],  # 3
-            [ 1, -1, -1],  # 4
-            [ 1, -1,  1],  # 5
-            [ 1,  1, -1],  # 6
-            [ 1,  1,  1]   # 7
-        ])
+        self.cube_vertices = cube_vertices()  # (±1, ±1, ±1), sdílené
 
         # Hrany krychle
-        self.cube_edges = [
-            (0, 1), (0, 2), (0, 4),
-            (1, 3), (1, 5),
-            (2, 3), (2, 6),
-            (3, 7),
-            (4, 5), (4, 6),
-            (5, 7), (6, 7)
-        ]
+        self.cube_edges = cube_edges()
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -89,48 +73,16 @@ Krychle je skvělý výchozí bod, protože:
 ➡️ **Pokračuj na další krok a uvidíš, jak vybrat správné vrcholy!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení krychle (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany krychle
-        Renderer3D.draw_edges(
-            ax, self.cube_vertices, self.cube_edges,
-            color='orange', width=2
-        )
-
-        # Nakresli vrcholy
-        labels = [str(i) for i in range(8)]
-        Renderer3D.draw_points(
-            ax, self.cube_vertices,
-            colors='orange',
-            sizes=120,
-            labels=labels
-        )
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení krychle (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli hrany krychle
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.cube_vertices, self.cube_edges,
-            color='orange', width=3
-        )
-
-        # Nakresli vrcholy
+    def build_scene(self) -> Scene:
+        """Krychle s očíslovanými vrcholy"""
         labels = [str(i) for i in range(8)]
-        fig = PlotlyRenderer3D.add_points(
-            fig, self.cube_vertices,
-            colors='orange',
-            sizes=12,
-            labels=labels
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            edges=[EdgeGroup(self.cube_vertices, self.cube_edges, color='orange', width=3)],
+            points=[PointGroup(self.cube_vertices, colors='orange', sizes=12, labels=labels)]
         )
 
-        return fig
-
 
 class TetraStep2_Selection(Step):
     """Čtyřstěn - Krok 2: Výběr vrcholů"""
@@ -138,14 +90,8 @@ class TetraStep2_Selection(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy krychle
-        self.cube_vertices = np.array([
-            [-1, -1, -1], [-1, -1,  1], [-1,  1, -1], [-1,  1,  1],
-            [ 1, -1, -1], [ 1, -1,  1], [ 1,  1, -1], [ 1,  1,  1]
-        ])
-        self.cube_edges = [
-            (0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3),
-            (2, 6), (3, 7), (4, 5), (4, 6), (5, 7), (6, 7)
-        ]
+        self.cube_vertices = cube_vertices()
+        self.cube_edges = cube_edges()
 
         # Vybrané vrcholy pro čtyřstěn
         self.tetra_indices = [7, 4, 2, 1]
@@ -195,44 +141,20 @@ Zkus se podívat na diagram vlevo a ověř si, že:
 ➡️ **Další krok ukáže hotový čtyřstěn!**
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení krychle s označenými vrcholy (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli hrany krychle - oranžová barva
-        Renderer3D.draw_edges(
-            ax, self.cube_vertices, self.cube_edges,
-            color='orange', width=2
-        )
-
-        # Nakresli vrcholy - vybrané červeně (větší), ostatní oranžově (menší)
-        for i, v in enumerate(self.cube_vertices):
-            if i in self.tetra_indices:
-                Renderer3D.draw_point(ax, v, color='red', size=150, label=str(i))
-            else:
-                Renderer3D.draw_point(ax, v, color='orange', size=60, label=str(i))
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení krychle s označenými vrcholy (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli hrany krychle - oranžová barva
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.cube_vertices, self.cube_edges,
-            color='orange', width=3
+    def build_scene(self) -> Scene:
+        """Krychle s vybranými vrcholy čtyřstěnu"""
+        # Vybrané vrcholy červeně (větší), ostatní oranžově (menší)
+        selected = [i in self.tetra_indices for i in range(len(self.cube_vertices))]
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            edges=[EdgeGroup(self.cube_vertices, self.cube_edges, color='orange', width=3)],
+            points=[PointGroup(self.cube_vertices,
+                               colors=['red' if s else 'orange' for s in selected],
+                               sizes=[15 if s else 8 for s in selected],
+                               labels=[str(i) for i in range(len(self.cube_vertices))])]
         )
 
-        # Nakresli vrcholy - vybrané červeně (větší), ostatní oranžově (menší)
-        for i, v in enumerate(self.cube_vertices):
-            if i in self.tetra_indices:
-                fig = PlotlyRenderer3D.add_point(fig, v, color='red', size=15, label=str(i))
-            else:
-                fig = PlotlyRenderer3D.add_point(fig, v, color='orange', size=8, label=str(i))
-
-        return fig
-
 
 class TetraStep3_Complete(Step):
     """Čtyřstěn - Krok 3: Hotový čtyřstěn"""
@@ -240,36 +162,18 @@ class TetraStep3_Complete(Step):
     def __init__(self):
         super().__init__()
         # Vrcholy krychle (pro kontext)
-        self.cube_vertices = np.array([
-            [-1, -1, -1], [-1, -1,  1], [-1,  1, -1], [-1,  1,  1],
-            [ 1, -1, -1], [ 1, -1,  1], [ 1,  1, -1], [ 1,  1,  1]
-        ])
-        self.cube_edges = [
-            (0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3),
-            (2, 6), (3, 7), (4, 5), (4, 6), (5, 7), (6, 7)
-        ]
+        self.cube_vertices = cube_vertices()
+        self.cube_edges = cube_edges()
 
         # Vrcholy čtyřstěnu
-        self.tetra_vertices = np.array([
-            [ 1,  1,  1],  # Vrchol 7
-            [ 1, -1, -1],  # Vrchol 4
-            [-1,  1, -1],  # Vrchol 2
-            [-1, -1,  1]   # Vrchol 1
-        ])
+        # Vrcholy čtyřstěnu = vrcholy krychle 7, 4, 2, 1
+        self.tetra_vertices = tetrahedron_vertices()
 
         # Hrany čtyřstěnu (všechny možné dvojice)
-        self.tetra_edges = [
-            (0, 1), (0, 2), (0, 3),
-            (1, 2), (1, 3), (2, 3)
-        ]
-
-        # Stěny čtyřstěnu (4 trojúhelníky)
-        self.tetra_faces = [
-            [0, 1, 2],  # Stěna ABC
-            [0, 1, 3],  # Stěna ABD
-            [0, 2, 3],  # Stěna ACD
-            [1, 2, 3]   # Stěna BCD
-        ]
+        self.tetra_edges = tetrahedron_edges()
+
+        # Stěny čtyřstěnu (4 trojúhelníky: ABC, ABD, ACD, BCD)
+        self.tetra_faces = tetrahedron_faces()
 
     def get_metadata(self) -> StepMetadata:
         return StepMetadata(
@@ -342,90 +246,28 @@ Dosadíme do vzorce pro výpočet přepony v pravoúhlém trojúhelníku (Pythag
 ➡️ Pokračuj dalším tělesem - Osmistěnem!
 """
 
-    def render_diagram(self, fig: Figure, ax) -> None:
-        """Vykreslení hotového čtyřstěnu (matplotlib - legacy)"""
-        self.setup_axes(ax)
-        ax.set_title(self.metadata.title, fontsize=14, fontweight='bold')
-
-        # Nakresli krychli v pozadí (oranžová)
-        Renderer3D.draw_edges(
-            ax, self.cube_vertices, self.cube_edges,
-            color='orange', width=2
-        )
-        for i, v in enumerate(self.cube_vertices):
-            # Označ vrchol 5 (E) pro demonstraci Pythagorovy věty
-            if i == 5:  # Vertex at (1, -1, 1) - on same face as A and B
-                Renderer3D.draw_point(ax, v, color='orange', size=80, label='E')
-            else:
-                Renderer3D.draw_point(ax, v, color='orange', size=60)
-
-        # Nakresli hrany čtyřstěnu
-        Renderer3D.draw_edges(
-            ax, self.tetra_vertices, self.tetra_edges,
-            color='blue', width=3, alpha=0.8
-        )
-
-        # Zvýrazni hranu AB (pro demonstraci výpočtu)
-        Renderer3D.draw_edge(
-            ax, self.tetra_vertices[0], self.tetra_vertices[1],
-            color='yellow', width=4
+    def build_scene(self) -> Scene:
+        """Hotový čtyřstěn vepsaný do krychle"""
+        n_cube = len(self.cube_vertices)
+        return Scene(
+            title=self.metadata.title,
+            axis_limits=(-2, 2),
+            # Stěny čtyřstěnu - fixed blue color
+            faces=[FaceGroup(self.tetra_vertices, self.tetra_faces, color='blue')],
+            edges=[
+                # Krychle v pozadí (oranžová)
+                EdgeGroup(self.cube_vertices, self.cube_edges, color='orange', width=3),
+                EdgeGroup(self.tetra_vertices, self.tetra_edges, color='blue'),
+                # Zvýrazněná hrana AB (pro demonstraci výpočtu)
+                EdgeGroup(self.tetra_vertices, [(0, 1)], color='yellow', width_offset=2),
+            ],
+            points=[
+                # Vrchol 5 (E) pro demonstraci Pythagorovy věty
+                # Vertex at (1, -1, 1) - on same face as A and B
+                PointGroup(self.cube_vertices, colors='orange',
+                           sizes=[10 if i == 5 else 8 for i in range(n_cube)],
+                           labels=['E' if i == 5 else '' for i in range(n_cube)]),
+                PointGroup(self.tetra_vertices, colors='red',
+                           labels=['A', 'B', 'C', 'D']),
+            ]
         )
-
-        # Nakresli vrcholy čtyřstěnu
-        labels = ['A', 'B', 'C', 'D']
-        Renderer3D.draw_points(
-            ax, self.tetra_vertices,
-            colors='red',
-            sizes=150,
-            labels=labels
-        )
-
-    def render_plotly_diagram(self) -> go.Figure:
-        """Vykreslení hotového čtyřstěnu (Plotly - interaktivní)"""
-        fig = PlotlyRenderer3D.create_figure(axis_limits=(-2, 2))
-        fig = PlotlyRenderer3D.add_title(fig, self.metadata.title)
-
-        # Nakresli krychli v pozadí (oranžová)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.cube_vertices, self.cube_edges,
-            color='orange', width=3
-        )
-        for i, v in enumerate(self.cube_vertices):
-            # Označ vrchol 5 (E) pro demonstraci Pythagorovy věty
-            if i == 5:  # Vertex at (1, -1, 1) - on same face as A and B
-                fig = PlotlyRenderer3D.add_point(fig, v, color='orange', size=10, label='E')
-            else:
-                fig = PlotlyRenderer3D.add_point(fig, v, color='orange', size=8, show_label=False)
-
-        # Nakresli stěny, pokud je to zapnuté - fixed blue color
-        if st.session_state.get('show_faces', False):
-            opacity = st.session_state.get('face_opacity', 0.5)
-            fig = PlotlyRenderer3D.add_faces(
-                fig, self.tetra_vertices, self.tetra_faces,
-                color='blue', opacity=opacity
-            )
-
-        # Nakresli hrany čtyřstěnu
-        edge_width = st.session_state.get('edge_width', 4)
-        fig = PlotlyRenderer3D.add_edges(
-            fig, self.tetra_vertices, self.tetra_edges,
-            color='blue', width=edge_width
-        )
-
-        # Zvýrazni hranu AB (pro demonstraci výpočtu)
-        fig = PlotlyRenderer3D.add_edge(
-            fig, self.tetra_vertices[0], self.tetra_vertices[1],
-            color='yellow', width=edge_width + 2
-        )
-
-        # Nakresli vrcholy čtyřstěnu
-        vertex_size = st.session_state.get('vertex_size', 15)
-        labels = ['A', 'B', 'C', 'D']
-        fig = PlotlyRenderer3D.add_points(
-            fig, self.tetra_vertices,
-            colors='red',
-            sizes=vertex_size,
-            labels=labels
-        )
-
-        return fig
@@ -2,8 +2,23 @@
 Registry pro správu všech kroků prezentace
 Step registry for managing all presentation steps
 """
-from typing import List, Dict, Optional
-from .base_step import Step
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, List, Dict, Mapping, Optional, Tuple, Type
+from .base_step import Step, StepMetadata
+
+
+@dataclass(frozen=True)
+class StepEntry:
+    """
+    Záznam v registry: metadata + továrna na instanci kroku
+
+    Instance se vytvoří až při prvním zobrazení kroku (konstruktory
+    kroků počítají geometrii), metadata stačí pro sidebar a navigaci.
+    """
+    metadata: StepMetadata
+    factory: Callable[[], Step]
 
 
 class StepRegistry:
@@ -12,8 +27,8 @@ class StepRegistry:
 
     Použití:
         registry = StepRegistry()
-        registry.register(IntroStep())
-        registry.register(TetraStep1())
+        registry.register_class(IntroStep)   # instance až při zobrazení
+        registry.register(TetraStep1())      # hotová instance
         ...
         all_steps = registry.get_all_steps()
     """
@@ -23,53 +38,167 @@ class StepRegistry:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(StepRegistry, cls).__new__(cls)
-            cls._instance._steps = []
+            cls._instance._lock = threading.Lock()
+            cls._instance._reset()
         return cls._instance
 
+    @classmethod
+    def fresh(cls) -> 'StepRegistry':
+        """
+        Nová prázdná registry mimo singleton
+
+        Nový snapshot se sestaví bokem a do globální registry se
+        přepne až hotový (set_registry), takže rozběhnuté sessions
+        nikdy nevidí napůl vyprázdněnou registry.
+        """
+        registry = super(StepRegistry, cls).__new__(cls)
+        registry._lock = threading.Lock()
+        registry._reset()
+        return registry
+
+    def _reset(self) -> None:
+        """Vyprázdní záznamy, indexy i instance"""
+        self._entries: Dict[int, StepEntry] = {}       # číslo -> záznam
+        self._by_category: Dict[str, List[StepEntry]] = {}
+        self._instances: Dict[int, Step] = {}
+        self._frozen = False
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Zahodí odvozené cache (seřazené záznamy, sidebar menu)"""
+        self._sorted: Optional[Tuple[StepEntry, ...]] = None
+        self._menu: Optional[Mapping[str, Tuple[tuple, ...]]] = None
+
+    def _add(self, entry: StepEntry) -> None:
+        """Přidá záznam (kontrola zmrazení a duplicitních čísel)"""
+        if self._frozen:
+            raise RuntimeError(
+                "Registry je zmrazená (sdílený snapshot) - sestav novou (StepRegistry.fresh)"
+            )
+        number = entry.metadata.number
+        if number in self._entries:
+            existing = self._entries[number].metadata
+            raise ValueError(
+                f"Krok číslo {number} už je zaregistrovaný "
+                f"('{existing.title}'), nelze přidat '{entry.metadata.title}'"
+            )
+        self._entries[number] = entry
+        category = self._by_category.setdefault(entry.metadata.category, [])
+        category.append(entry)
+        category.sort(key=lambda e: e.metadata.number)
+        self._invalidate()
+
     def register(self, step: Step) -> None:
-        """Zaregistruje nový krok"""
-        self._steps.append(step)
+        """Zaregistruje nový krok (hotovou instanci)"""
+        self._add(StepEntry(step.metadata, lambda: step))
+        self._instances[step.metadata.number] = step
+
+    def register_factory(self, metadata: StepMetadata,
+                         factory: Callable[[], Step]) -> None:
+        """
+        Zaregistruje krok, jehož instance vznikne až při prvním použití
+
+        Args:
+            metadata: Metadata kroku (pro sidebar a navigaci)
+            factory: Funkce bez argumentů vracející instanci kroku
+        """
+        self._add(StepEntry(metadata, factory))
+
+    def register_class(self, step_class: Type[Step]) -> None:
+        """Zaregistruje třídu kroku (lazy - viz register_factory)"""
+        self.register_factory(step_class.class_metadata(), step_class)
+
+    def freeze(self) -> None:
+        """
+        Uzavře registry jako neměnný snapshot sdílený všemi sessions
+
+        Po zmrazení register() vyhodí RuntimeError; nové sestavení
+        vzniká v StepRegistry.fresh() a přepne se přes set_registry().
+        """
+        self._sorted_entries()
+        self.get_sidebar_menu()
+        self._frozen = True
+
+    @property
+    def frozen(self) -> bool:
+        """Je registry zmrazená?"""
+        return self._frozen
+
+    def _materialize(self, entry: StepEntry) -> Step:
+        """Vrátí instanci kroku (při prvním použití ji vytvoří a uloží)"""
+        number = entry.metadata.number
+        step = self._instances.get(number)
+        if step is None:
+            with self._lock:
+                step = self._instances.get(number)
+                if step is None:
+                    step = entry.factory()
+                    self._instances[number] = step
+        return step
+
+    def _sorted_entries(self) -> Tuple[StepEntry, ...]:
+        """Záznamy seřazené podle čísla kroku (cachované do další změny)"""
+        if self._sorted is None:
+            self._sorted = tuple(self._entries[n] for n in sorted(self._entries))
+        return self._sorted
+
+    def get_all_metadata(self) -> List[StepMetadata]:
+        """Vrátí metadata všech kroků seřazená podle čísla (bez vytváření instancí)"""
+        return [entry.metadata for entry in self._sorted_entries()]
 
     def get_all_steps(self) -> List[Step]:
         """Vrátí všechny zaregistrované kroky seřazené podle čísla"""
-        return sorted(self._steps, key=lambda s: s.metadata.number)
+        return [self._materialize(entry) for entry in self._sorted_entries()]
 
     def get_step_by_number(self, number: int) -> Optional[Step]:
         """Najde krok podle čísla"""
-        for step in self._steps:
-            if step.metadata.number == number:
-                return step
-        return None
+        entry = self._entries.get(number)
+        if entry is None:
+            return None
+        return self._materialize(entry)
 
     def get_steps_by_category(self, category: str) -> List[Step]:
         """Vrátí všechny kroky dané kategorie"""
-        return [s for s in self._steps if s.metadata.category == category]
+        return [self._materialize(e) for e in self._by_category.get(category, [])]
 
     def get_step_count(self) -> int:
         """Vrátí celkový počet kroků"""
-        return len(self._steps)
+        return len(self._entries)
+
+    def is_materialized(self, number: int) -> bool:
+        """Byla už instance kroku vytvořena?"""
+        return number in self._instances
 
     def clear(self) -> None:
-        """Vymaže všechny kroky (užitečné pro testování)"""
-        self._steps.clear()
+        """Vymaže všechny kroky (užitečné pro testování a nové sestavení)"""
+        with self._lock:
+            self._reset()
 
-    def get_sidebar_menu(self) -> Dict[str, List[tuple]]:
+    def get_sidebar_menu(self) -> Mapping[str, Tuple[tuple, ...]]:
         """
         Vrátí data pro sidebar menu organizovaná podle kategorií
 
+        Staví se jen z metadat - nevytváří instance kroků. Menu se sestaví
+        jednou a je neměnné (sdílí ho všechny sessions), zahodí se při
+        register()/clear().
+
         Returns:
-            Dictionary: {kategorie: [(číslo, short_name), ...]}
+            Mapping: {kategorie: ((číslo, short_name), ...)}
         """
-        menu = {}
-        for step in self.get_all_steps():
-            category = step.metadata.category
-            if category not in menu:
-                menu[category] = []
-            menu[category].append((
-                step.metadata.number,
-                step.metadata.short_name
-            ))
-        return menu
+        if self._menu is None:
+            menu = {}
+            for metadata in self.get_all_metadata():
+                category = metadata.category
+                if category not in menu:
+                    menu[category] = []
+                menu[category].append((
+                    metadata.number,
+                    metadata.short_name
+                ))
+            self._menu = MappingProxyType(
+                {category: tuple(items) for category, items in menu.items()}
+            )
+        return self._menu
 
 
 # Globální instance registry
@@ -79,3 +208,18 @@ _global_registry = StepRegistry()
 def get_registry() -> StepRegistry:
     """Vrátí globální instanci registry"""
     return _global_registry
+
+
+def set_registry(registry: StepRegistry) -> None:
+    """
+    Nahradí globální registry hotovou (zmrazenou) registry
+
+    Přepnutí je jedno přiřazení - session, která si už starou registry
+    vzala, dokončí běh nad ní, další běhy vidí novou.
+
+    Args:
+        registry: Nová registry (obvykle ze StepRegistry.fresh())
+    """
+    global _global_registry
+    StepRegistry._instance = registry
+    _global_registry = registry
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Kontrola, že FastFigure backend dává stejný výsledek jako validovaný go.Figure.
+Checks that the FastFigure backend produces the same figure as go.Figure.
+
+Spuštění / Usage:
+    cd new/
+    python test_fast_figure.py      (nebo / or: pytest test_fast_figure.py)
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# generate_animations nahradí streamlit mockem se session_state (před importem kroků)
+from generate_animations import ALL_STEPS
+import views.plotly_renderer as plotly_renderer
+from views.fast_figure import FastFigure, as_figure
+
+
+def _render(step, backend: str) -> dict:
+    """Vykreslí krok daným backendem a vrátí výsledný JSON jako dict"""
+    previous = plotly_renderer.PLOTLY_BACKEND
+    plotly_renderer.PLOTLY_BACKEND = backend
+    try:
+        fig = step.render_plotly_diagram()
+    finally:
+        plotly_renderer.PLOTLY_BACKEND = previous
+    return json.loads(as_figure(fig).to_json())
+
+
+def test_fast_backend_matches_validated():
+    for step in ALL_STEPS:
+        expected = _render(step, 'figure')
+        actual = _render(step, 'fast')
+        assert actual == expected, f"Krok {step.metadata.number} se liší"
+
+
+def test_fast_backend_is_used_by_renderer_steps():
+    fig = plotly_renderer.PlotlyRenderer3D.create_figure(backend='fast')
+    assert isinstance(fig, FastFigure)
+
+
+if __name__ == '__main__':
+    test_fast_backend_matches_validated()
+    test_fast_backend_is_used_by_renderer_steps()
+    print(f"✓ FastFigure odpovídá go.Figure pro {len(ALL_STEPS)} kroků")
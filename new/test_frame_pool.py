@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Kontrola, že GIF vykreslený přes --jobs N je bajtově shodný se sekvenčním.
+Checks that rotating GIFs rendered by the worker pool match the sequential ones.
+
+Kaleido se nahradí deterministickou náhradou fig.to_image (obrázek závisí
+na kameře a počtu traců), takže test běží i bez Chrome. Workery náhradu
+zdědí forkem - na platformách bez fork se test přeskočí.
+
+Spuštění / Usage:
+    cd new/
+    python test_frame_pool.py      (nebo / or: pytest test_frame_pool.py)
+"""
+import hashlib
+import io
+import multiprocessing
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import plotly.basedatatypes
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# generate_animations nahradí streamlit mockem se session_state (před importem kroků)
+import generate_animations as gen
+
+STEPS = (3, 13)     # čtyřstěn a dvanáctistěn (3D)
+FRAMES = 6
+SIZE = 96
+
+
+def _fake_to_image(self, format='png', width=700, height=700, scale=1):
+    """Deterministický PNG podle kamery a počtu traců (náhrada Kaleido)"""
+    eye = self.layout.scene.camera.eye
+    seed = hashlib.sha256(f"{len(self.data)}|{eye.x:.6f}|{eye.y:.6f}|{eye.z:.6f}"
+                          .encode('ascii')).digest()
+    rng = np.random.default_rng(int.from_bytes(seed[:8], 'little'))
+    # Bílé pozadí a plné barvy jako u skutečné figury
+    img = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(img)
+    for _ in range(40):
+        x, y = rng.integers(0, width, 2)
+        r = int(rng.integers(3, 25))
+        draw.ellipse([x, y, x + r, y + r], fill=tuple(int(c) for c in rng.integers(0, 255, 3)))
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _gif(fig, path: Path, pool, palette_mode: str) -> bytes:
+    gen.save_rotating_gif(fig, path, n_frames=FRAMES, fps=15, size=SIZE, elevation=25.0,
+                          pool=pool, progress=False, palette_mode=palette_mode)
+    return path.read_bytes()
+
+
+def test_pool_matches_sequential():
+    if multiprocessing.get_start_method() != 'fork':
+        import pytest
+        pytest.skip("workery potřebují zdědit náhradu to_image (fork)")
+
+    original = plotly.basedatatypes.BaseFigure.to_image
+    plotly.basedatatypes.BaseFigure.to_image = _fake_to_image
+    try:
+        steps = [s for s in gen.ALL_STEPS if s.get_metadata().number in STEPS]
+        with tempfile.TemporaryDirectory() as tmp, gen.frame_pool(2) as pool:
+            for step in steps:
+                fig = gen.as_figure(step.render_plotly_diagram())
+                for mode in gen.PALETTE_MODES:
+                    sequential = _gif(fig, Path(tmp) / 'seq.gif', None, mode)
+                    parallel = _gif(fig, Path(tmp) / 'par.gif', pool, mode)
+                    assert parallel == sequential, \
+                        f"Krok {step.get_metadata().number}, paleta {mode}: --jobs se liší"
+    finally:
+        plotly.basedatatypes.BaseFigure.to_image = original
+
+
+if __name__ == '__main__':
+    test_pool_matches_sequential()
+    print(f"✓ --jobs dává stejné GIFy jako sekvenční běh ({len(STEPS)} kroky × "
+          f"{len(gen.PALETTE_MODES)} palety)")
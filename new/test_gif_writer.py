@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Kontrola, že StreamingGifWriter zapíše stejné bajty jako Pillow save_all.
+Checks that StreamingGifWriter is byte-identical to Pillow's save_all.
+
+StreamingGifWriter používá interní funkce GifImagePlugin - test hlídá,
+že s nainstalovaným Pillow (viz requirements_animation.txt) výstup
+odpovídá frames[0].save(save_all=True, optimize=True, ...).
+
+Spuštění / Usage:
+    cd new/
+    python test_gif_writer.py      (nebo / or: pytest test_gif_writer.py)
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from utils.gif_palette import palette_bytes, quantize_frame, sampled_palette
+from utils.gif_writer import StreamingGifWriter
+
+DURATION = 67
+SIZE = 120
+
+
+def _frames(count: int, seed: int, hold: int = 1):
+    """
+    Syntetické RGBA snímky: pevné kruhy + ručička, která se posouvá
+
+    Args:
+        count: Počet snímků
+        seed: Seed rozmístění kruhů
+        hold: Kolik po sobě jdoucích snímků je shodných
+    """
+    rnd = random.Random(seed)
+    circles = [(rnd.randrange(SIZE), rnd.randrange(SIZE), rnd.randrange(5, 40),
+                tuple(rnd.randrange(256) for _ in range(3))) for _ in range(60)]
+    frames = []
+    for i in range(count):
+        k = i // hold
+        img = Image.new('RGB', (SIZE, SIZE), 'white')
+        draw = ImageDraw.Draw(img)
+        for x, y, r, color in circles:
+            draw.ellipse([x, y, x + r, y + r], fill=color)
+        center = SIZE / 2
+        draw.line([center, center, center + 40 * (k % 7), center + 30 * ((k * 3) % 5)],
+                  fill='black', width=4)
+        frames.append(img.convert('RGBA'))
+    return frames
+
+
+def _assert_identical(frames, palette=None):
+    """Zapíše snímky oběma způsoby a porovná bajty souborů"""
+    with tempfile.TemporaryDirectory() as tmp:
+        expected = Path(tmp) / 'pillow.gif'
+        actual = Path(tmp) / 'stream.gif'
+        frames[0].save(expected, save_all=True, append_images=frames[1:], optimize=True,
+                       duration=DURATION, loop=0, palette=palette)
+        with StreamingGifWriter(actual, duration=DURATION, loop=0, palette=palette) as gif:
+            for frame in frames:
+                gif.add(frame)
+        assert actual.read_bytes() == expected.read_bytes()
+        assert not actual.with_name(actual.name + '.part').exists()
+
+
+def test_adaptive_frames():
+    _assert_identical([quantize_frame(frame) for frame in _frames(30, seed=1)])
+
+
+def test_duplicate_frames():
+    # Shodné po sobě jdoucí snímky se slévají (součet dob)
+    _assert_identical([quantize_frame(frame) for frame in _frames(12, seed=2, hold=3)])
+
+
+def test_single_frame():
+    _assert_identical([quantize_frame(frame) for frame in _frames(1, seed=3)])
+
+
+def test_only_duplicate_frames():
+    _assert_identical([quantize_frame(frame) for frame in _frames(5, seed=4, hold=5)])
+
+
+def test_shared_palette():
+    for count, hold in ((30, 1), (12, 3), (1, 1)):
+        rgba = _frames(count, seed=20 + count, hold=hold)
+        palette = sampled_palette(rgba[::4])
+        _assert_identical([quantize_frame(frame, palette) for frame in rgba],
+                          palette=palette_bytes(palette))
+
+
+if __name__ == '__main__':
+    test_adaptive_frames()
+    test_duplicate_frames()
+    test_single_frame()
+    test_only_duplicate_frames()
+    test_shared_palette()
+    print("✓ StreamingGifWriter odpovídá Pillow save_all (5 případů)")
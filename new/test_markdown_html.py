@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Kontrola převodu Markdown popisů kroků na HTML pro statický export.
+Checks the Markdown to HTML conversion used by the static export.
+
+Pokrývá konstrukce, které popisy kroků používají (nadpisy, čáry, seznamy,
+bloky kódu, tučné písmo vedle sebe, znaky < a &), tabulky a vnořené
+zvýraznění. Nakonec převede popisy všech kroků a ověří, že HTML
+je správně vnořené.
+
+Spuštění / Usage:
+    cd new/
+    python test_markdown_html.py      (nebo / or: pytest test_markdown_html.py)
+"""
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from views.markdown_html import markdown_to_html, render_inline
+
+_VOID_TAGS = {'br', 'hr'}
+
+
+class _NestingChecker(HTMLParser):
+    """Zásobník otevřených tagů - chybu hlásí při křížení nebo neuzavření"""
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in _VOID_TAGS:
+            self.stack.append(tag)
+
+    def handle_endtag(self, tag):
+        assert self.stack and self.stack[-1] == tag, \
+            f"</{tag}> neodpovídá otevřeným tagům {self.stack}"
+        self.stack.pop()
+
+
+def _assert_well_formed(fragment: str):
+    checker = _NestingChecker()
+    checker.feed(fragment)
+    checker.close()
+    assert not checker.stack, f"Neuzavřené tagy: {checker.stack}"
+
+
+def test_adjacent_bold():
+    # Dvě tučná slova na řádku se nesmí slít do jedné kurzívy
+    assert render_inline("Z **8 vrcholů** vybereme **4 vrcholy**") == \
+        "Z <strong>8 vrcholů</strong> vybereme <strong>4 vrcholy</strong>"
+
+
+def test_nested_emphasis():
+    assert render_inline("**tučné s *kurzívou* uvnitř**") == \
+        "<strong>tučné s <em>kurzívou</em> uvnitř</strong>"
+    assert render_inline("*kurzíva s **tučným***") == \
+        "<em>kurzíva s <strong>tučným</strong></em>"
+    assert render_inline("***obojí***") == "<strong><em>obojí</em></strong>"
+    # Samostatné hvězdičky (násobení) zůstanou textem
+    assert render_inline("2 * 3 * 4") == "2 * 3 * 4"
+
+
+def test_escaping_and_code_span():
+    assert render_inline("úhel **< 360°** & `a*b*c`") == \
+        "úhel <strong>&lt; 360°</strong> &amp; <code>a*b*c</code>"
+    assert render_inline("<script>") == "&lt;script&gt;"
+
+
+def test_fenced_code():
+    # Svislítka v bloku kódu nejsou tabulka a ** není tučné písmo
+    text = """
+        Pythagorova věta:
+
+        ```
+        |AB|² = |AE|² + |BE|²
+        |AB| = **2√2** < 3
+        ```
+
+        ---
+    """
+    assert markdown_to_html(text) == (
+        "<p>Pythagorova věta:</p>\n"
+        "<pre><code>|AB|² = |AE|² + |BE|²\n"
+        "|AB| = **2√2** &lt; 3</code></pre>\n"
+        "<hr>"
+    )
+
+
+def test_table():
+    text = """
+        | Těleso | Vrcholy | Stěny |
+        |:-------|:-------:|------:|
+        | **Krychle** | 8 | 6 |
+        | `Čtyřstěn` | 4 | 4 |
+    """
+    assert markdown_to_html(text) == (
+        "<table><thead><tr><th>Těleso</th><th>Vrcholy</th><th>Stěny</th></tr></thead>"
+        "<tbody><tr><td><strong>Krychle</strong></td><td>8</td><td>6</td></tr>"
+        "<tr><td><code>Čtyřstěn</code></td><td>4</td><td>4</td></tr></tbody></table>"
+    )
+
+
+def test_headings_and_lists():
+    text = """
+        ### Postup:
+
+        1. Vezmi **krychli**
+           a vyber vrcholy
+        2. Spoj je
+
+        3. Hotovo
+        - odrážka
+    """
+    assert markdown_to_html(text) == (
+        "<h3>Postup:</h3>\n"
+        "<ol><li>Vezmi <strong>krychli</strong>\na vyber vrcholy</li>"
+        "<li>Spoj je</li><li>Hotovo</li></ol>\n"
+        "<ul><li>odrážka</li></ul>"
+    )
+
+
+def test_step_descriptions_well_formed():
+    from config.settings import DISPLAY_DEFAULTS
+    from utils.headless import install_streamlit_mock
+    install_streamlit_mock(dict(DISPLAY_DEFAULTS, current_step=0))
+    from steps.catalog import register_all_steps
+
+    steps = register_all_steps().get_all_steps()
+    assert steps
+    for step in steps:
+        fragment = markdown_to_html(step.get_description())
+        _assert_well_formed(fragment)
+        # Mimo bloky kódu nesmí zůstat nepřevedené ** (tučné písmo)
+        prose = re.sub(r'<pre><code>.*?</code></pre>', '', fragment, flags=re.S)
+        assert '**' not in prose, f"Krok {step.metadata.number}: zbylé **"
+
+
+if __name__ == '__main__':
+    test_adjacent_bold()
+    test_nested_emphasis()
+    test_escaping_and_code_span()
+    test_fenced_code()
+    test_table()
+    test_headings_and_lists()
+    test_step_descriptions_well_formed()
+    print("✓ Markdown popisů kroků se převádí na správně vnořené HTML (7 případů)")
@@ -0,0 +1,200 @@
+"""
+Společná paleta snímků rotačního GIFu
+Shared global palette for the frames of a rotating GIF
+
+Režimy (generate_animations.py --palette):
+    adaptive  každý snímek má vlastní paletu (median-cut, 128 barev) -
+              původní chování; lokální palety zvětšují GIF a barvy
+              mezi snímky "blikají"
+    sampled   jedna paleta z několika rovnoměrně vybraných snímků
+    known     jedna paleta ze známých barev figury (traces, layout,
+              šablona), config.settings.COLORS a barvy stěn, doplněná
+              o přechody do bílé a černé (antialiasing, průhlednost,
+              stínování)
+
+Se společnou paletou se snímky jen mapují na nejbližší barvu (bez
+ditheringu), což je mnohem rychlejší než median-cut každého snímku.
+Porovnání režimů: palette_benchmark.py.
+"""
+from typing import Any, Iterable, List, Optional, Sequence, Set, Tuple
+from PIL import Image, ImageColor
+from config.settings import COLORS
+
+PALETTE_MODES = ('adaptive', 'sampled', 'known')
+
+ADAPTIVE_COLORS = 128       # barvy vlastní palety snímku (režim adaptive)
+SAMPLED_COLORS = 127        # barvy palety ze vzorku snímků (+ volný index, viz palette_image)
+KNOWN_COLORS = 256          # max. barev palety ze známých barev
+SAMPLE_FRAMES = 8           # počet vzorových snímků (režim sampled)
+SAMPLE_STEP = 2             # z vzorových snímků se bere každý n-tý pixel
+
+# Podíly, ve kterých se známá barva míchá s bílou / černou
+_TO_WHITE = (0.2, 0.4, 0.6, 0.8)
+_TO_BLACK = (0.2, 0.4, 0.6)
+_GRAY_LEVELS = 16
+
+RGB = Tuple[int, int, int]
+
+# Kandidáti na doplňkovou barvu palety (viz palette_image)
+_SPARE_COLORS = [(255, 0, 255), (0, 255, 0), (254, 1, 254), (1, 254, 1)]
+
+
+def quantize_frame(img: Image.Image, palette: Optional[Image.Image] = None) -> Image.Image:
+    """
+    Převede snímek do režimu 'P'
+
+    Args:
+        img: Snímek (RGBA z Kaleido)
+        palette: Společná paleta (palette_image) nebo None = vlastní
+            adaptivní paleta snímku jako dřív
+
+    Returns:
+        Snímek v režimu 'P'
+    """
+    if palette is None:
+        return img.convert('P', palette=Image.ADAPTIVE, colors=ADAPTIVE_COLORS)
+    return img.convert('RGB').quantize(palette=palette, dither=Image.Dither.NONE)
+
+
+def palette_image(colors: Sequence[RGB]) -> Image.Image:
+    """
+    Obrázek 1×1 v režimu 'P' nesoucí paletu (pro Image.quantize)
+
+    Rozdílové snímky GIFu používají jako průhlednou barvu první volný
+    index palety. Má-li paleta přesně 2^n barev, ležel by ten index
+    mimo tabulku barev GIFu - proto se doplní o jednu barvu navíc.
+    """
+    colors = list(colors)
+    if len(colors) < 256 and len(colors) & (len(colors) - 1) == 0:
+        used = set(colors)
+        colors.append(next(color for color in _SPARE_COLORS if color not in used))
+    image = Image.new('P', (1, 1))
+    image.putpalette([channel for color in colors for channel in color])
+    return image
+
+
+def palette_bytes(palette: Image.Image) -> bytes:
+    """Paleta jako bajty RGBRGB... (pro StreamingGifWriter)"""
+    return bytes(palette.getpalette())
+
+
+def sample_indices(n_frames: int, count: int = SAMPLE_FRAMES) -> List[int]:
+    """Indexy rovnoměrně rozložených vzorových snímků"""
+    count = min(count, n_frames)
+    return sorted({i * n_frames // count for i in range(count)})
+
+
+def _reduce(colors: Sequence[RGB], count: int) -> Image.Image:
+    """Median-cut seznamu barev (nebo pixelů) na nejvýše count barev"""
+    strip = Image.new('RGB', (len(colors), 1))
+    strip.putdata(list(colors))
+    reduced = strip.quantize(colors=count, method=Image.Quantize.MEDIANCUT)
+    used = len(reduced.getcolors(count))
+    return palette_image(_triples(reduced.getpalette()[:used * 3]))
+
+
+def _triples(flat: Sequence[int]) -> List[RGB]:
+    return [tuple(flat[i:i + 3]) for i in range(0, len(flat), 3)]
+
+
+def sampled_palette(frames: Iterable[Image.Image], colors: int = SAMPLED_COLORS) -> Image.Image:
+    """
+    Paleta z median-cut vzorových snímků (poskládaných vedle sebe)
+
+    Ze snímků se bere jen každý SAMPLE_STEP-tý pixel (NEAREST - bez
+    míchání nových barev); median-cut je pak několikrát rychlejší.
+
+    Args:
+        frames: Vzorové snímky (RGBA / RGB)
+        colors: Počet barev palety
+
+    Returns:
+        Paleta (palette_image)
+    """
+    frames = [frame.convert('RGB').resize((max(1, frame.width // SAMPLE_STEP),
+                                           max(1, frame.height // SAMPLE_STEP)), Image.NEAREST)
+              for frame in frames]
+    width = sum(frame.width for frame in frames)
+    mosaic = Image.new('RGB', (width, max(frame.height for frame in frames)), 'white')
+    x = 0
+    for frame in frames:
+        mosaic.paste(frame, (x, 0))
+        x += frame.width
+    reduced = mosaic.quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+    used = len(reduced.getcolors(colors))
+    return palette_image(_triples(reduced.getpalette()[:used * 3]))
+
+
+def _parse_color(value: str) -> Optional[RGB]:
+    try:
+        return ImageColor.getrgb(value.strip())[:3]
+    except ValueError:
+        return None
+
+
+def figure_colors(obj: Any, key: str = '') -> Set[RGB]:
+    """
+    Všechny barvy zapsané ve figuře (klíče *color*, včetně šablony)
+
+    Args:
+        obj: Figura jako dict (fig.to_plotly_json()) nebo její část
+        key: Jméno klíče, pod kterým obj leží
+
+    Returns:
+        Množina barev (r, g, b)
+    """
+    found = set()
+    if isinstance(obj, dict):
+        for name, value in obj.items():
+            found |= figure_colors(value, name)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            found |= figure_colors(item, key)
+    elif isinstance(obj, str) and 'color' in key.lower():
+        color = _parse_color(obj)
+        if color is not None:
+            found.add(color)
+    return found
+
+
+def _mix(color: RGB, target: RGB, amount: float) -> RGB:
+    return tuple(round(c + (t - c) * amount) for c, t in zip(color, target))
+
+
+def known_palette(fig: Any, extra_colors: Iterable[str] = (),
+                  colors: int = KNOWN_COLORS) -> Image.Image:
+    """
+    Paleta ze známých barev figury, COLORS a dalších barev
+
+    Ke každé barvě přidá přechody do bílé (antialiasing, průhledné
+    stěny) a do černé (stínování 3D ploch) a k tomu stupně šedi
+    (texty, osy). Je-li barev víc než colors, zredukuje je median-cut.
+
+    Args:
+        fig: Plotly Figure nebo dict figury
+        extra_colors: Další barvy (např. barva stěn ze session_state)
+        colors: Max. počet barev palety
+
+    Returns:
+        Paleta (palette_image)
+    """
+    figure = fig.to_plotly_json() if hasattr(fig, 'to_plotly_json') else fig
+    base = figure_colors(figure)
+    for value in list(COLORS.values()) + list(extra_colors):
+        color = _parse_color(value)
+        if color is not None:
+            base.add(color)
+
+    white, black = (255, 255, 255), (0, 0, 0)
+    candidates = {white, black}
+    for color in sorted(base):
+        candidates.add(color)
+        candidates.update(_mix(color, white, amount) for amount in _TO_WHITE)
+        candidates.update(_mix(color, black, amount) for amount in _TO_BLACK)
+    step = 255 / (_GRAY_LEVELS - 1)
+    candidates.update((round(i * step),) * 3 for i in range(_GRAY_LEVELS))
+
+    candidates = sorted(candidates)
+    if len(candidates) <= colors:
+        return palette_image(candidates)
+    return _reduce(candidates, colors)
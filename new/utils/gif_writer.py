@@ -0,0 +1,185 @@
+"""
+Streamovaný zápis animovaného GIFu (paměť nezávislá na počtu snímků)
+Streaming animated GIF writer with bounded memory
+
+Image.save(save_all=True, append_images=[...]) drží všechny snímky
+v paměti až do konce. StreamingGifWriter zapisuje snímky průběžně
+stejným postupem jako Pillow (rozdílové snímky, průhlednost nezměněných
+pixelů, slévání shodných po sobě jdoucích snímků) - výstup je bajtově
+shodný s frames[0].save(..., save_all=True, optimize=True, duration=...,
+loop=..., palette=...). V paměti je jen předchozí snímek a jeden
+nezapsaný snímek (čeká, zda se k němu nepřičte doba shodného snímku).
+
+Writer volá interní funkce GifImagePlugin, které se mezi verzemi Pillow
+mění - shoda je ověřená pro Pillow 10.2 až 12.x (test_gif_writer.py,
+rozsah v requirements_animation.txt).
+"""
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from PIL import GifImagePlugin, Image, ImageChops
+
+
+class StreamingGifWriter:
+    """
+    Animovaný GIF zapisovaný po snímcích
+
+    Použití:
+        with StreamingGifWriter(path, duration=67) as gif:
+            for frame in frames:
+                gif.add(frame)
+
+    Soubor se zapisuje do <path>.part a po close() se přejmenuje,
+    takže při chybě nezůstane na místě výstupu poloviční GIF.
+    """
+
+    def __init__(self, path: Path, duration: int, loop: int = 0,
+                 palette: Optional[bytes] = None):
+        """
+        Args:
+            path: Cílový .gif soubor
+            duration: Doba jednoho snímku v ms
+            loop: Počet opakování (0 = donekonečna)
+            palette: Společná (globální) paleta RGBRGB... pro všechny
+                snímky; None = každý snímek má vlastní lokální paletu
+        """
+        self.path = Path(path)
+        self.part_path = self.path.with_name(self.path.name + '.part')
+        self.palette = palette
+        self.encoderinfo: Dict[str, Any] = {'optimize': True, 'duration': duration, 'loop': loop}
+        self.frame_count = 0
+        self._fp = None
+        self._first: Optional[Image.Image] = None     # pro GIF s jediným snímkem
+        self._previous: Optional[Image.Image] = None  # základ rozdílového snímku
+        self._pending: Optional[Tuple[Image.Image, Optional[Tuple[int, int, int, int]],
+                                      Dict[str, Any]]] = None
+
+    def __enter__(self) -> 'StreamingGifWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add(self, im: Image.Image) -> None:
+        """
+        Přidá snímek (obvykle v režimu 'P' s vlastní paletou)
+
+        Args:
+            im: Snímek; writer si ho nijak nemění
+        """
+        frame = GifImagePlugin._normalize_mode(im.copy())
+        if self.frame_count == 0:
+            for key, value in frame.info.items():
+                if key != 'transparency' and isinstance(key, str):
+                    self.encoderinfo.setdefault(key, value)
+            self._first = frame
+
+        encoderinfo = self.encoderinfo.copy()
+        if 'transparency' in frame.info:
+            encoderinfo.setdefault('transparency', frame.info['transparency'])
+        frame = GifImagePlugin._normalize_palette(frame, self.palette, encoderinfo)
+        self.frame_count += 1
+
+        if self._previous is None:
+            self._previous = frame
+            self._pending = (frame, None, encoderinfo)
+            return
+
+        delta, bbox = _delta(self._previous, frame)
+        if not bbox:
+            # Shodný s předchozím snímkem → jen prodlouží jeho dobu
+            if encoderinfo.get('duration'):
+                self._pending[2]['duration'] += encoderinfo['duration']
+            return
+
+        out_frame = frame
+        if frame.mode != '1':
+            if 'transparency' not in encoderinfo:
+                new_color_index = getattr(frame.palette, '_new_color_index', None)
+                if new_color_index is not None:
+                    try:
+                        encoderinfo['transparency'] = new_color_index(frame)
+                    except ValueError:
+                        pass
+            if 'transparency' in encoderinfo:
+                # Nezměněné pixely → průhledná barva (lépe se komprimují)
+                out_frame = frame.copy()
+                fill = Image.new('P', delta.size, encoderinfo['transparency'])
+                out_frame.paste(fill, mask=_unchanged_mask(delta))
+
+        self._write_pending()
+        self._previous = frame
+        self._pending = (out_frame, bbox, encoderinfo)
+
+    def _open(self):
+        if self._fp is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fp = open(self.part_path, 'wb')
+        return self._fp
+
+    def _write_pending(self) -> None:
+        """Zapíše čekající snímek (jeho doba už je konečná)"""
+        im, bbox, encoderinfo = self._pending
+        fp = self._open()
+        if not bbox:
+            for chunk in GifImagePlugin._get_global_header(im, encoderinfo):
+                fp.write(chunk)
+            offset = (0, 0)
+        else:
+            if not self.palette:
+                encoderinfo['include_color_table'] = True
+            if bbox != (0, 0) + im.size:
+                im = im.crop(bbox)
+            offset = bbox[:2]
+        GifImagePlugin._write_frame_data(fp, im, offset, encoderinfo)
+        self._pending = None
+
+    def close(self) -> None:
+        """Dopíše poslední snímek a přesune soubor na cílové místo"""
+        if self._pending is None and self._fp is None:
+            raise ValueError("GIF nemá žádný snímek")
+
+        if self._fp is None:
+            # Jediný (nebo jen shodné) snímek - jako Pillow: statický GIF se součtem dob
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._first.save(self.part_path, format='GIF', optimize=True,
+                             duration=self._pending[2]['duration'],
+                             loop=self.encoderinfo['loop'], palette=self.palette)
+        else:
+            self._write_pending()
+            self._fp.write(b';')
+            self._fp.close()
+        self._fp = None
+        self._previous = self._first = None
+        os.replace(self.part_path, self.path)
+
+    def abort(self) -> None:
+        """Zahodí rozepsaný soubor"""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        if self.part_path.exists():
+            self.part_path.unlink()
+
+
+def _delta(base: Image.Image, frame: Image.Image):
+    """Rozdíl dvou snímků (při různých paletách v RGBA) a jeho ohraničení"""
+    if bytes(base.palette.palette) != bytes(frame.palette.palette):
+        base = base.convert('RGBA')
+        frame = frame.convert('RGBA')
+    delta = ImageChops.subtract_modulo(frame, base)
+    return delta, delta.getbbox(alpha_only=False)
+
+
+def _unchanged_mask(delta: Image.Image) -> Image.Image:
+    """Maska '1' pixelů, které se oproti předchozímu snímku nezměnily"""
+    if delta.mode == 'RGBA':
+        r, g, b, a = delta.split()
+        changed = ImageChops.lighter(ImageChops.lighter(r, g), ImageChops.lighter(b, a))
+    else:
+        # Indexy palety bez ohledu na paletu (kopie bajtů, ne po pixelech)
+        changed = Image.frombytes('L', delta.size, delta.tobytes())
+    return changed.point(lambda value: 0 if value else 255, '1')
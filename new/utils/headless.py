@@ -0,0 +1,42 @@
+"""
+Spouštění kroků mimo Streamlit server (CLI nástroje, build skripty)
+Running steps outside of a Streamlit server (CLI tools, build scripts)
+"""
+import sys
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+
+class MockSessionState(dict):
+    """Minimal stand-in for st.session_state."""
+
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+    def __getattr__(self, key):
+        return self.get(key)
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key)
+
+
+def install_streamlit_mock(session_state: Dict[str, Any]) -> MagicMock:
+    """
+    Nahradí modul streamlit mockem se zadaným session_state
+
+    Musí se zavolat PŘED importem kroků - ty čtou st.session_state
+    uvnitř render_plotly_diagram().
+
+    Args:
+        session_state: Počáteční hodnoty st.session_state
+
+    Returns:
+        Mock modulu streamlit
+    """
+    mock_st = MagicMock()
+    mock_st.session_state = MockSessionState(session_state)
+    sys.modules['streamlit'] = mock_st
+    return mock_st
@@ -0,0 +1,64 @@
+"""
+Obsahový otisk zdrojových souborů aplikace
+Content hash of the application's source files
+
+Otisk se počítá z obsahu souborů (ne z časů změn), takže ho nezmění
+checkout ani kopie beze změny kódu a naopak ho změní každá úprava.
+Hash jednotlivých souborů se pamatuje podle (mtime, velikost) - soubor
+se znovu čte jen tehdy, když se změnil, a opakované volání je levné.
+"""
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+# Složka new/ (cesty se zadávají relativně k ní)
+_APP_ROOT = Path(__file__).resolve().parent.parent
+
+_lock = threading.Lock()
+_file_digests: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+
+def _source_files(targets: Iterable[str]) -> List[Path]:
+    """Soubory .py zadaných složek (rekurzivně) a zadané soubory"""
+    files = set()
+    for target in targets:
+        path = _APP_ROOT / target
+        if path.is_dir():
+            files.update(path.rglob('*.py'))
+        elif path.exists():
+            files.add(path)
+    return sorted(files)
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 obsahu souboru (přepočítá se jen po změně mtime/velikosti)"""
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _file_digests.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    with _lock:
+        _file_digests[path] = (key, digest)
+    return digest
+
+
+def source_digest(targets: Iterable[str]) -> str:
+    """
+    Otisk obsahu zdrojových souborů
+
+    Args:
+        targets: Složky a soubory relativně ke složce new/
+            (např. ('steps', 'models', 'views/scene.py'))
+
+    Returns:
+        16 hex znaků SHA-256 přes relativní cesty a obsah souborů
+    """
+    combined = hashlib.sha256()
+    for path in _source_files(targets):
+        combined.update(path.relative_to(_APP_ROOT).as_posix().encode('utf-8'))
+        combined.update(b'\0')
+        combined.update(_file_digest(path).encode('ascii'))
+    return combined.hexdigest()[:16]
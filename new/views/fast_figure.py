@@ -0,0 +1,63 @@
+"""
+Rychlý builder Plotly figur z obyčejných dict/list struktur
+Validation-free Plotly figure builder based on plain dicts
+"""
+from typing import Any, Dict, List, Optional, Union
+import plotly.graph_objects as go
+
+
+def _deep_update(target: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """Rekurzivně sloučí slovník updates do target (jako fig.update_layout)"""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_update(target[key], value)
+        else:
+            target[key] = value
+
+
+class FastFigure:
+    """
+    Lehká náhrada go.Figure bez validace vlastností
+
+    Podporuje jen to, co používá PlotlyRenderer3D: add_trace() s dict
+    tracem a update_layout() s vnořenými dict (bez "magic underscore"
+    zápisu typu scene_camera=...). Validuje se až jednou na konci
+    v to_figure(), nebo vůbec, pokud se předá to_dict() rovnou dál.
+
+    Použití:
+        fig = FastFigure(layout={'height': 600})
+        fig.add_trace({'type': 'scatter3d', 'x': [0], 'y': [0], 'z': [0]})
+        st.plotly_chart(fig.to_dict())
+    """
+
+    def __init__(self, layout: Optional[Dict[str, Any]] = None):
+        self.data: List[Dict[str, Any]] = []
+        self.layout: Dict[str, Any] = layout if layout is not None else {}
+
+    def add_trace(self, trace: Dict[str, Any]) -> 'FastFigure':
+        """Přidá trace (dict s klíčem 'type')"""
+        self.data.append(trace)
+        return self
+
+    def update_layout(self, dict1: Optional[Dict[str, Any]] = None,
+                      **kwargs) -> 'FastFigure':
+        """Sloučí zadané vlastnosti do layoutu"""
+        if dict1:
+            _deep_update(self.layout, dict1)
+        _deep_update(self.layout, kwargs)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Vrátí figure jako dict {'data': [...], 'layout': {...}}"""
+        return {'data': self.data, 'layout': self.layout}
+
+    def to_figure(self) -> go.Figure:
+        """Převede na validovaný go.Figure (jediná validace na konci)"""
+        return go.Figure(self.to_dict())
+
+
+def as_figure(fig: Union[go.Figure, FastFigure]) -> go.Figure:
+    """Vrátí go.Figure bez ohledu na to, kterým backendem figure vznikl"""
+    if isinstance(fig, FastFigure):
+        return fig.to_figure()
+    return fig
@@ -0,0 +1,135 @@
+"""
+LRU cache hotových figur sdílená všemi sessions v procesu
+Process-wide LRU cache of built figures
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+from config.settings import FIGURE_CACHE
+from views.restyle import structural_key
+
+
+def make_key(step_number: int, display: Dict[str, Any]) -> Tuple:
+    """
+    Klíč cache: číslo kroku + nastavení zobrazení, která kroky čtou
+
+    Args:
+        step_number: Číslo kroku
+        display: Nastavení ze sidebaru (show_faces, face_opacity, ...)
+
+    Returns:
+        Hashovatelný tuple
+    """
+    return (step_number, tuple(sorted(display.items())))
+
+
+def make_base_key(step_number: int, display: Dict[str, Any]) -> Tuple:
+    """
+    Klíč základní figury pro restyle: číslo kroku + jen nastavení, která
+    mění strukturu figury (viz views/restyle.py)
+
+    Args:
+        step_number: Číslo kroku
+        display: Nastavení ze sidebaru
+
+    Returns:
+        Hashovatelný tuple
+    """
+    return (step_number, 'base', structural_key(display))
+
+
+class FigureCache:
+    """
+    Omezená LRU cache hotových figur (thread-safe)
+
+    Uložené hodnoty se sdílí mezi sessions - volající je nesmí měnit.
+
+    Použití:
+        cache = get_figure_cache()
+        fig = cache.get_or_build(make_key(3, display), lambda: build(...))
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Vrátí uloženou hodnotu (a započítá hit/miss)"""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def _peek(self, key: Hashable) -> Any:
+        """Jako get(), ale bez započítání do statistik (pomocné úrovně cache)"""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Uloží hodnotu, nejdéle nepoužitou případně vyhodí"""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any],
+                     counted: bool = True) -> Any:
+        """
+        Vrátí hodnotu z cache, nebo ji sestaví přes builder() a uloží
+
+        Args:
+            key: Klíč cache
+            builder: Funkce, která hodnotu sestaví
+            counted: False = vyhledání se nezapočítá do hitů/missů
+                (základní figura restylu, aby jeden render = jedno vyhledání)
+        """
+        value = self.get(key) if counted else self._peek(key)
+        if value is None:
+            value = builder()
+            self.put(key, value)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def clear(self) -> None:
+        """Vymaže cache i počítadla"""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Vrátí počty hitů, missů a obsazenost cache"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._items),
+                'maxsize': self.maxsize,
+            }
+
+
+# Globální instance cache (moduly se načítají jednou na proces,
+# takže ji sdílí všechny sessions i reruny)
+_global_cache = FigureCache(maxsize=FIGURE_CACHE['maxsize'])
+
+
+def get_figure_cache() -> FigureCache:
+    """Vrátí globální instanci cache figur"""
+    return _global_cache
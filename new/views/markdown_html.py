@@ -0,0 +1,194 @@
+"""
+Převod Markdown popisů kroků na HTML (pro statický export)
+Minimal Markdown to HTML conversion for step descriptions
+
+Pokrývá podmnožinu, kterou popisy kroků používají: nadpisy, odstavce,
+vodorovné čáry, odrážkové a číslované seznamy, tabulky, bloky kódu
+(```) a v textu **tučné**, *kurzívu*, `kód` a [odkazy](url). HTML
+v textu se escapuje stejně jako ve st.markdown bez unsafe_allow_html.
+"""
+import html
+import re
+import textwrap
+from typing import List
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*$')
+_SETEXT = re.compile(r'^(=+|-+)$')
+_HR = re.compile(r'^(?:-{3,}|\*{3,}|_{3,})$')
+_UL_ITEM = re.compile(r'^\s*[-*+]\s+(.*)$')
+_OL_ITEM = re.compile(r'^\s*(\d+)[.)]\s+(.*)$')
+_TABLE_SEP = re.compile(r'^\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?$')
+
+_CODE_SPAN = re.compile(r'(`[^`]+`)')
+_LINK = re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)')
+_BOLD_EM = re.compile(r'\*\*\*(?=\S)(.+?)(?<=\S)\*\*\*')
+_BOLD = re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*')
+_EM = re.compile(r'(?<![\w*])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![\w*])')
+
+
+def render_inline(text: str) -> str:
+    """
+    Převede řádkové formátování (kód, odkazy, tučné, kurzíva) na HTML
+
+    Args:
+        text: Jeden řádek / buňka Markdownu
+
+    Returns:
+        HTML s escapovaným textem
+    """
+    out = []
+    for part in _CODE_SPAN.split(text):
+        if len(part) > 1 and part.startswith('`') and part.endswith('`'):
+            out.append(f'<code>{html.escape(part[1:-1])}</code>')
+            continue
+        part = html.escape(part, quote=False)
+        part = _LINK.sub(
+            lambda m: f'<a href="{html.escape(m.group(2))}">{m.group(1)}</a>', part
+        )
+        part = _BOLD_EM.sub(r'<strong><em>\1</em></strong>', part)
+        part = _BOLD.sub(r'<strong>\1</strong>', part)
+        part = _EM.sub(r'<em>\1</em>', part)
+        out.append(part)
+    return ''.join(out)
+
+
+def _table_cells(line: str) -> List[str]:
+    """Rozdělí řádek tabulky na buňky (bez krajních |)"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
+def _list_item(line: str, ordered: bool):
+    """Vrátí text položky seznamu daného typu, nebo None"""
+    match = (_OL_ITEM if ordered else _UL_ITEM).match(line)
+    if match is None:
+        return None
+    return match.group(2) if ordered else match.group(1)
+
+
+def markdown_to_html(text: str) -> str:
+    """
+    Převede Markdown popisu kroku na HTML
+
+    Args:
+        text: Markdown z Step.get_description()
+
+    Returns:
+        HTML fragment (bloky oddělené novým řádkem)
+    """
+    lines = textwrap.dedent(text).strip('\n').splitlines()
+    blocks: List[str] = []
+    paragraph: List[str] = []
+
+    def flush_paragraph():
+        if paragraph:
+            body = '\n'.join(paragraph)
+            blocks.append(f'<p>{body}</p>')
+            paragraph.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            flush_paragraph()
+            i += 1
+            continue
+
+        # Blok kódu ```...```
+        if stripped.startswith('```'):
+            flush_paragraph()
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith('```'):
+                code.append(lines[i])
+                i += 1
+            blocks.append(f'<pre><code>{html.escape(chr(10).join(code))}</code></pre>')
+            i += 1
+            continue
+
+        # Podtržený nadpis (text + ===/---) má přednost před vodorovnou čarou
+        if paragraph and _SETEXT.match(stripped):
+            level = 1 if stripped.startswith('=') else 2
+            title = ' '.join(paragraph)
+            paragraph.clear()
+            blocks.append(f'<h{level}>{title}</h{level}>')
+            i += 1
+            continue
+
+        heading = _HEADING.match(stripped)
+        if heading:
+            flush_paragraph()
+            level = len(heading.group(1))
+            blocks.append(f'<h{level}>{render_inline(heading.group(2))}</h{level}>')
+            i += 1
+            continue
+
+        if _HR.match(stripped):
+            flush_paragraph()
+            blocks.append('<hr>')
+            i += 1
+            continue
+
+        # Tabulka: hlavička + oddělovač |---|---|
+        if (stripped.startswith('|') and i + 1 < len(lines)
+                and _TABLE_SEP.match(lines[i + 1].strip())):
+            flush_paragraph()
+            header = ''.join(f'<th>{render_inline(c)}</th>' for c in _table_cells(stripped))
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                cells = ''.join(f'<td>{render_inline(c)}</td>'
+                                for c in _table_cells(lines[i]))
+                rows.append(f'<tr>{cells}</tr>')
+                i += 1
+            blocks.append(
+                f'<table><thead><tr>{header}</tr></thead>'
+                f'<tbody>{"".join(rows)}</tbody></table>'
+            )
+            continue
+
+        # Seznamy (odrážkový / číslovaný); pokračovací řádky patří k položce
+        ordered = _OL_ITEM.match(line) is not None
+        if ordered or _UL_ITEM.match(line):
+            flush_paragraph()
+            start = int(_OL_ITEM.match(line).group(1)) if ordered else 1
+            items: List[List[str]] = []
+            while i < len(lines):
+                item = _list_item(lines[i], ordered)
+                if item is not None:
+                    items.append([render_inline(item)])
+                elif lines[i].strip() and lines[i][:1].isspace():
+                    items[-1].append(render_inline(lines[i].strip()))
+                elif not lines[i].strip():
+                    # Prázdný řádek - seznam pokračuje jen další položkou
+                    j = i + 1
+                    while j < len(lines) and not lines[j].strip():
+                        j += 1
+                    if j < len(lines) and _list_item(lines[j], ordered) is not None:
+                        i = j
+                        continue
+                    break
+                else:
+                    break
+                i += 1
+            tag = 'ol' if ordered else 'ul'
+            start_attr = f' start="{start}"' if ordered and start != 1 else ''
+            body = ''.join(f'<li>{chr(10).join(item)}</li>' for item in items)
+            blocks.append(f'<{tag}{start_attr}>{body}</{tag}>')
+            continue
+
+        # Dvě mezery na konci řádku = zalomení
+        rendered = render_inline(stripped)
+        if line.endswith('  '):
+            rendered += '<br>'
+        paragraph.append(rendered)
+        i += 1
+
+    flush_paragraph()
+    return '\n'.join(blocks)
@@ -0,0 +1,157 @@
+"""
+Kompaktní serializace Plotly figur (binární typed arrays, volitelný orjson)
+Compact Plotly figure serialization (binary typed arrays, optional orjson)
+"""
+import base64
+import json
+from typing import Any, Dict, Union
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from config.settings import PLOTLY_PAYLOAD
+from views.fast_figure import FastFigure
+
+# Klíče tracu se souřadnicemi a indexy trojúhelníků
+_COORD_KEYS = ('x', 'y', 'z')
+_INDEX_KEYS = ('i', 'j', 'k')
+# Klíče, kde může být numerické pole barev / hodnot
+_VALUE_KEYS = ('intensity', 'facecolor', 'vertexcolor')
+
+_INT16_MAX = np.iinfo(np.int16).max
+# Délka obalu {"dtype":"f4","bdata":""} v JSON
+_TYPED_ARRAY_OVERHEAD = 27
+
+
+def encode_array(values: np.ndarray) -> Dict[str, str]:
+    """
+    Zakóduje numpy pole jako Plotly typed array {'dtype': ..., 'bdata': ...}
+
+    Args:
+        values: 1D numpy pole (float32, int16, int32, ...)
+
+    Returns:
+        Dict, kterému rozumí plotly.py >= 6 a plotly.js >= 2.28
+    """
+    values = np.ascontiguousarray(values)
+    return {
+        'dtype': values.dtype.str.lstrip('<|='),
+        'bdata': base64.b64encode(values.tobytes()).decode('ascii'),
+    }
+
+
+def _numeric(values: Any) -> Union[np.ndarray, None]:
+    """Vrátí values jako numerické numpy pole, nebo None (texty, skaláry)"""
+    if isinstance(values, (str, dict)) or np.isscalar(values) or values is None:
+        return None
+    array = np.asarray(values)
+    if array.ndim != 1 or array.dtype.kind not in 'iuf':
+        return None
+    return array
+
+
+def _smaller(array: np.ndarray, encoded: Dict[str, str], values: Any) -> Any:
+    """
+    Vybere kratší zápis: typed array, nebo původní hodnoty
+
+    Krátká celá čísla (např. vrcholy krychle ±1) jsou v JSON kratší než
+    base64; '/' v base64 plotly.io escapuje jako \\u002f (6 znaků).
+    """
+    bdata = encoded['bdata']
+    encoded_size = len(bdata) + 5 * bdata.count('/') + _TYPED_ARRAY_OVERHEAD
+    list_size = len(json.dumps(array.tolist()))
+    return encoded if encoded_size < list_size else values
+
+
+def _compact_float(values: Any) -> Any:
+    """Souřadnice / hodnoty -> float32 typed array (jinak beze změny)"""
+    array = _numeric(values)
+    if array is None:
+        return values
+    return _smaller(array, encode_array(array.astype(np.float32)), values)
+
+
+def _compact_index(values: Any) -> Any:
+    """Indexy -> int16 typed array, pokud se vejdou (jinak int32)"""
+    array = _numeric(values)
+    if array is None or array.dtype.kind == 'f':
+        return values
+    if len(array) and (array.min() < 0 or array.max() > _INT16_MAX):
+        return _smaller(array, encode_array(array.astype(np.int32)), values)
+    return _smaller(array, encode_array(array.astype(np.int16)), values)
+
+
+def compact_trace(trace: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Vrátí kopii tracu s numerickými poli zakódovanými jako typed arrays
+
+    Args:
+        trace: Trace jako dict (z FastFigure nebo to_plotly_json)
+
+    Returns:
+        Nový dict (původní trace se nemění)
+    """
+    compact = dict(trace)
+    for key in _COORD_KEYS + _VALUE_KEYS:
+        if key in compact:
+            compact[key] = _compact_float(compact[key])
+    for key in _INDEX_KEYS:
+        if key in compact:
+            compact[key] = _compact_index(compact[key])
+    marker = compact.get('marker')
+    if isinstance(marker, dict):
+        compact['marker'] = dict(marker)
+        for key in ('size', 'color'):
+            if key in marker:
+                compact['marker'][key] = _compact_float(marker[key])
+    return compact
+
+
+def figure_dict(fig: Union[go.Figure, FastFigure, Dict[str, Any]]) -> Dict[str, Any]:
+    """Vrátí figure z kteréhokoli backendu jako dict {'data': [...], 'layout': {...}}"""
+    if isinstance(fig, FastFigure):
+        return fig.to_dict()
+    if isinstance(fig, go.Figure):
+        return fig.to_plotly_json()
+    return fig
+
+
+def compact_figure_dict(fig: Union[go.Figure, FastFigure, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Převede figure na dict s kompaktními typed arrays
+
+    Pokud je PLOTLY_PAYLOAD['typed_arrays'] vypnuté, vrátí jen dict.
+
+    Args:
+        fig: go.Figure, FastFigure nebo už hotový dict figury
+
+    Returns:
+        Dict {'data': [...], 'layout': {...}}
+    """
+    fig_dict = figure_dict(fig)
+
+    if not PLOTLY_PAYLOAD['typed_arrays']:
+        return fig_dict
+
+    compact = dict(fig_dict)
+    compact['data'] = [compact_trace(trace) for trace in fig_dict.get('data', [])]
+    return compact
+
+
+def json_engine() -> str:
+    """Vrátí JSON engine z nastavení ('auto' = orjson, pokud je k dispozici)"""
+    return PLOTLY_PAYLOAD['json_engine']
+
+
+def configure_json_engine() -> None:
+    """Nastaví engine z PLOTLY_PAYLOAD jako výchozí pro plotly.io (i pro Streamlit)"""
+    pio.json.config.default_engine = json_engine()
+
+
+def to_json(fig: Union[go.Figure, FastFigure, Dict[str, Any]]) -> str:
+    """Serializuje figure (kompaktně) zvoleným JSON enginem bez validace"""
+    return pio.to_json(compact_figure_dict(fig), validate=False, engine=json_engine())
+
+
+def payload_size(fig: Union[go.Figure, FastFigure, Dict[str, Any]]) -> int:
+    """Velikost serializované figury v bajtech"""
+    return len(to_json(fig).encode('utf-8'))
@@ -0,0 +1,180 @@
+"""
+Inspektor výkonu v sidebaru (volitelný, pro ladění pomalých kroků)
+Opt-in performance inspector panel
+
+Zapíná se proměnnou prostředí (PERF_INSPECTOR['env_var'], např.
+PLATONIC_PERF=1 streamlit run app.py) nebo parametrem v URL (?perf=1).
+Ukáže časy posledního rerunu (registry, vyhledání kroku, vykreslení
+figury, serializace, sestavení protobufu v st.plotly_chart - bez
+přenosu a vykreslení v prohlížeči), velikost figury, počty traců podle
+typu a statistiky cache. Po rerunu fragmentu ukazuje jen fáze, které
+v něm proběhly. Vypnutý inspektor nic neměří (get_recorder vrací
+prázdný záznamník).
+"""
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator
+from config.settings import PERF_INSPECTOR
+
+_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+class PerfRecorder:
+    """
+    Časy a poznámky posledního rerunu jedné session
+
+    Použití:
+        recorder = get_recorder()
+        with recorder.run('celá aplikace'):
+            with recorder.measure('step lookup'):
+                step = registry.get_step_by_number(n)
+            recorder.note('payload', '12 kB')
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self.notes: Dict[str, Any] = {}
+        self.run_scope = None
+        self._depth = 0
+
+    def reset(self) -> None:
+        """Zapomene hodnoty předchozího rerunu"""
+        self.timings.clear()
+        self.notes.clear()
+
+    @contextmanager
+    def run(self, scope: str) -> Iterator[None]:
+        """
+        Ohraničí běh aplikace nebo fragmentu
+
+        Vnější běh (celá aplikace nebo samostatný rerun fragmentu) smaže
+        hodnoty předchozího rerunu a označí se jménem scope; fragment
+        vnořený do běhu aplikace nic nemaže.
+
+        Args:
+            scope: Popis běhu pro panel (např. 'fragment diagramu')
+        """
+        if self._depth == 0:
+            self.reset()
+            self.run_scope = scope
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Změří dobu bloku v ms pod daným jménem"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = (time.perf_counter() - start) * 1000
+
+    def note(self, name: str, value: Any) -> None:
+        """Uloží hodnotu k zobrazení v panelu"""
+        self.notes[name] = value
+
+
+class _DisabledRecorder(PerfRecorder):
+    """Záznamník pro vypnutý inspektor - nic neměří ani neukládá"""
+
+    enabled = False
+
+    def reset(self) -> None:
+        pass
+
+    def run(self, scope: str):
+        return nullcontext()
+
+    def measure(self, name: str):
+        return nullcontext()
+
+    def note(self, name: str, value: Any) -> None:
+        pass
+
+
+_DISABLED = _DisabledRecorder()
+
+
+def is_enabled() -> bool:
+    """Je inspektor zapnutý (proměnná prostředí nebo ?perf=1 v URL)?"""
+    if os.environ.get(PERF_INSPECTOR['env_var'], '').lower() in _TRUE_VALUES:
+        return True
+    import streamlit as st
+    return st.query_params.get(PERF_INSPECTOR['query_param'], '').lower() in _TRUE_VALUES
+
+
+def get_recorder() -> PerfRecorder:
+    """
+    Vrátí záznamník aktuální session
+
+    Returns:
+        PerfRecorder v st.session_state, nebo prázdný záznamník,
+        pokud je inspektor vypnutý
+    """
+    if not is_enabled():
+        return _DISABLED
+    import streamlit as st
+    if 'perf_recorder' not in st.session_state:
+        st.session_state.perf_recorder = PerfRecorder()
+    return st.session_state.perf_recorder
+
+
+def trace_counts(fig: Dict[str, Any]) -> Dict[str, int]:
+    """Počty traců figury podle typu (trace bez typu = scatter)"""
+    return dict(Counter(trace.get('type', 'scatter') for trace in fig['data']))
+
+
+def _format_bytes(size: int) -> str:
+    return f"{size / 1024:.1f} kB" if size >= 1024 else f"{size} B"
+
+
+def render_panel(recorder: PerfRecorder) -> None:
+    """
+    Vykreslí panel inspektoru (volá se uvnitř kontejneru v sidebaru)
+
+    Args:
+        recorder: Záznamník session (viz get_recorder)
+    """
+    import streamlit as st
+    from views.figure_cache import get_figure_cache
+    from views.prefetch import get_prefetcher
+
+    st.markdown("---")
+    st.subheader("⏱️ Výkon")
+    if recorder.run_scope:
+        st.caption(f"Poslední běh: {recorder.run_scope}")
+
+    rows = [{'fáze': name, 'ms': round(ms, 2)} for name, ms in recorder.timings.items()]
+    if rows:
+        st.dataframe(rows, hide_index=True, width='stretch')
+
+    notes = recorder.notes
+    if 'payload_bytes' in notes:
+        st.markdown(f"**Velikost figury:** {_format_bytes(notes['payload_bytes'])}")
+    if 'figure_source' in notes:
+        st.markdown(f"**Figura:** {notes['figure_source']}")
+    if notes.get('trace_counts'):
+        counts = ', '.join(f"{kind} × {count}"
+                           for kind, count in sorted(notes['trace_counts'].items()))
+        st.markdown(f"**Trace:** {counts}")
+
+    cache = get_figure_cache().stats()
+    lookups = cache['hits'] + cache['misses']
+    hit_rate = cache['hits'] / lookups if lookups else 0.0
+    st.markdown(
+        f"**Cache figur:** {cache['hits']} hit / {cache['misses']} miss "
+        f"({hit_rate:.0%}), {cache['size']}/{cache['maxsize']} položek"
+    )
+    prefetch = get_prefetcher().stats()
+    st.markdown(
+        f"**Prefetch:** {prefetch['hits']} hit / {prefetch['misses']} miss "
+        f"({prefetch['hit_rate']:.0%}), {prefetch['completed']} hotovo, "
+        f"{prefetch['pending']} ve frontě, {prefetch['cancelled']} zrušeno"
+    )
@@ -2,71 +2,109 @@
 Pomocné funkce pro vykreslování 3D diagramů pomocí Plotly
 Helper functions for rendering 3D diagrams with Plotly (interactive!)
 """
+import copy
+from functools import lru_cache
 import numpy as np
 import plotly.graph_objects as go
 from typing import List, Tuple, Union, Optional
-from config.settings import COLORS, SIZES
+from config.settings import COLORS, SIZES, PLOTLY_SCENE, PLOTLY_BACKEND
+from views.fast_figure import FastFigure
+
+# Figure z kteréhokoli backendu (validovaný go.Figure nebo rychlý FastFigure)
+AnyFigure = Union[go.Figure, FastFigure]
+
+
+def _settings_key() -> str:
+    """Otisk nastavení, ze kterých se skládá základní layout"""
+    return repr(sorted(PLOTLY_SCENE.items()))
+
+
+@lru_cache(maxsize=32)
+def _base_layout(axis_limits: Tuple[float, float], settings_key: str) -> go.Layout:
+    """
+    Sestaví a jednou zvaliduje základní layout 3D scény
+
+    Args:
+        axis_limits: Limity os (min, max)
+        settings_key: Otisk PLOTLY_SCENE - při změně nastavení vznikne nový záznam
+
+    Returns:
+        Zvalidovaný go.Layout (nesmí se měnit, slouží jako šablona)
+    """
+    axis = dict(
+        range=[axis_limits[0], axis_limits[1]],
+        gridcolor=PLOTLY_SCENE['gridcolor'],
+        showbackground=True,
+        backgroundcolor=PLOTLY_SCENE['backgroundcolor']
+    )
+    eye_x, eye_y, eye_z = PLOTLY_SCENE['camera_eye']
+    left, right, top, bottom = PLOTLY_SCENE['margin']
+
+    return go.Layout(
+        scene=dict(
+            xaxis=dict(axis, title='X'),
+            yaxis=dict(axis, title='Y'),
+            zaxis=dict(axis, title='Z'),
+            aspectmode=PLOTLY_SCENE['aspectmode'],  # Zajistí stejný poměr stran
+            camera=dict(
+                eye=dict(x=eye_x, y=eye_y, z=eye_z)  # Výchozí pozice kamery
+            )
+        ),
+        margin=dict(l=left, r=right, t=top, b=bottom),
+        height=PLOTLY_SCENE['height'],
+        showlegend=False
+    )
+
+
+@lru_cache(maxsize=32)
+def _base_layout_dict(axis_limits: Tuple[float, float], settings_key: str) -> dict:
+    """Základní layout jako obyčejný dict (pro FastFigure backend)"""
+    return _base_layout(axis_limits, settings_key).to_plotly_json()
 
 
 class PlotlyRenderer3D:
     """Helper třída pro vykreslování interaktivních 3D prvků pomocí Plotly"""
 
     @staticmethod
-    def create_figure(axis_limits: Tuple[float, float] = (-2, 2)) -> go.Figure:
+    def create_figure(axis_limits: Tuple[float, float] = (-2, 2),
+                      backend: Optional[str] = None) -> AnyFigure:
         """
         Vytvoří prázdný Plotly 3D figure s nastaveným layoutem
 
+        Layout se pro dané limity os sestaví jen jednou a nové figury
+        dostanou jeho kopii. Změna PLOTLY_SCENE v config.settings
+        cache automaticky obejde (jiný klíč).
+
         Args:
             axis_limits: Limity os (min, max)
+            backend: 'figure' (validovaný go.Figure) nebo 'fast' (FastFigure
+                     z obyčejných dict); None = PLOTLY_BACKEND z nastavení
 
         Returns:
-            Plotly Figure instance
+            Plotly Figure instance (nebo FastFigure)
         """
-        fig = go.Figure()
+        backend = backend or PLOTLY_BACKEND
+        key = (tuple(axis_limits), _settings_key())
 
-        # Nastav layout pro 3D scénu
-        fig.update_layout(
-            scene=dict(
-                xaxis=dict(
-                    range=[axis_limits[0], axis_limits[1]],
-                    title='X',
-                    gridcolor='lightgray',
-                    showbackground=True,
-                    backgroundcolor='white'
-                ),
-                yaxis=dict(
-                    range=[axis_limits[0], axis_limits[1]],
-                    title='Y',
-                    gridcolor='lightgray',
-                    showbackground=True,
-                    backgroundcolor='white'
-                ),
-                zaxis=dict(
-                    range=[axis_limits[0], axis_limits[1]],
-                    title='Z',
-                    gridcolor='lightgray',
-                    showbackground=True,
-                    backgroundcolor='white'
-                ),
-                aspectmode='cube',  # Zajistí stejný poměr stran
-                camera=dict(
-                    eye=dict(x=1.5, y=1.5, z=1.5)  # Výchozí pozice kamery
-                )
-            ),
-            margin=dict(l=0, r=0, t=30, b=0),
-            height=600,
-            showlegend=False
-        )
+        if backend == 'fast':
+            return FastFigure(layout=copy.deepcopy(_base_layout_dict(*key)))
+        if backend == 'figure':
+            return go.Figure(layout=_base_layout(*key))
+        raise ValueError(f"Neznámý Plotly backend: {backend!r}")
 
-        return fig
+    @staticmethod
+    def clear_layout_cache() -> None:
+        """Vymaže cache základních layoutů (např. po změně nastavení)"""
+        _base_layout.cache_clear()
+        _base_layout_dict.cache_clear()
 
     @staticmethod
-    def add_point(fig: go.Figure,
+    def add_point(fig: AnyFigure,
                   point: Union[np.ndarray, List, Tuple],
                   color: str = None,
                   size: int = None,
                   label: str = '',
-                  show_label: bool = True) -> go.Figure:
+                  show_label: bool = True) -> AnyFigure:
         """
         Přidá bod do Plotly figure
 
@@ -89,7 +127,8 @@ class PlotlyRenderer3D:
         point = np.array(point)
 
         # Přidej bod
-        fig.add_trace(go.Scatter3d(
+        fig.add_trace(dict(
+            type='scatter3d',
             x=[point[0]],
             y=[point[1]],
             z=[point[2]],
@@ -107,7 +146,8 @@ class PlotlyRenderer3D:
 
         # Přidej textový popisek, pokud je zadán
         if label and show_label:
-            fig.add_trace(go.Scatter3d(
+            fig.add_trace(dict(
+                type='scatter3d',
                 x=[point[0]],
                 y=[point[1]],
                 z=[point[2]],
@@ -122,15 +162,18 @@ class PlotlyRenderer3D:
         return fig
 
     @staticmethod
-    def add_points(fig: go.Figure,
+    def add_points(fig: AnyFigure,
                    points: np.ndarray,
                    colors: Union[str, List[str]] = None,
                    sizes: Union[int, List[int]] = None,
                    labels: Optional[List[str]] = None,
-                   show_labels: bool = True) -> go.Figure:
+                   show_labels: bool = True) -> AnyFigure:
         """
         Přidá více bodů najednou
 
+        Všechny body (včetně popisků) tvoří jediný Scatter3d trace
+        s poli barev, velikostí, textů a hover textů pro každý bod.
+
         Args:
             fig: Plotly Figure instance
             points: Array bodů tvaru (N, 3)
@@ -147,27 +190,58 @@ class PlotlyRenderer3D:
         if sizes is None:
             sizes = SIZES['point_default'] // 10
 
-        # Pokud je colors nebo sizes jen jedna hodnota, vytvoř z ní seznam
-        if isinstance(colors, str):
-            colors = [colors] * len(points)
-        if isinstance(sizes, int):
-            sizes = [sizes] * len(points)
-
-        for i, point in enumerate(points):
-            label = labels[i] if labels and i < len(labels) else ''
-            PlotlyRenderer3D.add_point(
-                fig, point, colors[i], sizes[i], label, show_labels
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        n = len(points)
+        if n == 0:
+            return fig
+
+        # Popisky doplň prázdnými řetězci na délku N
+        label_array = np.full(n, '', dtype=object)
+        if labels:
+            count = min(len(labels), n)
+            label_array[:count] = [str(label) for label in labels[:count]]
+        label_array = label_array.astype(str)
+
+        # Hover text: "popisek<br>(x, y, z)" pro všechny body najednou
+        coords = np.char.mod('%.2f', points)
+        hovertext = np.char.add(
+            np.char.add(label_array, '<br>('),
+            np.char.add(
+                np.char.add(np.char.add(coords[:, 0], ', '), coords[:, 1]),
+                np.char.add(np.char.add(', ', coords[:, 2]), ')')
             )
+        )
+
+        has_labels = show_labels and bool(np.any(label_array != ''))
+
+        fig.add_trace(dict(
+            type='scatter3d',
+            x=points[:, 0],
+            y=points[:, 1],
+            z=points[:, 2],
+            mode='markers+text' if has_labels else 'markers',
+            marker=dict(
+                size=sizes if np.isscalar(sizes) else list(sizes),
+                color=colors if isinstance(colors, str) else list(colors),
+                line=dict(color='black', width=2)
+            ),
+            text=label_array.tolist() if has_labels else None,
+            textposition='top center',
+            textfont=dict(size=12, color='black'),
+            hovertext=hovertext.tolist(),
+            hoverinfo='text',
+            showlegend=False
+        ))
 
         return fig
 
     @staticmethod
-    def add_edge(fig: go.Figure,
+    def add_edge(fig: AnyFigure,
                  p1: Union[np.ndarray, List],
                  p2: Union[np.ndarray, List],
                  color: str = None,
                  width: int = None,
-                 dash: str = 'solid') -> go.Figure:
+                 dash: str = 'solid') -> AnyFigure:
         """
         Přidá hranu mezi dvěma body
 
@@ -190,7 +264,8 @@ class PlotlyRenderer3D:
         p1 = np.array(p1)
         p2 = np.array(p2)
 
-        fig.add_trace(go.Scatter3d(
+        fig.add_trace(dict(
+            type='scatter3d',
             x=[p1[0], p2[0]],
             y=[p1[1], p2[1]],
             z=[p1[2], p2[2]],
@@ -203,37 +278,85 @@ class PlotlyRenderer3D:
         return fig
 
     @staticmethod
-    def add_edges(fig: go.Figure,
+    def add_edges(fig: AnyFigure,
                   vertices: np.ndarray,
                   edges: List[Tuple[int, int]],
-                  color: str = None,
-                  width: int = None,
-                  dash: str = 'solid') -> go.Figure:
+                  color: Union[str, List[str]] = None,
+                  width: Union[int, List[int]] = None,
+                  dash: str = 'solid',
+                  batched: bool = True) -> AnyFigure:
         """
         Přidá více hran najednou
 
+        V dávkovém režimu se hrany se stejným stylem (barva, tloušťka, dash)
+        spojí do jednoho Scatter3d tracu, úseky jsou oddělené NaN body.
+        Méně traců = rychlejší vykreslení v prohlížeči i v Kaleido exportu.
+
         Args:
             fig: Plotly Figure instance
             vertices: Array vrcholů tvaru (N, 3)
             edges: Seznam dvojic (i, j) indexů vrcholů
-            color: Barva hran
-            width: Tloušťka čar
+            color: Barva hran (jedna barva nebo seznam barev pro každou hranu)
+            width: Tloušťka čar (jedna hodnota nebo seznam pro každou hranu)
             dash: Styl čáry
+            batched: Zda spojit hrany stejného stylu do jednoho tracu
 
         Returns:
             Upravený Figure
         """
-        for i, j in edges:
-            PlotlyRenderer3D.add_edge(
-                fig, vertices[i], vertices[j], color, width, dash
-            )
+        if color is None:
+            color = COLORS['solid_edge']
+        if width is None:
+            width = SIZES['edge_width']
+
+        # Pokud je color nebo width jen jedna hodnota, vytvoř z ní seznam
+        if isinstance(color, str):
+            color = [color] * len(edges)
+        if not isinstance(width, (list, tuple, np.ndarray)):
+            width = [width] * len(edges)
+
+        if not batched:
+            for (i, j), c, w in zip(edges, color, width):
+                PlotlyRenderer3D.add_edge(
+                    fig, vertices[i], vertices[j], c, w, dash
+                )
+            return fig
+
+        if len(edges) == 0:
+            return fig
+
+        vertices = np.asarray(vertices, dtype=float)
+        edge_array = np.asarray(edges, dtype=int).reshape(-1, 2)
+
+        # Seskup hrany podle stylu (zachovej pořadí prvního výskytu)
+        groups = {}
+        for idx, style in enumerate(zip(color, width)):
+            groups.setdefault(style, []).append(idx)
+
+        for (group_color, group_width), indices in groups.items():
+            # Každý úsek = [p1, p2, NaN] -> Plotly čáru v NaN přeruší
+            segments = np.full((len(indices), 3, 3), np.nan)
+            segments[:, :2, :] = vertices[edge_array[indices]]
+            segments = segments.reshape(-1, 3)[:-1]
+
+            fig.add_trace(dict(
+                type='scatter3d',
+                x=segments[:, 0],
+                y=segments[:, 1],
+                z=segments[:, 2],
+                mode='lines',
+                line=dict(color=group_color, width=group_width, dash=dash),
+                connectgaps=False,
+                hoverinfo='skip',
+                showlegend=False
+            ))
 
         return fig
 
     @staticmethod
-    def add_axes_arrows(fig: go.Figure,
+    def add_axes_arrows(fig: AnyFigure,
                        length: float = 2.0,
-                       colors: Tuple[str, str, str] = ('red', 'green', 'blue')) -> go.Figure:
+                       colors: Tuple[str, str, str] = ('red', 'green', 'blue')) -> AnyFigure:
         """
         Přidá barevné osy souřadného systému
 
@@ -248,7 +371,8 @@ class PlotlyRenderer3D:
         origin = [0, 0, 0]
 
         # X osa (červená)
-        fig.add_trace(go.Scatter3d(
+        fig.add_trace(dict(
+            type='scatter3d',
             x=[0, length], y=[0, 0], z=[0, 0],
             mode='lines',
             line=dict(color=colors[0], width=4),
@@ -258,7 +382,8 @@ class PlotlyRenderer3D:
         ))
 
         # Y osa (zelená)
-        fig.add_trace(go.Scatter3d(
+        fig.add_trace(dict(
+            type='scatter3d',
             x=[0, 0], y=[0, length], z=[0, 0],
             mode='lines',
             line=dict(color=colors[1], width=4),
@@ -268,7 +393,8 @@ class PlotlyRenderer3D:
         ))
 
         # Z osa (modrá)
-        fig.add_trace(go.Scatter3d(
+        fig.add_trace(dict(
+            type='scatter3d',
             x=[0, 0], y=[0, 0], z=[0, length],
             mode='lines',
             line=dict(color=colors[2], width=4),
@@ -280,7 +406,7 @@ class PlotlyRenderer3D:
         return fig
 
     @staticmethod
-    def add_title(fig: go.Figure, title: str) -> go.Figure:
+    def add_title(fig: AnyFigure, title: str) -> AnyFigure:
         """
         Přidá titulek k figure
 
@@ -302,12 +428,12 @@ class PlotlyRenderer3D:
         return fig
 
     @staticmethod
-    def add_face(fig: go.Figure,
+    def add_face(fig: AnyFigure,
                  vertices: np.ndarray,
                  face_indices: List[int],
                  color: str = 'lightblue',
                  opacity: float = 0.3,
-                 show_edges: bool = False) -> go.Figure:
+                 show_edges: bool = False) -> AnyFigure:
         """
         Přidá jednu stěnu (plochu) do Plotly figure
 
@@ -322,77 +448,107 @@ class PlotlyRenderer3D:
         Returns:
             Upravený Figure
         """
-        # Pro trojúhelník použij Mesh3d
-        if len(face_indices) == 3:
-            face_vertices = vertices[face_indices]
-            fig.add_trace(go.Mesh3d(
-                x=face_vertices[:, 0],
-                y=face_vertices[:, 1],
-                z=face_vertices[:, 2],
-                i=[0],
-                j=[1],
-                k=[2],
-                color=color,
-                opacity=opacity,
-                hoverinfo='skip',
-                showlegend=False,
-                flatshading=True
-            ))
-        # Pro čtyřúhelník rozděl na dva trojúhelníky
-        elif len(face_indices) == 4:
-            face_vertices = vertices[face_indices]
-            fig.add_trace(go.Mesh3d(
-                x=face_vertices[:, 0],
-                y=face_vertices[:, 1],
-                z=face_vertices[:, 2],
-                i=[0, 0],
-                j=[1, 2],
-                k=[2, 3],
-                color=color,
-                opacity=opacity,
-                hoverinfo='skip',
-                showlegend=False,
-                flatshading=True
-            ))
-        # Pro pětiúhelník rozděl na tři trojúhelníky
-        elif len(face_indices) == 5:
-            face_vertices = vertices[face_indices]
-            fig.add_trace(go.Mesh3d(
-                x=face_vertices[:, 0],
-                y=face_vertices[:, 1],
-                z=face_vertices[:, 2],
-                i=[0, 0, 0],
-                j=[1, 2, 3],
-                k=[2, 3, 4],
-                color=color,
-                opacity=opacity,
-                hoverinfo='skip',
-                showlegend=False,
-                flatshading=True
-            ))
+        fig = PlotlyRenderer3D.add_faces(fig, vertices, [face_indices], color, opacity)
+
+        if show_edges:
+            n = len(face_indices)
+            edges = [(face_indices[k], face_indices[(k + 1) % n]) for k in range(n)]
+            fig = PlotlyRenderer3D.add_edges(fig, vertices, edges)
 
         return fig
 
     @staticmethod
-    def add_faces(fig: go.Figure,
+    def _triangulate_faces(faces: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rozloží konvexní n-úhelníky na trojúhelníky (vějířem z prvního vrcholu)
+
+        Args:
+            faces: Seznam stěn, kde každá stěna je seznam indexů vrcholů
+
+        Returns:
+            (triangles, face_of_triangle) - pole indexů tvaru (T, 3)
+            a index původní stěny pro každý trojúhelník
+        """
+        faces = [face for face in faces if len(face) >= 3]
+        if not faces:
+            return np.empty((0, 3), dtype=int), np.empty(0, dtype=int)
+
+        lengths = np.fromiter((len(face) for face in faces), dtype=int, count=len(faces))
+        flat = np.fromiter((idx for face in faces for idx in face), dtype=int,
+                           count=int(lengths.sum()))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        # Stěna s n vrcholy dá n - 2 trojúhelníků (0, k, k+1) pro k = 1..n-2
+        tri_counts = lengths - 2
+        face_of_triangle = np.repeat(np.arange(len(faces)), tri_counts)
+        tri_starts = np.concatenate(([0], np.cumsum(tri_counts)[:-1]))
+        local = np.arange(int(tri_counts.sum())) - np.repeat(tri_starts, tri_counts) + 1
+
+        base = starts[face_of_triangle]
+        triangles = np.stack([
+            flat[base],
+            flat[base + local],
+            flat[base + local + 1]
+        ], axis=1)
+
+        return triangles, face_of_triangle
+
+    @staticmethod
+    def add_faces(fig: AnyFigure,
                   vertices: np.ndarray,
                   faces: List[List[int]],
-                  color: str = 'lightblue',
-                  opacity: float = 0.3) -> go.Figure:
+                  color: Union[str, List[str]] = 'lightblue',
+                  opacity: float = 0.3) -> AnyFigure:
         """
         Přidá více stěn najednou
 
+        Všechny stěny tvoří jediný Mesh3d trace. Konvexní n-úhelníky
+        (libovolné n >= 3) se rozloží na trojúhelníky a do meshe se
+        přidá každý použitý vrchol jen jednou.
+
         Args:
             fig: Plotly Figure instance
             vertices: Array vrcholů tvaru (N, 3)
             faces: Seznam stěn, kde každá stěna je seznam indexů vrcholů
-            color: Barva stěn
+            color: Barva stěn (jedna barva nebo seznam barev pro každou stěnu)
             opacity: Průhlednost
 
         Returns:
             Upravený Figure
         """
-        for face in faces:
-            PlotlyRenderer3D.add_face(fig, vertices, face, color, opacity)
+        valid = [k for k, face in enumerate(faces) if len(face) >= 3]
+        if not valid:
+            return fig
+
+        triangles, face_of_triangle = PlotlyRenderer3D._triangulate_faces(
+            [faces[k] for k in valid]
+        )
+
+        # Ponech jen použité vrcholy, každý právě jednou
+        used, remapped = np.unique(triangles, return_inverse=True)
+        remapped = remapped.reshape(-1, 3)
+        mesh_vertices = np.asarray(vertices, dtype=float)[used]
+
+        mesh = dict(
+            type='mesh3d',
+            x=mesh_vertices[:, 0],
+            y=mesh_vertices[:, 1],
+            z=mesh_vertices[:, 2],
+            i=remapped[:, 0],
+            j=remapped[:, 1],
+            k=remapped[:, 2],
+            opacity=opacity,
+            hoverinfo='skip',
+            showlegend=False,
+            flatshading=True
+        )
+
+        if isinstance(color, str):
+            mesh['color'] = color
+        else:
+            face_colors = np.asarray(color, dtype=object)[valid]
+            mesh['facecolor'] = face_colors[face_of_triangle]
+
+        fig.add_trace(mesh)
 
         return fig
@@ -0,0 +1,208 @@
+"""
+Přednačítání figur sousedních kroků na pozadí
+Background prefetch of adjacent steps into the figure cache
+
+Když uživatel otevře krok N, fronta vláken sestaví figury kroků N+1 a N-1
+(se stejným nastavením zobrazení) do sdílené cache figur, takže tlačítko
+"Další" se obslouží z paměti. Při skoku jinam se nezačaté úlohy dané
+session zruší; běžící úlohy doběhnou (jejich výsledek v cache neuškodí).
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from config.settings import FIGURE_CACHE, PREFETCH
+from views.figure_cache import get_figure_cache, make_key
+from views.step_figures import get_step_figure
+
+
+def neighbor_numbers(current: int, total: int, radius: int = 1) -> List[int]:
+    """
+    Čísla sousedních kroků v pořadí priority (nejdřív další, pak předchozí)
+
+    Args:
+        current: Aktuální krok
+        total: Počet kroků (čísla 0 .. total-1)
+        radius: Kolik kroků na každou stranu
+
+    Returns:
+        Např. [N+1, N-1, N+2, N-2, ...] bez čísel mimo rozsah
+    """
+    numbers = []
+    for distance in range(1, radius + 1):
+        for number in (current + distance, current - distance):
+            if 0 <= number < total:
+                numbers.append(number)
+    return numbers
+
+
+class Prefetcher:
+    """
+    Fronta přednačítání s omezenou délkou a rušením podle session (thread-safe)
+
+    Použití:
+        prefetcher = get_prefetcher()
+        prefetcher.prefetch_neighbors(session_token, registry, 3, display)
+        ...
+        prefetcher.record_visit(make_key(4, display))   # hit / miss
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 8,
+                 max_ready: int = 128):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_ready = max_ready
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, Future] = {}
+        self._owners: Dict[str, set] = {}
+        # Přednačtené a zatím nenavštívené klíče (uspořádaná množina)
+        self._ready: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.scheduled = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.dropped = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Pool vláken se vytvoří až při prvním použití"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix='prefetch'
+            )
+        return self._executor
+
+    def schedule(self, owner: str, jobs: Dict[Hashable, Callable[[], Any]]) -> None:
+        """
+        Naplánuje sestavení figur pro jednu session
+
+        Nezačaté úlohy téže session, které v jobs nejsou, se zruší
+        (uživatel mezitím skočil jinam). Klíče, které už jsou v cache
+        nebo ve frontě, se přeskočí; plná fronta požadavek zahodí.
+
+        Args:
+            owner: Identifikátor session
+            jobs: {klíč cache figur: funkce, která figuru sestaví a uloží}
+        """
+        cache = get_figure_cache()
+        with self._lock:
+            for key in self._owners.get(owner, set()) - jobs.keys():
+                future = self._pending.get(key)
+                if future is not None and future.cancel():
+                    del self._pending[key]
+                    self.cancelled += 1
+
+            owned = set()
+            for key, build in jobs.items():
+                if key in self._pending:
+                    owned.add(key)
+                    continue
+                if key in cache:
+                    continue
+                if len(self._pending) >= self.max_pending:
+                    self.dropped += 1
+                    continue
+                self._pending[key] = self._get_executor().submit(self._run, key, build)
+                self.scheduled += 1
+                owned.add(key)
+            self._owners[owner] = owned
+
+    def _run(self, key: Hashable, build: Callable[[], Any]) -> None:
+        """Tělo úlohy ve vlákně poolu"""
+        try:
+            build()
+        except Exception:
+            with self._lock:
+                self.failed += 1
+                self._pending.pop(key, None)
+            return
+        with self._lock:
+            self.completed += 1
+            self._pending.pop(key, None)
+            self._ready[key] = None
+            while len(self._ready) > self.max_ready:
+                self._ready.popitem(last=False)
+
+    def prefetch_neighbors(self, owner: str, registry, current: int,
+                           display: Dict[str, Any], radius: int = 1) -> None:
+        """
+        Naplánuje figury kroků kolem aktuálního (viz neighbor_numbers)
+
+        Args:
+            owner: Identifikátor session
+            registry: StepRegistry (instance kroků vznikají až ve vlákně)
+            current: Číslo zobrazeného kroku
+            display: Nastavení zobrazení session
+            radius: Kolik kroků na každou stranu
+        """
+        display = dict(display)
+        jobs = {}
+        for number in neighbor_numbers(current, registry.get_step_count(), radius):
+            jobs[make_key(number, display)] = (
+                lambda number=number: get_step_figure(
+                    registry.get_step_by_number(number), display
+                )
+            )
+        self.schedule(owner, jobs)
+
+    def record_visit(self, key: Hashable) -> bool:
+        """
+        Zaznamená přechod na krok - hit, pokud byla figura přednačtená
+
+        Args:
+            key: Klíč cache figur zobrazeného kroku
+
+        Returns:
+            True při hitu
+        """
+        with self._lock:
+            if key in self._ready:
+                del self._ready[key]
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def clear(self) -> None:
+        """Zruší nezačaté úlohy a vynuluje počítadla"""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._owners.clear()
+            self._ready.clear()
+            self._reset_counters()
+
+    def stats(self) -> Dict[str, Any]:
+        """Vrátí počítadla fronty a úspěšnost přednačítání"""
+        with self._lock:
+            visits = self.hits + self.misses
+            return {
+                'scheduled': self.scheduled,
+                'completed': self.completed,
+                'failed': self.failed,
+                'cancelled': self.cancelled,
+                'dropped': self.dropped,
+                'pending': len(self._pending),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / visits if visits else 0.0,
+            }
+
+
+# Globální instance (sdílená všemi sessions v procesu)
+_global_prefetcher = Prefetcher(
+    workers=PREFETCH['workers'],
+    max_pending=PREFETCH['max_pending'],
+    max_ready=FIGURE_CACHE['maxsize'],
+)
+
+
+def get_prefetcher() -> Prefetcher:
+    """Vrátí globální instanci přednačítání"""
+    return _global_prefetcher
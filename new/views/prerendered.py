@@ -0,0 +1,165 @@
+"""
+Předrenderované figury kroků (artefakty z buildu)
+Build-time prerendered step figures
+
+prerender_figures.py při buildu zapíše figuru každého kroku s výchozím
+nastavením zobrazení jako gzip JSON s hashem obsahu v názvu:
+
+    prerendered/v2.0.0/
+        manifest.json
+        step_03.1a2b3c4d5e6f.json.gz
+
+Aplikace pak při výchozím nastavení jen načte hotový soubor místo
+přepočítání geometrie. Manifest nese otisk nastavení a obsahu kódu
+(PRERENDERED['sources']), ze kterého artefakty vznikly - pokud
+neodpovídá aktuální konfiguraci nebo kódu, artefakty se ignorují
+a kroky se vykreslí živě.
+"""
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from config.settings import (
+    APP_INFO, DISPLAY_DEFAULTS, PLOTLY_PAYLOAD, PLOTLY_SCENE, PRERENDERED
+)
+from utils.source_hash import source_digest
+
+MANIFEST_NAME = 'manifest.json'
+
+# Složka new/ (artefakty se hledají relativně k ní)
+_APP_ROOT = Path(__file__).resolve().parent.parent
+
+
+def artifact_dir(root: Optional[Path] = None) -> Path:
+    """
+    Verzovaná složka s artefakty
+
+    Args:
+        root: Kořenová složka artefaktů (výchozí = PRERENDERED['dir'])
+
+    Returns:
+        Cesta <root>/v<verze aplikace>
+    """
+    if root is None:
+        root = _APP_ROOT / PRERENDERED['dir']
+    return Path(root) / f"v{APP_INFO['version']}"
+
+
+def build_fingerprint() -> str:
+    """
+    Otisk konfigurace a kódu, které ovlivňují obsah předrenderovaných figur
+
+    Kód se hashuje podle obsahu souborů (utils/source_hash.py), takže
+    úprava kroku, scény nebo rendereru artefakty zneplatní i bez
+    zvýšení verze aplikace.
+    """
+    config = {
+        'sources': source_digest(PRERENDERED['sources']),
+        'format': PRERENDERED['format'],
+        'version': APP_INFO['version'],
+        'display': DISPLAY_DEFAULTS,
+        'scene': PLOTLY_SCENE,
+        'payload': PLOTLY_PAYLOAD,
+    }
+    data = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+def write_artifacts(figures: Iterable[tuple], outdir: Path) -> Dict[str, Any]:
+    """
+    Zapíše figury jako gzip JSON s hashem obsahu v názvu + manifest
+
+    Args:
+        figures: Dvojice (číslo kroku, serializovaná figura jako JSON str)
+        outdir: Verzovaná složka (viz artifact_dir)
+
+    Returns:
+        Zapsaný manifest
+    """
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    for number, fig_json in figures:
+        data = fig_json.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        name = f"step_{number:02d}.{digest}.json.gz"
+        path = outdir / name
+        if not path.exists():
+            # mtime=0 -> stejný obsah dává bajtově stejný soubor
+            path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        files[str(number)] = name
+
+    # Odstraň artefakty z předchozích buildů, na které manifest neukazuje
+    for stale in outdir.glob('step_*.json.gz'):
+        if stale.name not in files.values():
+            stale.unlink()
+
+    manifest = {
+        'fingerprint': build_fingerprint(),
+        'version': APP_INFO['version'],
+        'files': files,
+    }
+    (outdir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8'
+    )
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def _load_manifest(fingerprint: str) -> Optional[Dict[str, Any]]:
+    """Načte manifest, pokud byl sestaven se zadaným otiskem"""
+    path = artifact_dir() / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if manifest.get('fingerprint') != fingerprint:
+        return None
+    return manifest
+
+
+def load_manifest() -> Optional[Dict[str, Any]]:
+    """
+    Načte manifest artefaktů
+
+    Otisk se ověřuje při každém volání (soubory se znovu hashují jen po
+    změně) - po úpravě kódu za běhu se artefakty přestanou používat.
+    Manifest se čte jen při změně otisku.
+
+    Returns:
+        Manifest, nebo None pokud chybí, je vypnutý nebo neodpovídá konfiguraci
+    """
+    if not PRERENDERED['enabled']:
+        return None
+    return _load_manifest(build_fingerprint())
+
+
+def load_prerendered_figure(step_number: int) -> Optional[Dict[str, Any]]:
+    """
+    Načte předrenderovanou figuru kroku (výchozí nastavení zobrazení)
+
+    Args:
+        step_number: Číslo kroku
+
+    Returns:
+        Dict figury pro st.plotly_chart, nebo None (-> vykreslit živě)
+    """
+    manifest = load_manifest()
+    if manifest is None:
+        return None
+    name = manifest['files'].get(str(step_number))
+    if name is None:
+        return None
+    try:
+        data = gzip.decompress((artifact_dir() / name).read_bytes())
+    except OSError:
+        return None
+    return json.loads(data)
+
+
+def clear_manifest_cache() -> None:
+    """Zapomene načtený manifest (po novém buildu ve stejném procesu)"""
+    _load_manifest.cache_clear()
@@ -134,6 +134,29 @@ class Renderer3D:
             Renderer3D.draw_edge(ax, vertices[i], vertices[j],
                                 color, width, style, alpha)
 
+    @staticmethod
+    def draw_faces(ax, vertices: np.ndarray,
+                   faces: List[List[int]],
+                   color: Union[str, List[str]] = 'lightblue',
+                   alpha: float = 0.3) -> None:
+        """
+        Nakreslí stěny (polygony)
+
+        Args:
+            ax: Matplotlib 3D axes
+            vertices: Array vrcholů tvaru (N, 3)
+            faces: Seznam stěn, kde každá stěna je seznam indexů vrcholů
+            color: Jedna barva nebo seznam barev pro každou stěnu
+            alpha: Průhlednost
+        """
+        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+        vertices = np.asarray(vertices)
+        polygons = [vertices[list(face)] for face in faces]
+        ax.add_collection3d(Poly3DCollection(
+            polygons, facecolors=color, alpha=alpha, edgecolors='none'
+        ))
+
     @staticmethod
     def draw_axes_arrows(ax, length: float = 2.0,
                         colors: Tuple[str, str, str] = ('red', 'green', 'blue')) -> None:
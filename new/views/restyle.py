@@ -0,0 +1,121 @@
+"""
+Rychlá změna stylu hotové figury bez přepočtu geometrie
+Restyle-only fast path for display setting changes
+
+compile_plotly označí každý trace skupinou (faces / edges / vertices)
+a vazbami na nastavení ze sidebaru v trace['meta']:
+
+    {'group': 'faces', 'bind': {'opacity': ['face_opacity', 0.3, 0.0],
+                                'color': ['face_color']}}
+
+Vazba [klíč, scale, offset] znamená hodnota = display[klíč] * scale + offset,
+[klíč] znamená hodnota = display[klíč]. restyle_figure pak při změně barvy,
+průhlednosti, tloušťky hran nebo velikosti vrcholů jen přepíše tyto
+vlastnosti na kopii cachované figury. Pole souřadnic se sdílí, nekopírují.
+
+Nastavení ve STRUCTURAL_SETTINGS mění počet traců (show_faces přidává nebo
+ubírá stěny) - ta se restylem řešit nedají a figura se musí sestavit znovu.
+"""
+from typing import Any, Dict, List, Optional
+
+# Nastavení, která mění strukturu figury (ne jen styl)
+STRUCTURAL_SETTINGS = ('show_faces',)
+
+# Skupiny traců
+FACES = 'faces'
+EDGES = 'edges'
+VERTICES = 'vertices'
+
+
+def binding(key: str, scale: float = 1.0, offset: float = 0.0) -> List[Any]:
+    """
+    Vazba číselné vlastnosti na nastavení: display[key] * scale + offset
+
+    Args:
+        key: Klíč nastavení (např. 'face_opacity')
+        scale: Násobek
+        offset: Posun
+
+    Returns:
+        Serializovatelný popis vazby pro trace['meta']
+    """
+    return [key, scale, offset]
+
+
+def scaled(value: float, scale: float = 1.0, offset: float = 0.0) -> float:
+    """value * scale + offset (celé číslo zůstane celé, pokud se nemění)"""
+    if scale != 1:
+        value = value * scale
+    if offset:
+        value = value + offset
+    return value
+
+
+def tag_traces(fig, start: int, group: str,
+               bind: Optional[Dict[str, List[Any]]] = None) -> None:
+    """
+    Označí trace přidané od indexu start skupinou a vazbami na nastavení
+
+    Args:
+        fig: go.Figure nebo FastFigure
+        start: Počet traců před přidáním skupiny
+        group: FACES, EDGES nebo VERTICES
+        bind: {cesta vlastnosti: vazba}, např. {'line.width': ['edge_width', 1.0, 0.0]}
+    """
+    meta = {'group': group}
+    if bind:
+        meta['bind'] = bind
+    for index in range(start, len(fig.data)):
+        fig.data[index]['meta'] = meta
+
+
+def structural_key(display: Dict[str, Any]) -> tuple:
+    """Část nastavení, na které závisí struktura figury (klíč základní figury)"""
+    return tuple((key, display[key]) for key in STRUCTURAL_SETTINGS)
+
+
+def _bound_value(spec: List[Any], display: Dict[str, Any]) -> Any:
+    """Spočítá hodnotu vazby pro dané nastavení"""
+    if len(spec) == 1:
+        return display[spec[0]]
+    key, scale, offset = spec
+    return scaled(display[key], scale, offset)
+
+
+def _patch(trace: Dict[str, Any], path: str, value: Any) -> Dict[str, Any]:
+    """Vrátí kopii tracu s přepsanou vlastností (vnořené dicty se kopírují)"""
+    patched = dict(trace)
+    target = patched
+    *parents, name = path.split('.')
+    for parent in parents:
+        target[parent] = dict(target.get(parent) or {})
+        target = target[parent]
+    target[name] = value
+    return patched
+
+
+def restyle_figure(fig_dict: Dict[str, Any], display: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Vrátí figuru s vlastnostmi přepočtenými podle nastavení zobrazení
+
+    Původní figura (typicky sdílená z cache) se nemění; nové jsou jen
+    trace s vazbami, ostatní trace i layout se sdílí.
+
+    Args:
+        fig_dict: Dict figury z compile_plotly (trace s meta vazbami)
+        display: Nastavení zobrazení se stejnými STRUCTURAL_SETTINGS,
+                 s jakými figura vznikla
+
+    Returns:
+        Dict figury pro st.plotly_chart
+    """
+    data = []
+    for trace in fig_dict.get('data', []):
+        bind = (trace.get('meta') or {}).get('bind')
+        if bind:
+            for path, spec in bind.items():
+                trace = _patch(trace, path, _bound_value(spec, display))
+        data.append(trace)
+    restyled = dict(fig_dict)
+    restyled['data'] = data
+    return restyled
@@ -0,0 +1,215 @@
+"""
+Popis 3D scény nezávislý na vykreslovacím backendu
+Renderer-agnostic scene description compiled to Plotly or matplotlib
+
+Krok sestaví Scene jednou (skupiny bodů, hran a stěn jako numpy pole)
+a kompilátory z ní udělají Plotly figure nebo matplotlib 3D axes.
+Styly, které závisí na nastavení v sidebaru (tloušťka hran, velikost
+vrcholů, barva a průhlednost stěn), se doplní až při kompilaci a trace
+nesou vazby na tato nastavení (viz views/restyle.py).
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+from views.plotly_renderer import AnyFigure, PlotlyRenderer3D
+from views.restyle import EDGES, FACES, VERTICES, binding, scaled, tag_traces
+
+# Plotly velikosti bodů jsou zhruba desetkrát menší než v matplotlib
+_MATPLOTLIB_SIZE_FACTOR = 10
+
+# Plotly dash -> matplotlib linestyle
+_MATPLOTLIB_DASH = {'solid': '-', 'dash': '--', 'dot': ':', 'dashdot': '-.'}
+
+
+def _frozen(array: Any) -> np.ndarray:
+    """
+    Vrátí float pole jen pro čtení bez zbytečné kopie
+
+    Sdílená geometrie (models/solids.py) už je float a jen pro čtení -
+    použije se přímo. Zapisovatelné pole volajícího se nemění: dostane
+    se jeho pohled jen pro čtení (kopie jen při převodu typu / seznamu).
+    """
+    array = np.asarray(array, dtype=float)
+    if array.flags.writeable:
+        array = array.view()
+        array.setflags(write=False)
+    return array
+
+
+@dataclass
+class PointGroup:
+    """Skupina bodů se společným stylem (sizes=None = velikost ze sidebaru)"""
+    points: np.ndarray
+    colors: Union[str, List[str]] = 'red'
+    sizes: Union[float, List[float], None] = None
+    size_scale: float = 1.0
+    labels: Optional[List[str]] = None
+    show_labels: bool = True
+
+    def __post_init__(self):
+        self.points = _frozen(self.points).reshape(-1, 3)
+
+
+@dataclass
+class EdgeGroup:
+    """
+    Skupina hran (width=None = tloušťka ze sidebaru)
+
+    Tloušťka ze sidebaru se přepočte jako edge_width * width_scale + width_offset.
+    """
+    vertices: np.ndarray
+    edges: List[Tuple[int, int]]
+    color: Union[str, List[str]] = 'blue'
+    width: Union[int, List[int], None] = None
+    dash: str = 'solid'
+    width_scale: float = 1.0
+    width_offset: float = 0.0
+
+    def __post_init__(self):
+        self.vertices = _frozen(self.vertices).reshape(-1, 3)
+
+
+@dataclass
+class FaceGroup:
+    """
+    Skupina stěn (color/opacity=None = hodnota ze sidebaru)
+
+    opacity_scale násobí průhlednost ze sidebaru (např. 0.3 pro vnější těleso).
+    """
+    vertices: np.ndarray
+    faces: List[List[int]]
+    color: Union[str, List[str], None] = None
+    opacity: Optional[float] = None
+    opacity_scale: float = 1.0
+
+    def __post_init__(self):
+        self.vertices = _frozen(self.vertices).reshape(-1, 3)
+
+
+@dataclass
+class Scene:
+    """Celá scéna kroku - vykresluje se v pořadí stěny, hrany, body"""
+    title: str
+    axis_limits: Tuple[float, float] = (-2, 2)
+    faces: List[FaceGroup] = field(default_factory=list)
+    edges: List[EdgeGroup] = field(default_factory=list)
+    points: List[PointGroup] = field(default_factory=list)
+
+
+def _point_sizes(group: PointGroup, display: Dict[str, Any]) -> Union[float, List[float]]:
+    """Velikosti bodů v Plotly jednotkách"""
+    sizes = display['vertex_size'] if group.sizes is None else group.sizes
+    if np.isscalar(sizes):
+        return scaled(sizes, group.size_scale)
+    return [scaled(size, group.size_scale) for size in sizes]
+
+
+def _edge_width(group: EdgeGroup, display: Dict[str, Any]) -> Union[float, List[int]]:
+    """Tloušťka hran podle skupiny a nastavení"""
+    if group.width is not None:
+        return group.width
+    return scaled(display['edge_width'], group.width_scale, group.width_offset)
+
+
+def _face_style(group: FaceGroup, display: Dict[str, Any]) -> Tuple[Any, float]:
+    """Barva a průhlednost stěn podle skupiny a nastavení"""
+    color = display['face_color'] if group.color is None else group.color
+    opacity = display['face_opacity'] if group.opacity is None else group.opacity
+    return color, opacity * group.opacity_scale
+
+
+def compile_plotly(scene: Scene, display: Dict[str, Any]) -> AnyFigure:
+    """
+    Zkompiluje scénu do Plotly figure (přes PlotlyRenderer3D)
+
+    Args:
+        scene: Popis scény
+        display: Nastavení zobrazení (show_faces, face_opacity, face_color,
+                 edge_width, vertex_size)
+
+    Returns:
+        Plotly Figure (backend podle PLOTLY_BACKEND)
+    """
+    fig = PlotlyRenderer3D.create_figure(axis_limits=scene.axis_limits)
+    fig = PlotlyRenderer3D.add_title(fig, scene.title)
+
+    if display['show_faces']:
+        for group in scene.faces:
+            color, opacity = _face_style(group, display)
+            start = len(fig.data)
+            fig = PlotlyRenderer3D.add_faces(
+                fig, group.vertices, group.faces, color=color, opacity=opacity
+            )
+            bind = {}
+            if group.color is None:
+                bind['color'] = ['face_color']
+            if group.opacity is None:
+                bind['opacity'] = binding('face_opacity', group.opacity_scale)
+            tag_traces(fig, start, FACES, bind)
+
+    for group in scene.edges:
+        start = len(fig.data)
+        fig = PlotlyRenderer3D.add_edges(
+            fig, group.vertices, group.edges,
+            color=group.color, width=_edge_width(group, display), dash=group.dash
+        )
+        bind = {}
+        if group.width is None:
+            bind['line.width'] = binding('edge_width', group.width_scale, group.width_offset)
+        tag_traces(fig, start, EDGES, bind)
+
+    for group in scene.points:
+        start = len(fig.data)
+        fig = PlotlyRenderer3D.add_points(
+            fig, group.points, colors=group.colors,
+            sizes=_point_sizes(group, display),
+            labels=group.labels, show_labels=group.show_labels
+        )
+        bind = {}
+        if group.sizes is None:
+            bind['marker.size'] = binding('vertex_size', group.size_scale)
+        tag_traces(fig, start, VERTICES, bind)
+
+    return fig
+
+
+def compile_matplotlib(scene: Scene, ax, display: Dict[str, Any]) -> None:
+    """
+    Zkompiluje scénu do matplotlib 3D axes (přes Renderer3D)
+
+    Osy a titulek nastavuje krok (setup_axes), zde se kreslí jen obsah.
+
+    Args:
+        scene: Popis scény
+        ax: Matplotlib 3D Axes
+        display: Nastavení zobrazení (viz compile_plotly)
+    """
+    # Legacy backend - načte se až při prvním použití
+    from views.renderer import Renderer3D
+
+    if display['show_faces']:
+        for group in scene.faces:
+            color, opacity = _face_style(group, display)
+            Renderer3D.draw_faces(ax, group.vertices, group.faces,
+                                  color=color, alpha=opacity)
+
+    for group in scene.edges:
+        width = _edge_width(group, display)
+        style = _MATPLOTLIB_DASH.get(group.dash, '-')
+        colors = group.color
+        if isinstance(colors, str):
+            colors = [colors] * len(group.edges)
+        widths = width if isinstance(width, (list, tuple)) else [width] * len(group.edges)
+        for (i, j), color, edge_width in zip(group.edges, colors, widths):
+            Renderer3D.draw_edge(ax, group.vertices[i], group.vertices[j],
+                                 color=color, width=edge_width, style=style)
+
+    for group in scene.points:
+        sizes = _point_sizes(group, display)
+        if np.isscalar(sizes):
+            sizes = [sizes] * len(group.points)
+        Renderer3D.draw_points(
+            ax, group.points, colors=group.colors,
+            sizes=[size * _MATPLOTLIB_SIZE_FACTOR for size in sizes],
+            labels=group.labels if group.show_labels else None
+        )
@@ -0,0 +1,358 @@
+"""
+Statický export celého tutoriálu (HTML + JS, bez Pythonu při prohlížení)
+Fully client-side static export of the tutorial
+
+export_static.py zapíše složku, kterou stačí nahrát na libovolný statický
+server (nebo otevřít z disku):
+
+    static_site/
+        index.html                      # sidebar, navigace, popisy kroků
+        assets/plotly-<verze>.min.js    # plotly.js jen jednou
+        figures/step_03.1a2b3c4d5e6f.js # data figury, načtou se až při zobrazení
+
+Popisy kroků (Markdown převedený na HTML) jsou přímo v index.html,
+figury se stahují líně po krocích jako <script> (funguje i z file://)
+a sousední kroky se přednačtou na pozadí. Navigace používá odkazy
+#krok-N, takže funguje tlačítko Zpět i záložky.
+"""
+import hashlib
+import json
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, Iterable, Mapping, Optional
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+from config.settings import APP_INFO, LAYOUT, PAGE_CONFIG, STATIC_EXPORT
+from views.markdown_html import markdown_to_html
+from views.step_figures import chart_config
+
+# Složka new/ (výchozí výstup se počítá relativně k ní)
+_APP_ROOT = Path(__file__).resolve().parent.parent
+
+
+def site_dir(root: Optional[Path] = None) -> Path:
+    """
+    Výstupní složka statického exportu
+
+    Args:
+        root: Vlastní složka (výchozí = STATIC_EXPORT['dir'])
+
+    Returns:
+        Cesta ke složce
+    """
+    if root is None:
+        return _APP_ROOT / STATIC_EXPORT['dir']
+    return Path(root)
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Zapíše soubor jen při změně obsahu (zachová mtime pro cache serveru)"""
+    if path.exists() and path.read_bytes() == data:
+        return
+    path.write_bytes(data)
+
+
+def _embed_json(data: Any) -> str:
+    """JSON pro vložení do <script type="application/json"> (bez </)"""
+    return json.dumps(data, ensure_ascii=False).replace('</', '<\\/')
+
+
+def figure_script(step_number: int, fig_json: str) -> str:
+    """
+    Obsah JS souboru s figurou kroku
+
+    Figura se předává jako JSON text - stránka ho při každém zobrazení
+    znovu parsuje, takže Plotly.react dostane vždy čerstvé objekty.
+
+    Args:
+        step_number: Číslo kroku
+        fig_json: Serializovaná figura (views/payload.to_json)
+
+    Returns:
+        JS volající window.registerStepFigure(číslo, json)
+    """
+    return f"window.registerStepFigure({step_number}, {json.dumps(fig_json)});\n"
+
+
+def write_site(steps: Iterable[tuple], menu: Mapping[str, tuple],
+               outdir: Path) -> Dict[str, Any]:
+    """
+    Zapíše statický web: index.html, plotly.js a JS soubory figur
+
+    Args:
+        steps: Trojice (StepMetadata, Markdown popis, figura jako JSON str)
+        menu: Menu sidebaru {kategorie: ((číslo, short_name), ...)}
+              (StepRegistry.get_sidebar_menu)
+        outdir: Výstupní složka (viz site_dir)
+
+    Returns:
+        Souhrn {'plotly_js': ..., 'figures': {číslo: soubor}, 'bytes': ...}
+    """
+    outdir = Path(outdir)
+    (outdir / 'assets').mkdir(parents=True, exist_ok=True)
+    (outdir / 'figures').mkdir(parents=True, exist_ok=True)
+
+    plotly_js = f"assets/plotly-{get_plotlyjs_version()}.min.js"
+    _write_if_changed(outdir / plotly_js, get_plotlyjs().encode('utf-8'))
+
+    entries = []
+    figures = {}
+    for metadata, description, fig_json in steps:
+        data = figure_script(metadata.number, fig_json).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        name = f"figures/step_{metadata.number:02d}.{digest}.js"
+        _write_if_changed(outdir / name, data)
+        figures[metadata.number] = name
+        entries.append({
+            'number': metadata.number,
+            'category': metadata.category,
+            'title': metadata.title,
+            'short_name': metadata.short_name,
+            'description': markdown_to_html(description),
+            'figure': name,
+        })
+
+    # Odstraň figury z předchozích exportů
+    for stale in (outdir / 'figures').glob('step_*.js'):
+        if f"figures/{stale.name}" not in figures.values():
+            stale.unlink()
+    for stale in (outdir / 'assets').glob('plotly-*.min.js'):
+        if f"assets/{stale.name}" != plotly_js:
+            stale.unlink()
+
+    tutorial = {
+        'steps': entries,
+        'menu': [[category, [list(item) for item in items]]
+                 for category, items in menu.items()],
+        'config': chart_config(0),
+    }
+    index = render_index(tutorial, plotly_js)
+    _write_if_changed(outdir / 'index.html', index.encode('utf-8'))
+
+    size = sum(path.stat().st_size for path in outdir.rglob('*') if path.is_file())
+    return {'plotly_js': plotly_js, 'figures': figures, 'bytes': size}
+
+
+def render_index(tutorial: Dict[str, Any], plotly_js: str) -> str:
+    """
+    Sestaví index.html (layout aplikace: sidebar, navigace, diagram + popis)
+
+    Args:
+        tutorial: Data stránky (kroky, menu, config grafu)
+        plotly_js: Relativní cesta k plotly.js
+
+    Returns:
+        HTML stránky
+    """
+    diagram = LAYOUT['diagram_column_ratio']
+    description = LAYOUT['description_column_ratio']
+    return _INDEX_TEMPLATE.substitute(
+        page_title=PAGE_CONFIG['page_title'],
+        page_icon=PAGE_CONFIG['page_icon'],
+        version=APP_INFO['version'],
+        diagram_flex=f"{diagram:g}",
+        description_flex=f"{description:g}",
+        plotly_js=plotly_js,
+        tutorial_json=_embed_json(tutorial),
+    )
+
+
+_INDEX_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="cs">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$page_title</title>
+<link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>$page_icon</text></svg>">
+<style>
+  * { box-sizing: border-box; }
+  body { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif;
+         color: #31333f; display: flex; min-height: 100vh; }
+  #sidebar { width: 300px; flex: none; background: #f0f2f6; padding: 1.5rem 1rem;
+             height: 100vh; position: sticky; top: 0; overflow-y: auto; }
+  #sidebar h2 { margin-top: 0; }
+  #sidebar h3 { font-size: 1.05rem; margin: 1.2rem 0 .4rem; }
+  #sidebar a.step { display: block; padding: .45rem .75rem; margin: .25rem 0;
+                    border: 1px solid #d6d6d9; border-radius: .5rem; background: #fff;
+                    color: inherit; text-decoration: none; }
+  #sidebar a.step:hover { border-color: #ff4b4b; color: #ff4b4b; }
+  #sidebar a.step.active { border-color: #ff4b4b; background: #ffecec; }
+  main { flex: 1; min-width: 0; padding: 2rem 3rem; }
+  hr { border: none; border-top: 1px solid #e6e6ea; margin: 1.5rem 0; }
+  .nav { display: flex; align-items: center; gap: 1rem; }
+  .nav > * { flex: 1; }
+  .nav .counter { flex: 2; text-align: center; margin: 0; }
+  .nav a { display: block; text-align: center; padding: .45rem .75rem;
+           border: 1px solid #d6d6d9; border-radius: .5rem;
+           color: inherit; text-decoration: none; }
+  .nav a:hover { border-color: #ff4b4b; color: #ff4b4b; }
+  .nav a[hidden] { display: block; visibility: hidden; }
+  .columns { display: flex; gap: 2rem; }
+  .diagram-column { flex: $diagram_flex; min-width: 0; }
+  .description-column { flex: $description_flex; min-width: 0; }
+  .tip { background: #e8f0fe; border-radius: .5rem; padding: .75rem 1rem; }
+  #diagram { width: 100%; height: 650px; }
+  #diagram.loading { opacity: .4; }
+  pre { background: #f6f7f9; padding: .75rem 1rem; border-radius: .5rem; overflow-x: auto; }
+  table { border-collapse: collapse; }
+  th, td { border: 1px solid #e6e6ea; padding: .3rem .6rem; }
+  @media (max-width: 900px) {
+    body { flex-direction: column; }
+    #sidebar { width: auto; height: auto; position: static; }
+    main { padding: 1rem; }
+    .columns { flex-direction: column; }
+  }
+</style>
+</head>
+<body>
+<nav id="sidebar">
+  <h2>📐 Navigace</h2>
+  <hr>
+  <div id="menu"></div>
+  <hr>
+  <h3>💡 Tip:</h3>
+  <p>Můžeš otáčet 3D diagramem myší!</p>
+  <h3>📚 O aplikaci:</h3>
+  <p>Interaktivní tutoriál pro konstrukci Platónských těles.</p>
+  <p><strong>Verze:</strong> $version</p>
+</nav>
+<main>
+  <h1>📐 Platónská tělesa - Interaktivní tutoriál</h1>
+  <hr>
+  <div class="nav" data-position="top"></div>
+  <hr>
+  <div class="columns">
+    <section class="diagram-column">
+      <h3>🔷 Interaktivní 3D Diagram</h3>
+      <p class="tip">💡 <strong>Tip:</strong> Použij myš k otáčení diagramu! Scroll kolečkem přiblíží/oddálí.</p>
+      <div id="diagram"></div>
+    </section>
+    <section class="description-column">
+      <h3>📝 Vysvětlení</h3>
+      <div id="description"></div>
+    </section>
+  </div>
+  <hr>
+  <div class="nav" data-position="bottom"></div>
+</main>
+<script id="tutorial-data" type="application/json">$tutorial_json</script>
+<script src="$plotly_js" charset="utf-8"></script>
+<script>
+(function () {
+  'use strict';
+  var tutorial = JSON.parse(document.getElementById('tutorial-data').textContent);
+  var steps = tutorial.steps;
+  var positions = {};          // číslo kroku -> pozice v steps
+  var figures = {};            // číslo kroku -> JSON figury
+  var waiting = {};            // číslo kroku -> callbacky čekající na načtení
+  var current = null;
+
+  steps.forEach(function (step, position) { positions[step.number] = position; });
+
+  // Volá JS soubor figury (figures/step_XX.<hash>.js)
+  window.registerStepFigure = function (number, json) {
+    figures[number] = json;
+    var callbacks = waiting[number] || [];
+    delete waiting[number];
+    callbacks.forEach(function (callback) { callback(json); });
+  };
+
+  function loadFigure(step, callback) {
+    if (figures[step.number] !== undefined) {
+      if (callback) callback(figures[step.number]);
+      return;
+    }
+    if (waiting[step.number]) {
+      if (callback) waiting[step.number].push(callback);
+      return;
+    }
+    waiting[step.number] = callback ? [callback] : [];
+    var script = document.createElement('script');
+    script.src = step.figure;
+    script.onerror = function () {
+      delete waiting[step.number];
+      script.remove();
+    };
+    document.head.appendChild(script);
+  }
+
+  function link(text, step, className) {
+    var a = document.createElement('a');
+    a.textContent = text;
+    if (className) a.className = className;
+    if (step) a.href = '#krok-' + step.number; else a.hidden = true;
+    return a;
+  }
+
+  function renderMenu() {
+    var menu = document.getElementById('menu');
+    tutorial.menu.forEach(function (group) {
+      var heading = document.createElement('h3');
+      heading.textContent = group[0];
+      menu.appendChild(heading);
+      group[1].forEach(function (item) {
+        var a = link(item[0] + '. ' + item[1], {number: item[0]}, 'step');
+        a.dataset.step = item[0];
+        menu.appendChild(a);
+      });
+    });
+  }
+
+  function renderNavigation(position) {
+    var total = steps.length;
+    document.querySelectorAll('.nav').forEach(function (nav) {
+      nav.textContent = '';
+      nav.appendChild(link('⬅️ Předchozí', steps[position - 1]));
+      var counter = document.createElement('h4');
+      counter.className = 'counter';
+      counter.textContent = 'Krok ' + steps[position].number + ' / ' + steps[total - 1].number;
+      nav.appendChild(counter);
+      nav.appendChild(link('Další ➡️', steps[position + 1]));
+    });
+  }
+
+  function show(number) {
+    var position = positions[number];
+    if (position === undefined) position = 0;
+    var step = steps[position];
+    current = step.number;
+
+    renderNavigation(position);
+    document.getElementById('description').innerHTML = step.description;
+    document.querySelectorAll('#menu a.step').forEach(function (a) {
+      a.classList.toggle('active', Number(a.dataset.step) === step.number);
+    });
+
+    var diagram = document.getElementById('diagram');
+    diagram.classList.add('loading');
+    loadFigure(step, function (json) {
+      if (current !== step.number) return;   // uživatel mezitím odešel jinam
+      var figure = JSON.parse(json);
+      var config = JSON.parse(JSON.stringify(tutorial.config));
+      config.toImageButtonOptions.filename = 'platonic_solid_step_' + step.number;
+      config.responsive = true;
+      Plotly.react(diagram, figure.data || [], figure.layout || {}, config);
+      diagram.classList.remove('loading');
+
+      // Sousední kroky se stáhnou předem (tlačítka Předchozí/Další)
+      [position + 1, position - 1].forEach(function (neighbor) {
+        if (steps[neighbor]) loadFigure(steps[neighbor]);
+      });
+    });
+  }
+
+  function stepFromHash() {
+    var match = /^#krok-(\\d+)$$/.exec(window.location.hash);
+    return match ? Number(match[1]) : steps[0].number;
+  }
+
+  renderMenu();
+  window.addEventListener('hashchange', function () {
+    show(stepFromHash());
+    window.scrollTo(0, 0);
+  });
+  show(stepFromHash());
+})();
+</script>
+</body>
+</html>
+""")
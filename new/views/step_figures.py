@@ -0,0 +1,92 @@
+"""
+Sestavení figury kroku přes všechny vrstvy cache
+Building a step's figure through the cache layers
+
+Pořadí: LRU cache hotových figur -> (restyle základní figury) ->
+předrenderovaný artefakt -> živé vykreslení. Funkce nečte
+st.session_state, takže ji lze volat i z vláken prefetche.
+"""
+from typing import Any, Dict
+from config.settings import DISPLAY_DEFAULTS
+from steps.base_step import display_settings
+from views.figure_cache import get_figure_cache, make_base_key, make_key
+from views.payload import compact_figure_dict
+from views.prerendered import load_prerendered_figure
+from views.restyle import restyle_figure
+
+
+def chart_config(step_number: int) -> Dict[str, Any]:
+    """
+    Konfigurace Plotly grafu (lišta nástrojů, export PNG se zachováním kamery)
+
+    Args:
+        step_number: Číslo kroku (název staženého obrázku)
+
+    Returns:
+        Config pro st.plotly_chart / Plotly.react
+    """
+    return {
+        'displayModeBar': True,
+        'displaylogo': False,
+        'toImageButtonOptions': {
+            'format': 'png',
+            'filename': f'platonic_solid_step_{step_number}',
+            'height': 800,
+            'width': 800,
+            'scale': 2
+        }
+    }
+
+
+def render_step_figure(step, display: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Vykreslí figuru kroku bez cache hotových figur
+
+    Args:
+        step: Instance kroku
+        display: Nastavení zobrazení
+
+    Returns:
+        Dict figury s kompaktními typed arrays
+    """
+    # Při výchozím nastavení stačí figura předrenderovaná při buildu
+    if display == DISPLAY_DEFAULTS:
+        fig = load_prerendered_figure(step.metadata.number)
+        if fig is not None:
+            return fig
+
+    # Nech krok vykreslit Plotly diagram a předej obyčejný dict
+    # (validuje se až v st.plotly_chart)
+    with display_settings(display):
+        return compact_figure_dict(step.render_plotly_diagram())
+
+
+def get_step_figure(step, display: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Vrátí figuru kroku pro dané nastavení (z cache, nebo ji sestaví)
+
+    U kroků se scénou (step.restylable) se při změně barvy, průhlednosti,
+    tloušťky nebo velikosti jen přepíšou vlastnosti traců cachované
+    základní figury - geometrie se znovu nepočítá.
+
+    Args:
+        step: Instance kroku
+        display: Nastavení zobrazení
+
+    Returns:
+        Dict figury (sdílený z cache - neměnit)
+    """
+    cache = get_figure_cache()
+    number = step.metadata.number
+
+    def build():
+        if not step.restylable:
+            return render_step_figure(step, display)
+        base = cache.get_or_build(
+            make_base_key(number, display),
+            lambda: render_step_figure(step, display),
+            counted=False
+        )
+        return restyle_figure(base, display)
+
+    return cache.get_or_build(make_key(number, display), build)